@@ -0,0 +1,40 @@
+"""
+Benchmark: park/leave cost versus lot capacity
+
+The lot is filled to capacity - 1, then the last free slot is repeatedly
+taken and released. With the SlotAllocator the per-operation cost stays
+flat as capacity grows; the old linear scan grew with capacity.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_allocator
+"""
+from parking_manager.ParkingLot import ParkingLot
+
+from .common import makeVehicles, printTable, timeIt
+
+CAPACITIES = [1_000, 10_000, 100_000]
+REPEAT = 20_000
+
+
+def benchCapacity(capacity):
+    lot = ParkingLot()
+    lot.createParkingLot(capacity, 0, 1)
+    vehicles = makeVehicles(capacity)
+    for vehicle in vehicles[:-1]:
+        lot.park(vehicle)
+
+    last = vehicles[-1]
+
+    def cycle():
+        slot = lot.park(last)
+        lot.leave(slot)
+
+    return timeIt(cycle, REPEAT) * 1e6
+
+
+def main():
+    rows = [(capacity, benchCapacity(capacity)) for capacity in CAPACITIES]
+    printTable(["capacity", "park+leave us"], rows)
+
+
+if __name__ == "__main__":
+    main()
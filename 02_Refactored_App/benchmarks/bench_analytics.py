@@ -0,0 +1,96 @@
+"""
+Benchmark: NumPy occupancy analytics vs. a pure-Python slot scan
+
+For lots of 10k to 1M slots (80% occupied, a tenth of them EV slots),
+times free counts, low-charge EVs, counts by color and counts by type,
+answered by scanning ParkingLot.slots/evSlots in Python and by
+OccupancyAnalytics. Requires NumPy.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_analytics
+"""
+import random
+from collections import Counter
+
+from parking_manager.OccupancyAnalytics import OccupancyAnalytics
+from parking_manager.ParkingLot import ParkingLot
+from parking_manager.Vehicle import ElectricVehicle, VehicleFactory, VehicleType
+
+from .common import COLORS, MAKES, printTable, timeIt
+
+SIZES = [10_000, 100_000, 1_000_000]
+OCCUPANCY = 0.8
+LOW_CHARGE = 20
+
+
+def buildLot(size):
+    """Lot with `size` slots (10% EV), OCCUPANCY full, mixed vehicles"""
+    rng = random.Random(size)
+    evCapacity = size // 10
+    capacity = size - evCapacity
+    lot = ParkingLot()
+    lot.createParkingLot(capacity, evCapacity, 1)
+
+    def vehicles(count, types, prefix):
+        for i in range(count):
+            make, model = MAKES[i % len(MAKES)]
+            yield VehicleFactory.createVehicle(
+                rng.choice(types), f"{prefix}{i:07d}", make, model,
+                rng.choice(COLORS), rng.randrange(101)
+            )
+
+    lot.parkMany(vehicles(int(capacity * OCCUPANCY), [VehicleType.CAR, VehicleType.MOTORCYCLE], "R"))
+    lot.parkMany(vehicles(int(evCapacity * OCCUPANCY),
+                          [VehicleType.ELECTRIC_CAR, VehicleType.ELECTRIC_BIKE], "E"), isElectric=True)
+    return lot
+
+
+# Pure-Python answers, scanning every slot
+def scanFree(lot):
+    return {'regular': sum(1 for vehicle in lot.slots if vehicle is None),
+            'electric': sum(1 for vehicle in lot.evSlots if vehicle is None)}
+
+
+def scanLowCharge(lot):
+    return [i + 1 for i, vehicle in enumerate(lot.evSlots)
+            if isinstance(vehicle, ElectricVehicle) and vehicle.charge < LOW_CHARGE]
+
+
+def scanColors(lot):
+    return Counter(vehicle.color.lower() for slots in (lot.slots, lot.evSlots)
+                   for vehicle in slots if vehicle is not None)
+
+
+def scanTypes(lot):
+    return Counter(vehicle.getType() for slots in (lot.slots, lot.evSlots)
+                   for vehicle in slots if vehicle is not None)
+
+
+def main():
+    rows = []
+    for size in SIZES:
+        lot = buildLot(size)
+        analytics = OccupancyAnalytics(lot)
+
+        # Both sides must agree before their speed is compared
+        assert [slot for _, slot in analytics.lowCharge(LOW_CHARGE)] == scanLowCharge(lot)
+        assert analytics.countsByColor() == dict(scanColors(lot))
+        assert analytics.countsByType() == dict(scanTypes(lot))
+        assert analytics.freeCounts()[1] == scanFree(lot)
+
+        queries = [
+            ("free counts", lambda: scanFree(lot), analytics.freeCounts),
+            ("low charge", lambda: scanLowCharge(lot), lambda: analytics.lowCharge(LOW_CHARGE)),
+            ("by color", lambda: scanColors(lot), analytics.countsByColor),
+            ("by type", lambda: scanTypes(lot), analytics.countsByType),
+        ]
+        for name, scan, vectorized in queries:
+            repeat = max(1, 100_000 // size)
+            scanSeconds = timeIt(scan, repeat)
+            vectorSeconds = timeIt(vectorized, repeat * 10)
+            rows.append((size, name, scanSeconds * 1e3, vectorSeconds * 1e3, scanSeconds / vectorSeconds))
+
+    printTable(["slots", "query", "scan ms", "numpy ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
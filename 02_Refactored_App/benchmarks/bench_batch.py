@@ -0,0 +1,66 @@
+"""
+Benchmark: per-vehicle park/leave versus parkMany/leaveMany
+
+An observer that keeps every message stands in for the GUI log, so the
+per-event notification cost is included.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_batch
+"""
+import time
+
+from parking_manager.ParkingLot import ParkingLot, ParkingObserver
+
+from .common import makeVehicles, printTable
+
+EVENTS = 100_000
+
+
+class CollectingObserver(ParkingObserver):
+    def __init__(self):
+        self.messages = []
+
+    def update(self, message):
+        self.messages.append(str(message))
+
+
+def newLot():
+    lot = ParkingLot()
+    lot.createParkingLot(EVENTS, 0, 1)
+    lot.attachObserver(CollectingObserver())
+    return lot
+
+
+def rate(start):
+    return EVENTS / (time.perf_counter() - start)
+
+
+def main():
+    vehicles = makeVehicles(EVENTS)
+    slotNumbers = list(range(1, EVENTS + 1))
+
+    lot = newLot()
+    start = time.perf_counter()
+    for vehicle in vehicles:
+        lot.park(vehicle)
+    parkRate = rate(start)
+    start = time.perf_counter()
+    for slotNumber in slotNumbers:
+        lot.leave(slotNumber)
+    leaveRate = rate(start)
+
+    lot = newLot()
+    start = time.perf_counter()
+    lot.parkMany(vehicles)
+    parkManyRate = rate(start)
+    start = time.perf_counter()
+    lot.leaveMany(slotNumbers)
+    leaveManyRate = rate(start)
+
+    printTable(
+        ["mode", "park/s", "leave/s"],
+        [("single", parkRate, leaveRate), ("batch", parkManyRate, leaveManyRate)]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: ChargingScheduler rescheduling thousands of EVs every tick
+
+A lot with EV_SLOTS electric bays, all occupied, is charged in 60 s
+ticks under a site budget that powers about a tenth of them at once.
+Each tick a few EVs leave and new ones arrive, so the schedule changes
+continuously. Reports the cost of one tick (schedule + bulk advance +
+write-back) for the list and columnar slot stores.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_charging
+"""
+import random
+import time
+
+from parking_manager.ChargingScheduler import ChargingScheduler
+from parking_manager.ColumnarSlotStore import ColumnarSlotStore
+from parking_manager.ParkingLot import ParkingLot
+from parking_manager.Vehicle import VehicleFactory, VehicleType
+
+from .common import printTable
+
+EV_SLOTS = 5_000
+TICKS = 500
+TICK_SECONDS = 60
+CHURN = 10   # EVs leaving and arriving per tick
+BUDGET_KW = EV_SLOTS * 11.0 / 10
+
+
+def newEv(rng, number):
+    vehicleType = VehicleType.ELECTRIC_CAR if number % 5 else VehicleType.ELECTRIC_BIKE
+    return VehicleFactory.createVehicle(
+        vehicleType, f"EV{number:07d}", "Tesla", "Model 3", "White", rng.randrange(0, 90)
+    )
+
+
+def run(slotStoreFactory):
+    rng = random.Random(7)
+    lot = ParkingLot(slotStoreFactory)
+    lot.createParkingLot(0, EV_SLOTS, 1)
+    lot.parkMany((newEv(rng, i) for i in range(EV_SLOTS)), isElectric=True)
+
+    scheduler = ChargingScheduler(lot, BUDGET_KW)
+    for slotNumber in range(1, EV_SLOTS + 1):
+        scheduler.setDeparture(slotNumber, rng.randrange(1800, 12 * 3600))
+
+    nextNumber = EV_SLOTS
+    tickSeconds = 0.0
+    changed = 0
+    for _ in range(TICKS):
+        leaving = rng.sample(range(1, EV_SLOTS + 1), CHURN)
+        lot.leaveMany(leaving, isElectric=True)
+        for slotNumber in lot.parkMany((newEv(rng, nextNumber + i) for i in range(CHURN)), isElectric=True):
+            scheduler.setDeparture(slotNumber, scheduler.now + rng.randrange(1800, 12 * 3600))
+        nextNumber += CHURN
+
+        start = time.perf_counter()
+        changed += scheduler.advance(TICK_SECONDS)
+        tickSeconds += time.perf_counter() - start
+
+    # Charge reported by the lot must match the scheduler's sessions
+    for slotNumber, session in scheduler.sessions.items():
+        assert lot.evSlots[slotNumber - 1].charge == int(session.charge)
+
+    return tickSeconds / TICKS, changed / TICKS, scheduler.deliveredKw()
+
+
+def main():
+    rows = []
+    for name, factory in (("list", None), ("columnar", ColumnarSlotStore)):
+        perTick, changedPerTick, deliveredKw = run(factory)
+        rows.append((name, perTick * 1e3, changedPerTick, deliveredKw))
+    print(f"{EV_SLOTS} EVs, budget {BUDGET_KW:.0f} kW, {TICKS} ticks of {TICK_SECONDS} s")
+    printTable(["store", "ms/tick", "writes/tick", "kW delivered"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Stress test and throughput benchmark for ConcurrentParkingLot
+
+Several gate threads park and remove their own vehicles concurrently
+(half on regular slots, half on EV slots). Afterwards the lot is checked
+for double-booked slots and index consistency; the script exits with
+code 1 if any invariant is broken. Throughput is compared with a plain
+ParkingLot behind one global lock.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_concurrency
+"""
+import sys
+import threading
+import time
+
+from parking_manager.ConcurrentParkingLot import ConcurrentParkingLot
+from parking_manager.ParkingLot import ParkingLot
+from parking_manager.Vehicle import VehicleType
+
+from .common import makeVehicles, printTable
+
+GATES = 8
+VEHICLES_PER_GATE = 2_000
+ROUNDS = 3
+CAPACITY = GATES * VEHICLES_PER_GATE  # per pool; every gate can fill its share
+
+
+class GlobalLockLot:
+    """Baseline: a plain ParkingLot with every call behind one lock"""
+
+    def __init__(self):
+        self.lot = ParkingLot()
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name):
+        method = getattr(self.lot, name)
+
+        def locked(*args, **kwargs):
+            with self.lock:
+                return method(*args, **kwargs)
+        return locked
+
+
+def gate(lot, vehicles, isElectric, held, heldLock, failures):
+    """Park every vehicle, record the slot, then remove them again"""
+    for _ in range(ROUNDS):
+        slots = []
+        for vehicle in vehicles:
+            slot = lot.park(vehicle, isElectric)
+            if slot is None:
+                failures.append(f"lot full for {vehicle.regNum}")
+                continue
+            with heldLock:
+                key = (slot, isElectric)
+                if key in held:
+                    failures.append(f"slot {key} handed out twice")
+                held.add(key)
+            slots.append(slot)
+
+        for slot in slots:
+            with heldLock:
+                held.discard((slot, isElectric))
+            if not lot.leave(slot, isElectric):
+                failures.append(f"slot {slot} was already empty")
+
+
+def run(lot):
+    lot.createParkingLot(CAPACITY, CAPACITY, 1)
+    held, heldLock, failures = set(), threading.Lock(), []
+
+    threads = []
+    for gateNumber in range(GATES):
+        isElectric = gateNumber % 2 == 1
+        vehicleType = VehicleType.ELECTRIC_CAR if isElectric else VehicleType.CAR
+        vehicles = makeVehicles(VEHICLES_PER_GATE, vehicleType, prefix=f"G{gateNumber}-")
+        threads.append(threading.Thread(
+            target=gate, args=(lot, vehicles, isElectric, held, heldLock, failures)
+        ))
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    operations = GATES * VEHICLES_PER_GATE * ROUNDS * 2
+    return operations / elapsed, failures
+
+
+def checkEmpty(lot):
+    """After every gate removed its vehicles the lot must be empty"""
+    problems = []
+    if lot.numOfOccupiedSlots or lot.numOfOccupiedEvSlots:
+        problems.append("occupancy counters not zero")
+    if lot.regNumIndex:
+        problems.append("registration index not empty")
+    if any(vehicle is not None for vehicle in lot.slots) or \
+            any(vehicle is not None for vehicle in lot.evSlots):
+        problems.append("slots not empty")
+    if len(lot.freeSlots) != CAPACITY or len(lot.freeEvSlots) != CAPACITY:
+        problems.append("free slot allocators lost slots")
+    return problems
+
+
+def main():
+    concurrentLot = ConcurrentParkingLot()
+    concurrentRate, failures = run(concurrentLot)
+    failures += checkEmpty(concurrentLot)
+
+    globalRate, _ = run(GlobalLockLot())
+
+    printTable(["lot", "ops/s"], [("global lock", globalRate), ("fine-grained", concurrentRate)])
+
+    if failures:
+        print(f"FAIL: {len(failures)} problems, e.g. {failures[:3]}")
+        return 1
+    print("OK: no double-booked slots, indexes consistent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Benchmark: gate-side park() latency with a slow observer, sync vs async
+
+The slow observer sleeps briefly per event, standing in for a growing
+GUI text widget or an audit log writing to disk.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_dispatch
+"""
+import time
+
+from parking_manager.AsyncDispatcher import AsyncObserverDispatcher
+from parking_manager.ParkingLot import ParkingLot, ParkingObserver
+
+from .common import makeVehicles, printTable
+
+EVENTS = 20_000
+OBSERVER_DELAY = 0.0001
+
+
+class SlowObserver(ParkingObserver):
+    def update(self, event):
+        str(event)
+        time.sleep(OBSERVER_DELAY)
+
+
+def run(observer, vehicles):
+    lot = ParkingLot()
+    lot.createParkingLot(EVENTS, 0, 1)
+    lot.attachObserver(observer)
+    start = time.perf_counter()
+    for vehicle in vehicles:
+        lot.park(vehicle)
+    return (time.perf_counter() - start) / EVENTS * 1e6
+
+
+def main():
+    vehicles = makeVehicles(EVENTS)
+    rows = [("sync", run(SlowObserver(), vehicles), "-", "-")]
+
+    for policy in AsyncObserverDispatcher.POLICIES:
+        dispatcher = AsyncObserverDispatcher([SlowObserver()], maxSize=1000, policy=policy)
+        parkMicros = run(dispatcher, vehicles)
+        dispatcher.close()
+        stats = dispatcher.getStats()
+        rows.append((policy, parkMicros, stats['dropped'], stats['coalesced']))
+
+    printTable(["mode", "park us", "dropped", "coalesced"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark and guard: import time of the non-GUI layer
+
+Imports the core modules in fresh interpreters and fails (exit code 1)
+if tkinter gets imported or the median import time exceeds the budget.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_import
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "parking_manager.ParkingLot",
+    "parking_manager.Vehicle",
+    "parking_manager.ParkingManager",
+    "parking_manager.CommandLine",
+]
+RUNS = 10
+BUDGET_MS = 50.0
+
+PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    f"for name in {MODULES!r}: __import__(name)\n"
+    "elapsed = (time.perf_counter() - start) * 1000\n"
+    "print(elapsed, 'tkinter' in sys.modules)\n"
+)
+
+
+def measure():
+    appDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=appDir,
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), output[1] == "True"
+
+
+def main():
+    results = [measure() for _ in range(RUNS)]
+    median = statistics.median(ms for ms, _ in results)
+    tkinterLoaded = any(loaded for _, loaded in results)
+
+    print(f"median import time: {median:.2f} ms (budget {BUDGET_MS:.0f} ms)")
+    print(f"tkinter imported: {tkinterLoaded}")
+
+    if tkinterLoaded or median > BUDGET_MS:
+        print("FAIL")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Benchmark: EventJournal throughput per fsync policy, and recovery time
+
+Parks and removes vehicles on a one-level Facility with a journal
+attached, once per fsync policy ('always' fsyncs every event, 'batch'
+group-commits, 'never' leaves flushing to the OS). Then measures how
+long recovery takes from a long journal versus snapshot + short tail.
+
+fsync cost depends on the disk: pass --dir to run on the disk the
+application will use (the default is the system temp directory, which
+may be a RAM disk).
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_journal
+"""
+import argparse
+import shutil
+import tempfile
+import time
+
+from parking_manager.EventJournal import EventJournal
+from parking_manager.Facility import Facility
+
+from .common import makeVehicles, printTable
+
+VEHICLES = 5_000
+
+
+def journaledFacility(directory, **options):
+    facility = Facility()
+    journal = EventJournal(directory, **options)
+    journal.recover(facility)
+    facility.createLevel(VEHICLES, 0, 1)
+    return facility, journal
+
+
+def parkAndLeave(facility, vehicles):
+    lot = facility.getLevel(1)
+    for vehicle in vehicles:
+        lot.park(vehicle)
+    for slotNumber in range(1, len(vehicles) + 1):
+        lot.leave(slotNumber)
+
+
+def policyRate(baseDir, vehicles, fsync):
+    directory = tempfile.mkdtemp(dir=baseDir)
+    try:
+        facility, journal = journaledFacility(directory, fsync=fsync, snapshotEvery=0)
+        start = time.perf_counter()
+        parkAndLeave(facility, vehicles)
+        journal.close()
+        return 2 * len(vehicles) / (time.perf_counter() - start)
+    finally:
+        shutil.rmtree(directory)
+
+
+def recoveryTime(baseDir, vehicles, snapshotEvery):
+    """Write a history, then time recovering it into a fresh facility"""
+    directory = tempfile.mkdtemp(dir=baseDir)
+    try:
+        facility, journal = journaledFacility(directory, fsync='never', snapshotEvery=snapshotEvery)
+        for _ in range(4):
+            parkAndLeave(facility, vehicles)
+        lot = facility.getLevel(1)
+        for vehicle in vehicles:
+            lot.park(vehicle)
+        journal.close()
+
+        start = time.perf_counter()
+        replayed = EventJournal(directory).recover(Facility())
+        return time.perf_counter() - start, replayed
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EventJournal fsync policy benchmark")
+    parser.add_argument('--dir', help="directory on the disk to test (default: temp dir)")
+    args = parser.parse_args()
+
+    vehicles = makeVehicles(VEHICLES)
+
+    rows = [(fsync, policyRate(args.dir, vehicles, fsync)) for fsync in EventJournal.FSYNC_POLICIES]
+    printTable(["fsync", "events/s"], rows)
+    print()
+
+    rows = []
+    for label, snapshotEvery in (("journal only", 0), ("snapshot+tail", 2_000)):
+        seconds, replayed = recoveryTime(args.dir, vehicles, snapshotEvery)
+        rows.append((label, replayed, seconds * 1e3))
+    printTable(["recovery", "records", "ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
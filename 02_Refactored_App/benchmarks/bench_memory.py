@@ -0,0 +1,68 @@
+"""
+Benchmark: memory of a full lot, list of vehicle objects vs columnar store
+
+Vehicles are created one at a time and only the lot keeps them, so the
+traced memory is what the lot itself holds (slot store plus indexes).
+The indexes (regNum dictionary and attribute sets) are the larger part
+and cost the same for both stores, so the columnar store shrinks the
+store column far more than the lot column.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_memory
+"""
+import tracemalloc
+
+from parking_manager.ColumnarSlotStore import ColumnarSlotStore
+from parking_manager.ParkingLot import ParkingLot
+from parking_manager.Vehicle import VehicleFactory, VehicleType
+
+from .common import COLORS, MAKES, printTable
+
+CAPACITY = 100_000
+
+
+def makeVehicle(i):
+    make, model = MAKES[i % len(MAKES)]
+    return VehicleFactory.createVehicle(
+        VehicleType.CAR, f"REG{i:07d}", make, model, COLORS[i % len(COLORS)]
+    )
+
+
+def measureLot(slotStoreFactory):
+    """Traced bytes held by a full lot (slot store plus indexes)"""
+    tracemalloc.start()
+    lot = ParkingLot(slotStoreFactory)
+    lot.createParkingLot(CAPACITY, 0, 1)
+    for i in range(CAPACITY):
+        lot.park(makeVehicle(i))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def measureStore(newStore):
+    """Traced bytes held by a full slot store on its own"""
+    tracemalloc.start()
+    store = newStore(CAPACITY)
+    for i in range(CAPACITY):
+        store[i] = makeVehicle(i)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main():
+    modes = [
+        ("list", None, lambda capacity: [None] * capacity),
+        ("columnar", ColumnarSlotStore, ColumnarSlotStore),
+    ]
+    rows = []
+    for name, slotStoreFactory, newStore in modes:
+        storeSize = measureStore(newStore)
+        lotSize = measureLot(slotStoreFactory)
+        rows.append((name, storeSize / CAPACITY, (lotSize - storeSize) / CAPACITY,
+                     lotSize / CAPACITY, lotSize / 2**20))
+    printTable(["store", "store B/slot", "indexes B/slot", "lot B/slot", "lot MiB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark: memory-mapped slot store for very large lots
+
+For a lot with CAPACITY slots, 90% occupied, compares the plain list,
+ColumnarSlotStore and MmapSlotStore on
+- Python heap held by the full store (tracemalloc; mmap pages live in
+  the page cache instead)
+- full status scan (ParkingLot.getStatus)
+- startup: re-parking every vehicle vs. reopening the slot file, both
+  with and without rebuilding the lot's indexes (adoptSlotStores)
+- a second process opening the file read-only and counting vehicles
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_mmap
+"""
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from parking_manager.ColumnarSlotStore import ColumnarSlotStore
+from parking_manager.MmapSlotStore import MmapSlotStore
+from parking_manager.ParkingLot import ParkingLot
+
+from .bench_memory import makeVehicle
+from .common import printTable
+
+CAPACITY = 500_000
+OCCUPIED = CAPACITY * 9 // 10
+
+READER = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "from parking_manager.MmapSlotStore import MmapSlotStore\n"
+    "store = MmapSlotStore(sys.argv[1], readOnly=True)\n"
+    "print(store.occupiedCount(), time.perf_counter() - start)\n"
+)
+
+
+def elapsed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def fillStore(store):
+    for i in range(OCCUPIED):
+        store[i] = makeVehicle(i)
+    return store
+
+
+def storeHeap(newStore):
+    """Traced bytes held by a 90% full store"""
+    tracemalloc.start()
+    store = fillStore(newStore())
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MmapSlotStore benchmark")
+    parser.add_argument('--dir', help="directory for the slot files (default: temp dir)")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(dir=args.dir)
+    try:
+        newMmap = MmapSlotStore.factory(directory, 'bench')
+        stores = [
+            ("list", lambda: [None] * CAPACITY),
+            ("columnar", lambda: ColumnarSlotStore(CAPACITY)),
+            ("mmap", lambda: newMmap(CAPACITY, False)),
+        ]
+
+        rows = []
+        for name, newStore in stores:
+            heap, store = storeHeap(newStore)
+            lot = ParkingLot()
+            lot.adoptSlotStores(store, [], 1)
+            scan, _ = elapsed(lot.getStatus)
+            rows.append((name, heap / 2**20, scan * 1e3))
+            if name == "mmap":
+                store.flush()
+        printTable(["store", "heap MiB", "status ms"], rows)
+        print()
+
+        path = MmapSlotStore.pathFor(directory, 'bench', False)
+        vehicles = [makeVehicle(i) for i in range(OCCUPIED)]
+
+        def repark():
+            lot = ParkingLot()
+            lot.createParkingLot(CAPACITY, 0, 1)
+            lot.parkMany(vehicles)
+
+        def adopt():
+            lot = ParkingLot()
+            lot.adoptSlotStores(MmapSlotStore(path), [], 1)
+
+        rows = [
+            ("re-park all", elapsed(repark)[0] * 1e3),
+            ("mmap + indexes", elapsed(adopt)[0] * 1e3),
+            ("mmap open only", elapsed(lambda: MmapSlotStore(path).occupiedCount())[0] * 1e3),
+        ]
+        printTable(["startup", "ms"], rows)
+        print()
+
+        output = subprocess.run(
+            [sys.executable, "-c", READER, path], capture_output=True, text=True, check=True
+        ).stdout.split()
+        print(f"reader process: {output[0]} vehicles, opened and counted in "
+              f"{float(output[1]) * 1e3:.1f} ms")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
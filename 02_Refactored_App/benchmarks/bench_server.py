@@ -0,0 +1,107 @@
+"""
+Load generator for the JSON-lines ParkingServer
+
+Opens several connections, each keeping up to --window requests in
+flight (pipelining), and reports requests/sec and p50/p99 latency. By
+default an in-process server is started on a free port; pass --port to
+load an already running server.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_server
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from parking_manager.ParkingServer import ParkingServer
+
+
+def percentile(sortedValues, fraction):
+    index = min(int(len(sortedValues) * fraction), len(sortedValues) - 1)
+    return sortedValues[index]
+
+
+def requestsFor(client, count):
+    """Park vehicles owned by one client and look each one up"""
+    requests = []
+    for i in range(count // 2):
+        regNum = f"C{client}-{i}"
+        requests.append({'op': 'park', 'regNum': regNum, 'make': 'Toyota',
+                         'model': 'Corolla', 'color': 'Red'})
+        requests.append({'op': 'find-reg', 'regNum': regNum})
+    return requests
+
+
+async def runClient(host, port, client, count, window, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    requests = requestsFor(client, count)
+    sentAt = {}
+    nextToSend = 0
+    received = 0
+
+    while received < len(requests):
+        # Keep the pipeline full, then flush everything in one write
+        batch = []
+        while nextToSend < len(requests) and nextToSend - received < window:
+            request = dict(requests[nextToSend], id=nextToSend)
+            sentAt[nextToSend] = time.perf_counter()
+            batch.append(json.dumps(request) + "\n")
+            nextToSend += 1
+        if batch:
+            writer.write("".join(batch).encode())
+            await writer.drain()
+
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - sentAt.pop(response['id']))
+        received += 1
+
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(args):
+    server = None
+    host, port = args.host, args.port
+    if port is None:
+        server = ParkingServer()
+        await server.start(host, 0)
+        port = server.server.sockets[0].getsockname()[1]
+
+    # Fresh lot sized for every client's vehicles
+    reader, writer = await asyncio.open_connection(host, port)
+    capacity = args.clients * args.requests
+    writer.write((json.dumps({'id': 0, 'op': 'create', 'capacity': capacity,
+                              'evCapacity': 0, 'level': 1}) + "\n").encode())
+    await reader.readline()
+    writer.close()
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        runClient(host, port, client, args.requests, args.window, latencies)
+        for client in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        await server.close()
+
+    latencies.sort()
+    print(f"requests: {len(latencies)}  clients: {args.clients}  window: {args.window}")
+    print(f"throughput: {len(latencies) / elapsed:,.0f} req/s")
+    print(f"latency p50: {percentile(latencies, 0.50) * 1e3:.3f} ms  "
+          f"p99: {percentile(latencies, 0.99) * 1e3:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help="existing server (default: start one)")
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=30_000, help="per client")
+    parser.add_argument('--window', type=int, default=64, help="requests in flight per client")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
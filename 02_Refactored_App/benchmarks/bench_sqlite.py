@@ -0,0 +1,75 @@
+"""
+Benchmark: SqliteParkingLot versus the in-memory ParkingLot
+
+Times park (one by one and as parkMany bursts), findByRegNum,
+findByColor, getStatus and leave on both. The SQLite lot writes to a
+WAL-mode database file in a temporary directory (pass --dir to use the
+application's disk).
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_sqlite
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from parking_manager.ParkingLot import ParkingLot
+from parking_manager.SqliteParkingLot import SqliteParkingLot
+
+from .common import makeVehicles, printTable
+
+VEHICLES = 20_000
+BURST = 500
+LOOKUPS = 5_000
+
+
+def perSecond(count, func):
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+
+def measure(newLot, vehicles):
+    """Operations per second for each lot operation"""
+    results = {}
+
+    lot = newLot()
+    lot.createParkingLot(VEHICLES, 0, 1)
+    results['park'] = perSecond(len(vehicles), lambda: [lot.park(vehicle) for vehicle in vehicles])
+
+    regNums = [vehicle.regNum for vehicle in vehicles[:LOOKUPS]]
+    results['findByRegNum'] = perSecond(LOOKUPS, lambda: [lot.findByRegNum(regNum) for regNum in regNums])
+    results['findByColor'] = perSecond(10, lambda: [lot.findByColor("red") for _ in range(10)])
+    results['getStatus'] = perSecond(10, lambda: [lot.getStatus() for _ in range(10)])
+    results['leave'] = perSecond(
+        len(vehicles), lambda: [lot.leave(slotNumber) for slotNumber in range(1, len(vehicles) + 1)]
+    )
+
+    lot.createParkingLot(VEHICLES, 0, 1)
+    bursts = [vehicles[i:i + BURST] for i in range(0, len(vehicles), BURST)]
+    results['parkMany'] = perSecond(len(vehicles), lambda: [lot.parkMany(burst) for burst in bursts])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SqliteParkingLot benchmark")
+    parser.add_argument('--dir', help="directory for the database file (default: temp dir)")
+    args = parser.parse_args()
+
+    vehicles = makeVehicles(VEHICLES)
+    directory = tempfile.mkdtemp(dir=args.dir)
+    try:
+        memory = measure(ParkingLot, vehicles)
+        sqlite = measure(lambda: SqliteParkingLot(os.path.join(directory, "parking.db")), vehicles)
+    finally:
+        shutil.rmtree(directory)
+
+    printTable(
+        ["operation", "memory ops/s", "sqlite ops/s"],
+        [(name, memory[name], sqlite[name]) for name in memory]
+    )
+
+
+if __name__ == "__main__":
+    main()
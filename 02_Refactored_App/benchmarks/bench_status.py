@@ -0,0 +1,48 @@
+"""
+Benchmark: polling full getStatus() versus getStatusChanges()
+
+A nearly full lot sees a few park/leave events between polls, as a
+dashboard would.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_status
+"""
+from parking_manager.ParkingLot import ParkingLot
+
+from .common import makeVehicles, printTable, timeIt
+
+CAPACITIES = [1_000, 10_000, 100_000]
+CHANGES_PER_POLL = 10
+
+
+def benchCapacity(capacity):
+    lot = ParkingLot()
+    lot.createParkingLot(capacity, 0, 1)
+    vehicles = makeVehicles(capacity)
+    lot.parkMany(vehicles[:-CHANGES_PER_POLL])
+    churn = vehicles[-CHANGES_PER_POLL:]
+
+    def changeSome():
+        slots = lot.parkMany(churn)
+        lot.leaveMany(slots)
+
+    def fullPoll():
+        changeSome()
+        lot.getStatus()
+
+    version = [lot.getStatusSnapshot()[0]]
+
+    def deltaPoll():
+        changeSome()
+        version[0], _ = lot.getStatusChanges(version[0])
+
+    repeat = max(10, 100_000 // capacity)
+    return timeIt(fullPoll, repeat) * 1e3, timeIt(deltaPoll, repeat) * 1e3
+
+
+def main():
+    rows = [(capacity,) + benchCapacity(capacity) for capacity in CAPACITIES]
+    printTable(["capacity", "full poll ms", "delta poll ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Benchmark suite: every ParkingLot hot path, with a stored baseline
+
+Times createParkingLot, park, leave, findByRegNum, findByColor,
+getStatus and VehicleFactory.createVehicle for lots of 100 to 1M slots
+that are empty, half full and 99% full. Each case is run ROUNDS times
+and the fastest round is kept (least disturbed by the rest of the
+machine), as nanoseconds per call.
+
+    python -m benchmarks.bench_suite                  run and print
+    python -m benchmarks.bench_suite --save           store as the baseline
+    python -m benchmarks.bench_suite --check          fail (exit 1) on regressions
+
+The baseline is a JSON file (benchmarks/baseline.json by default). It
+also stores the time of a fixed calibration workload, and ratios are
+scaled by how fast the machine runs that workload now, so a busy or
+different machine is not reported as a regression; a slow case is
+re-measured RECHECKS times before --check fails.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_suite [--sizes 100,1000]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from parking_manager.ParkingLot import ParkingLot
+from parking_manager.Vehicle import VehicleFactory, VehicleType
+
+from .common import makeVehicles
+
+SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+OCCUPANCIES = {'empty': 0.0, 'half': 0.5, 'full99': 0.99}
+ROUNDS = 5
+BATCH = 1_000            # park/leave/find calls per round
+WHOLE_LOT_CALLS = 10_000 # slots touched per round by whole-lot operations
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+TOLERANCE = 0.25
+RECHECKS = 2             # re-measurements of a slow case before --check fails
+
+
+def caseName(operation, size=None, occupancy=None):
+    return operation if size is None else f"{operation}[{size},{occupancy}]"
+
+
+def fastest(roundFunc):
+    """Best nanoseconds per call over ROUNDS rounds; roundFunc returns (seconds, calls)"""
+    roundFunc()   # warm-up
+    best = None
+    for _ in range(ROUNDS):
+        seconds, calls = roundFunc()
+        perCall = seconds / calls * 1e9
+        best = perCall if best is None else min(best, perCall)
+    return best
+
+
+def timeCalls(func, calls):
+    """Run func `calls` times, returning (seconds, calls) for fastest()"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return time.perf_counter() - start, calls
+
+
+class LotCases:
+    """The per-operation rounds for one lot size and occupancy"""
+
+    def __init__(self, size, fraction):
+        self.size = size
+        self.lot = ParkingLot()
+        self.lot.createParkingLot(size, 0, 1)
+        self.occupied = int(size * fraction)
+        self.parked = makeVehicles(self.occupied)
+        self.lot.parkMany(self.parked)   # fills slots 1..occupied
+        self.batch = max(1, min(BATCH, size - self.occupied))
+        self.newcomers = makeVehicles(self.batch, prefix="NEW")
+        self.wholeLotCalls = max(1, WHOLE_LOT_CALLS // size)
+
+    def park(self):
+        lot = self.lot
+        start = time.perf_counter()
+        slotNumbers = [lot.park(vehicle) for vehicle in self.newcomers]
+        seconds = time.perf_counter() - start
+        lot.leaveMany(slotNumbers)
+        return seconds, len(slotNumbers)
+
+    def leave(self):
+        lot = self.lot
+        if self.occupied:
+            # Spread over the occupied slots, then put the vehicles back
+            step = max(1, self.occupied // BATCH)
+            slotNumbers = list(range(1, self.occupied + 1, step))[:BATCH]
+            vehicles = [lot.slots[slotNumber - 1] for slotNumber in slotNumbers]
+        else:
+            vehicles = self.newcomers
+            slotNumbers = lot.parkMany(vehicles)
+
+        start = time.perf_counter()
+        for slotNumber in slotNumbers:
+            lot.leave(slotNumber)
+        seconds = time.perf_counter() - start
+
+        if self.occupied:
+            for vehicle, slotNumber in zip(vehicles, slotNumbers):
+                lot.parkAt(vehicle, slotNumber)
+        return seconds, len(slotNumbers)
+
+    def findByRegNum(self):
+        lot = self.lot
+        if self.parked:
+            step = max(1, len(self.parked) // BATCH)
+            regNums = [vehicle.regNum for vehicle in self.parked[::step][:BATCH]]
+        else:
+            regNums = [vehicle.regNum for vehicle in self.newcomers]   # all misses
+        start = time.perf_counter()
+        for regNum in regNums:
+            lot.findByRegNum(regNum)
+        return time.perf_counter() - start, len(regNums)
+
+    def findByColor(self):
+        return timeCalls(lambda: self.lot.findByColor("Red"), self.wholeLotCalls)
+
+    def getStatus(self):
+        return timeCalls(self.lot.getStatus, self.wholeLotCalls)
+
+    OPERATIONS = ('park', 'leave', 'findByRegNum', 'findByColor', 'getStatus')
+
+
+def createParkingLotRound(size):
+    calls = max(1, WHOLE_LOT_CALLS // size)
+    lots = [ParkingLot() for _ in range(calls)]
+    start = time.perf_counter()
+    for lot in lots:
+        lot.createParkingLot(size, 0, 1)
+    return time.perf_counter() - start, calls
+
+
+def createVehicleRound():
+    calls = BATCH * 10
+    createVehicle = VehicleFactory.createVehicle
+    start = time.perf_counter()
+    for _ in range(calls):
+        createVehicle(VehicleType.CAR, "REG0000001", "Toyota", "Corolla", "Red")
+    return time.perf_counter() - start, calls
+
+
+class CalibrationRecord:
+    __slots__ = ('number', 'name')
+
+    def __init__(self, number, name):
+        self.number = number
+        self.name = name
+
+
+def calibrationRound():
+    """Fixed pure-Python workload measuring the speed of the machine right now"""
+    calls = BATCH * 100
+    table = {}
+    start = time.perf_counter()
+    for i in range(calls):
+        # Attribute access, allocation and dict updates, like the lot's hot paths
+        record = CalibrationRecord(i, str(i))
+        table[record.name] = record
+        if len(table) > 1024:
+            table.pop(str(i - 1024))
+    return time.perf_counter() - start, calls
+
+
+def runSuite(sizes, only=None):
+    """
+    Dictionary of case name -> nanoseconds per call
+
+    Args:
+        sizes: Lot sizes to run
+        only: Optional set of case names; other cases are skipped
+    """
+    def wanted(name):
+        return only is None or name in only
+
+    results = {}
+    if wanted(caseName('createVehicle')):
+        results[caseName('createVehicle')] = fastest(createVehicleRound)
+    for size in sizes:
+        name = caseName('createParkingLot', size, 'empty')
+        if wanted(name):
+            results[name] = fastest(lambda: createParkingLotRound(size))
+        for occupancy, fraction in OCCUPANCIES.items():
+            names = {operation: caseName(operation, size, occupancy) for operation in LotCases.OPERATIONS}
+            if not any(wanted(name) for name in names.values()):
+                continue
+            cases = LotCases(size, fraction)
+            for operation, name in names.items():
+                if wanted(name):
+                    results[name] = fastest(getattr(cases, operation))
+            del cases
+    return results
+
+
+def loadBaseline(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def saveBaseline(path, results, calibration):
+    document = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'unit': 'ns per call',
+        'calibration': round(calibration, 1),
+        'cases': {name: round(nanoseconds, 1) for name, nanoseconds in results.items()},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(results, baseline, tolerance, speed=1.0):
+    """
+    Rows of (case, baseline ns, current ns, ratio, flag) and whether any case regressed
+
+    `speed` is how much slower the machine currently runs the calibration
+    workload than when the baseline was saved; ratios are divided by it so
+    a busy or slower machine does not look like a regression.
+    """
+    rows = []
+    regressed = False
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            rows.append((name, "-", current, "-", "new"))
+            continue
+        ratio = current / previous / speed
+        slower = ratio > 1 + tolerance
+        regressed = regressed or slower
+        rows.append((name, previous, current, ratio, "SLOWER" if slower else ""))
+    return rows, regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ParkingLot hot path benchmark suite")
+    parser.add_argument('--sizes', default=",".join(str(size) for size in SIZES),
+                        help="comma separated lot sizes")
+    parser.add_argument('--baseline', default=BASELINE, help="baseline JSON file")
+    parser.add_argument('--save', action='store_true', help="write the results as the baseline")
+    parser.add_argument('--check', action='store_true',
+                        help="exit with status 1 when a case is slower than the baseline")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help="allowed slowdown before --check fails (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    calibration = fastest(calibrationRound)
+    results = runSuite(sizes)
+    calibration = min(calibration, fastest(calibrationRound))
+    baseline = {}
+    speed = 1.0
+    if os.path.exists(args.baseline):
+        document = loadBaseline(args.baseline)
+        baseline = document['cases']
+        speed = calibration / document['calibration']
+    elif args.check:
+        sys.exit(f"No baseline at {args.baseline}; run with --save first")
+
+    rows, regressed = compare(results, baseline, args.tolerance, speed)
+    for _ in range(RECHECKS if args.check else 0):
+        if not regressed:
+            break
+        # A loaded machine slows single runs down; only a repeatable slowdown fails
+        slow = {row[0] for row in rows if row[4] == "SLOWER"}
+        for name, nanoseconds in runSuite(sizes, slow).items():
+            results[name] = min(results[name], nanoseconds)
+        calibration = min(calibration, fastest(calibrationRound))
+        speed = calibration / document['calibration']
+        rows, regressed = compare(results, baseline, args.tolerance, speed)
+
+    print(f"Machine speed vs baseline: {speed:.2f}x time (ratios are normalized)")
+    print(f"{'case':<36}{'baseline ns':>14}{'ns/call':>14}{'ratio':>8}")
+    for name, previous, current, ratio, flag in rows:
+        previous = previous if isinstance(previous, str) else f"{previous:.1f}"
+        ratio = ratio if isinstance(ratio, str) else f"{ratio:.2f}"
+        print(f"{name:<36}{previous:>14}{current:>14.1f}{ratio:>8}  {flag}")
+
+    if args.save:
+        saveBaseline(args.baseline, results, calibration)
+        print(f"Baseline saved to {args.baseline}")
+    if args.check and regressed:
+        print(f"Regression: at least one case is more than {args.tolerance:.0%} slower")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
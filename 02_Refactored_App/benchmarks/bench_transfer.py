@@ -0,0 +1,107 @@
+"""
+Benchmark: streaming bulk import/export (CSV and JSON lines)
+
+Writes ROWS-record files, imports them into a lot large enough for all
+of them (rows/s), and exports the lot again. Then imports the files into
+a small lot (almost every record turned away) under tracemalloc, with
+a tenth and all of the rows: a streaming import keeps the same peak
+memory however long the file is.
+
+Run from 02_Refactored_App:  python -m benchmarks.bench_transfer
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from parking_manager import BulkTransfer
+from parking_manager.ParkingLot import ParkingLot
+
+from .common import COLORS, MAKES, printTable
+
+ROWS = 1_000_000
+SMALL_LOT = 1_000
+
+
+def writeSource(path, fileFormat, rows):
+    """Stream `rows` generated vehicles into a file"""
+    with open(path, 'w', newline='', encoding='utf-8') as stream:
+        if fileFormat == 'csv':
+            stream.write("regNum,make,model,color,type,charge\n")
+        for i in range(rows):
+            make, model = MAKES[i % len(MAKES)]
+            color = COLORS[i % len(COLORS)]
+            electric = i % 10 == 0
+            vehicleType = "Electric Car" if electric else "Car"
+            charge = i % 101 if electric else 0
+            if fileFormat == 'csv':
+                stream.write(f"R{i:07d},{make},{model},{color},{vehicleType},{charge}\n")
+            else:
+                stream.write(
+                    f'{{"regNum":"R{i:07d}","make":"{make}","model":"{model}",'
+                    f'"color":"{color}","type":"{vehicleType}","charge":{charge}}}\n'
+                )
+
+
+def timedImport(path, capacity, evCapacity):
+    lot = ParkingLot()
+    lot.createParkingLot(capacity, evCapacity, 1)
+    start = time.perf_counter()
+    report = BulkTransfer.importFile(lot, path)
+    return lot, report, time.perf_counter() - start
+
+
+def peakImportMemory(path):
+    """Peak traced bytes importing a file into a small lot"""
+    lot = ParkingLot()
+    lot.createParkingLot(SMALL_LOT, SMALL_LOT, 1)
+    tracemalloc.start()
+    BulkTransfer.importFile(lot, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import/export benchmark")
+    parser.add_argument('--rows', type=int, default=ROWS)
+    parser.add_argument('--dir', help="directory for the files (default: temp dir)")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(dir=args.dir)
+    try:
+        speedRows = []
+        memoryRows = []
+        for fileFormat in BulkTransfer.FORMATS:
+            path = os.path.join(directory, f"vehicles.{fileFormat}")
+            writeSource(path, fileFormat, args.rows)
+
+            lot, report, seconds = timedImport(path, args.rows, args.rows // 10)
+            assert report.parked == args.rows, report
+
+            exportPath = os.path.join(directory, f"export.{fileFormat}")
+            start = time.perf_counter()
+            BulkTransfer.exportFile(lot, exportPath)
+            exportSeconds = time.perf_counter() - start
+            speedRows.append((fileFormat, args.rows / seconds, args.rows / exportSeconds))
+            del lot
+
+            shortPath = os.path.join(directory, f"short.{fileFormat}")
+            writeSource(shortPath, fileFormat, args.rows // 10)
+            memoryRows.append((
+                fileFormat,
+                peakImportMemory(shortPath) / 2**20,
+                peakImportMemory(path) / 2**20,
+            ))
+
+        printTable(["format", "import rows/s", "export rows/s"], speedRows)
+        print()
+        printTable(["format", "peak MiB 1/10", "peak MiB all"], memoryRows)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
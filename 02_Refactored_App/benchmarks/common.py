@@ -0,0 +1,33 @@
+"""Shared helpers for the benchmark scripts"""
+import time
+
+from parking_manager.Vehicle import VehicleFactory, VehicleType
+
+COLORS = ["Red", "Blue", "White", "Black", "Silver", "Green"]
+MAKES = [("Toyota", "Corolla"), ("Honda", "Civic"), ("Tesla", "Model 3"), ("Ford", "Focus")]
+
+
+def makeVehicles(count, vehicleType=VehicleType.CAR, prefix="REG"):
+    """Build `count` vehicles with unique registration numbers"""
+    vehicles = []
+    for i in range(count):
+        make, model = MAKES[i % len(MAKES)]
+        vehicles.append(VehicleFactory.createVehicle(
+            vehicleType, f"{prefix}{i:07d}", make, model, COLORS[i % len(COLORS)]
+        ))
+    return vehicles
+
+
+def timeIt(func, repeat):
+    """Run func `repeat` times and return mean seconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def printTable(headers, rows):
+    """Print a simple fixed-width results table"""
+    print("".join(f"{h:>16}" for h in headers))
+    for row in rows:
+        print("".join(f"{v:>16.3f}" if isinstance(v, float) else f"{v:>16}" for v in row))
@@ -1,12 +1,24 @@
-from parking_manager import ParkingManager
-import tkinter as tk
+import argparse
+
+from parking_manager import ParkingManager, Profiling
 
 # Main Entry Point
-def main():
+def main(argv=None):
     """Application entry point: Creates single instance, no globals"""
-    root = tk.Tk()
-    app = ParkingManager.ParkingManagerGUI(root)
-    root.mainloop()
+    parser = argparse.ArgumentParser(description="Parking Lot Manager")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="profile the GUI and lot into PATH (collapsed stacks) "
+                             f"at exit; {Profiling.ENV_VAR} does the same")
+    parser.add_argument('--profile-mode', choices=Profiling.MODES,
+                        help="sampling (default) or cprofile (writes PATH.<category>.pstats "
+                             "for gui and lot)")
+    args = parser.parse_args(argv)
+
+    # Does nothing without --profile or PARKING_PROFILE
+    Profiling.installFromArguments(args.profile, args.profile_mode, gui=True)
+
+    # tkinter is imported only here, when the GUI is actually launched
+    ParkingManager.launch()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,201 @@
+import threading
+import time
+from collections import deque
+
+from .ParkingLot import ParkingObserver
+from .ParkingEvents import EventBatch
+
+class ObserverStats:
+    """Delivery latency and error counts for one observer"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.totalSeconds = 0.0
+        self.maxSeconds = 0.0
+        self.lastError = None
+
+    @property
+    def meanSeconds(self):
+        return self.totalSeconds / self.count if self.count else 0.0
+
+    def record(self, seconds):
+        self.count += 1
+        self.totalSeconds += seconds
+        if seconds > self.maxSeconds:
+            self.maxSeconds = seconds
+
+    def asDict(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'meanSeconds': self.meanSeconds,
+            'maxSeconds': self.maxSeconds,
+        }
+
+class AsyncObserverDispatcher(ParkingObserver):
+    """
+    Observer that hands events to other observers on a worker thread
+
+    Attach it to a ParkingLot in place of slow observers: park() and
+    leave() only pay for a queue append, and the worker thread calls the
+    wrapped observers. The queue is bounded; when it is full the policy
+    decides what happens:
+
+        'block'       - the lot waits until the worker catches up
+        'drop-oldest' - the oldest queued event is discarded
+        'coalesce'    - the new event is merged into the newest queued
+                        one as an EventBatch, so nothing is lost; once
+                        that batch holds maxBatch events the lot waits
+                        as with 'block', so memory stays bounded
+
+    Observers are called on the worker thread, so GUI observers must
+    marshal updates back to their own thread.
+    """
+
+    POLICIES = ('block', 'drop-oldest', 'coalesce')
+
+    def __init__(self, observers=(), maxSize=10000, policy='block', maxBatch=1000):
+        """
+        Args:
+            observers: Observers to deliver events to
+            maxSize: Maximum number of queued deliveries
+            policy: What to do when the queue is full (see POLICIES)
+            maxBatch: 'coalesce' - most events merged into one delivery
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown back-pressure policy: {policy}")
+        if maxSize < 1:
+            raise ValueError("Queue size must be at least 1")
+        if maxBatch < 2:
+            raise ValueError("Batch size must be at least 2")
+
+        self.maxSize = maxSize
+        self.maxBatch = maxBatch
+        self.policy = policy
+        self.observers = list(observers)
+        self.stats = {observer: ObserverStats() for observer in self.observers}
+        self.dropped = 0
+        self.coalesced = 0
+
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run, name="parking-observer-dispatch", daemon=True
+        )
+        self._worker.start()
+
+    def attachObserver(self, observer):
+        """Add an observer to deliver events to"""
+        with self._condition:
+            if observer not in self.observers:
+                self.observers.append(observer)
+                self.stats[observer] = ObserverStats()
+
+    def detachObserver(self, observer):
+        """Stop delivering events to an observer"""
+        with self._condition:
+            if observer in self.observers:
+                self.observers.remove(observer)
+
+    def update(self, event):
+        """Queue an event for delivery (called by ParkingLot)"""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Dispatcher is closed")
+
+            if len(self._queue) >= self.maxSize:
+                if self.policy == 'drop-oldest':
+                    self._queue.popleft()
+                    self.dropped += 1
+                elif self.policy == 'coalesce' and self._batchSize(self._queue[-1]) < self.maxBatch:
+                    self._queue[-1] = self._merge(self._queue[-1], event)
+                    self.coalesced += 1
+                    return
+                else:
+                    # 'block', or 'coalesce' with a full batch
+                    self._condition.wait_for(lambda: len(self._queue) < self.maxSize)
+
+            self._queue.append(event)
+            self._condition.notify_all()
+
+    @staticmethod
+    def _batchSize(queued):
+        """Events already merged into a queued delivery"""
+        return len(queued.batchedEvents) if isinstance(queued, EventBatch) else 1
+
+    @staticmethod
+    def _merge(queued, event):
+        """Merge a new event into a queued one"""
+        if isinstance(queued, EventBatch):
+            queued.batchedEvents.append(event)
+            return queued
+        return EventBatch([queued, event])
+
+    def flush(self, timeout=None):
+        """
+        Wait until every queued event has been delivered
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._busy, timeout
+            )
+
+    def close(self, timeout=None):
+        """Deliver what is queued, then stop the worker thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+
+    def getStats(self):
+        """
+        Returns:
+            Dictionary with per-observer latency stats and queue counters
+        """
+        with self._condition:
+            return {
+                'queued': len(self._queue),
+                'dropped': self.dropped,
+                'coalesced': self.coalesced,
+                'observers': {
+                    type(observer).__name__: self.stats[observer].asDict()
+                    for observer in self.observers
+                },
+            }
+
+    def _run(self):
+        """Worker loop: take one event, deliver it to every observer"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    self._busy = False
+                    self._condition.notify_all()
+                    return
+
+                event = self._queue.popleft()
+                observers = list(self.observers)
+                self._busy = True
+                # Wake producers blocked on a full queue
+                self._condition.notify_all()
+
+            for observer in observers:
+                stats = self.stats[observer]
+                start = time.perf_counter()
+                try:
+                    observer.update(event)
+                except Exception as e:
+                    # A failing observer must not stop delivery to the rest
+                    stats.errors += 1
+                    stats.lastError = e
+                stats.record(time.perf_counter() - start)
+
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
@@ -0,0 +1,98 @@
+class AttributeIndex:
+    """
+    Secondary indexes over parked vehicles (color, make, model, type)
+
+    IMPROVEMENT: Attribute values are normalized once at park time, so
+    queries cost time proportional to the result size, not lot capacity
+
+    Slots are keyed by one int (see encodeKey) rather than a
+    (slotNumber, isElectric) tuple: the same int object is shared by the
+    four indexes and ParkingLot.regNumIndex, saving a tuple per vehicle.
+    """
+
+    # Criterion name -> how to read it from a vehicle
+    ATTRIBUTES = {
+        'color': lambda vehicle: vehicle.color,
+        'make': lambda vehicle: vehicle.make,
+        'model': lambda vehicle: vehicle.model,
+        'type': lambda vehicle: vehicle.getType(),
+    }
+
+    def __init__(self):
+        """Initialize one empty index per attribute"""
+        self.indexes = {name: {} for name in self.ATTRIBUTES}
+
+    @staticmethod
+    def encodeKey(slotNumber, isElectric):
+        """Index key of a slot: slotNumber * 2, plus 1 for the EV pool"""
+        return slotNumber << 1 | bool(isElectric)
+
+    @staticmethod
+    def decodeKey(key):
+        """Tuple of (slotNumber, isElectric) for an index key"""
+        return (key >> 1, bool(key & 1))
+
+    @staticmethod
+    def normalize(value):
+        """Normalize a value so lookups are case-insensitive"""
+        return str(value).strip().lower()
+
+    def add(self, vehicle, key):
+        """
+        Index a parked vehicle
+
+        Args:
+            vehicle: Vehicle that was parked
+            key: Slot key from encodeKey()
+        """
+        for name, getValue in self.ATTRIBUTES.items():
+            value = self.normalize(getValue(vehicle))
+            self.indexes[name].setdefault(value, set()).add(key)
+
+    def remove(self, vehicle, key):
+        """
+        Drop a vehicle that left from every index
+
+        Args:
+            vehicle: Vehicle that left
+            key: Slot key from encodeKey()
+        """
+        for name, getValue in self.ATTRIBUTES.items():
+            index = self.indexes[name]
+            value = self.normalize(getValue(vehicle))
+            keys = index.get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+
+    def find(self, **criteria):
+        """
+        Find vehicles matching every given criterion
+
+        Example: find(color="red", type="Electric Car")
+
+        Returns:
+            List of tuples: (slotNumber, isElectric), regular slots first
+
+        Raises:
+            ValueError: If no criteria or an unknown criterion is given
+        """
+        if not criteria:
+            raise ValueError("At least one search criterion is required")
+
+        matches = []
+        for name, value in criteria.items():
+            if name not in self.indexes:
+                raise ValueError(f"Unknown search criterion: {name}")
+            matches.append(self.indexes[name].get(self.normalize(value), set()))
+
+        # Intersect starting from the smallest candidate set
+        matches.sort(key=len)
+        results = set(matches[0])
+        for keys in matches[1:]:
+            results &= keys
+
+        # Regular slots (even keys) first, each pool in slot order
+        decodeKey = self.decodeKey
+        return [decodeKey(key) for key in sorted(results, key=lambda key: (key & 1, key))]
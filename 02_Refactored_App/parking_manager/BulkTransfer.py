@@ -0,0 +1,217 @@
+"""
+Streaming bulk import and export of parked vehicles (CSV and JSON lines)
+
+One record per vehicle:
+
+    slot, ev, type, regNum, make, model, color, charge
+
+CSV files need a header row naming the columns; JSON-lines files hold one
+object per line. On import only regNum, make, model and color are
+required: type defaults to Car, charge to 0 and ev to whether the type
+is electric. slot is ignored unless keepSlots is set.
+
+Records are read one at a time and parked in batches with parkMany, so
+memory use does not depend on the file size.
+"""
+import csv
+import json
+import os
+
+from .Vehicle import ElectricVehicle, VehicleFactory, VehicleType
+
+FIELDS = ('slot', 'ev', 'type', 'regNum', 'make', 'model', 'color', 'charge')
+FORMATS = ('csv', 'jsonl')
+
+# Accept both the type value ("Electric Car") and the enum name (ELECTRIC_CAR)
+TYPE_NAMES = {}
+for vehicleType in VehicleType:
+    TYPE_NAMES[vehicleType.value.lower()] = vehicleType
+    TYPE_NAMES[vehicleType.name.lower()] = vehicleType
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 'ev'}
+
+def formatFor(path):
+    """File format from the file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    raise ValueError(f"Unknown file format: {path} (use .csv or .jsonl)")
+
+def readRecords(stream, fileFormat):
+    """
+    Yield (lineNumber, record dictionary) for every record in a stream
+
+    Lines that cannot be decoded yield (lineNumber, ValueError) instead,
+    so one bad line does not stop the import.
+    """
+    if fileFormat == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+    elif fileFormat == 'jsonl':
+        for lineNumber, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("record must be a JSON object")
+            except ValueError as e:
+                yield lineNumber, ValueError(f"invalid JSON record: {e}")
+                continue
+            yield lineNumber, record
+    else:
+        raise ValueError(f"Unknown file format: {fileFormat}")
+
+def vehicleFromRecord(record):
+    """
+    Build a vehicle through VehicleFactory (which applies the Vehicle
+    parameter and charge validation)
+
+    Returns:
+        Tuple of (vehicle, isElectric slot)
+    """
+    typeName = str(record.get('type') or VehicleType.CAR.value).strip().lower()
+    vehicleType = TYPE_NAMES.get(typeName)
+    if vehicleType is None:
+        raise ValueError(f"Invalid vehicle type: {record.get('type')}")
+
+    charge = record.get('charge')
+    charge = int(charge) if charge not in (None, '') else 0
+
+    vehicle = VehicleFactory.createVehicle(
+        vehicleType, record.get('regNum'), record.get('make'),
+        record.get('model'), record.get('color'), charge
+    )
+
+    ev = record.get('ev')
+    if ev in (None, ''):
+        isElectric = isinstance(vehicle, ElectricVehicle)
+    elif isinstance(ev, bool):
+        isElectric = ev
+    else:
+        isElectric = str(ev).strip().lower() in TRUE_VALUES
+    return vehicle, isElectric
+
+class ImportReport:
+    """Counts and (the first few) errors of one import"""
+
+    def __init__(self, maxErrors=100):
+        self.maxErrors = maxErrors
+        self.parked = 0
+        self.turnedAway = 0     # valid records that found the lot full
+        self.errorCount = 0
+        self.errors = []        # (lineNumber, message), at most maxErrors
+
+    def addError(self, lineNumber, message):
+        self.errorCount += 1
+        if len(self.errors) < self.maxErrors:
+            self.errors.append((lineNumber, str(message)))
+
+    def __str__(self):
+        return (
+            f"Imported {self.parked} vehicles, {self.turnedAway} turned away (lot full), "
+            f"{self.errorCount} invalid records"
+        )
+
+def importVehicles(lot, stream, fileFormat, batchSize=5000, keepSlots=False, maxErrors=100):
+    """
+    Park every valid record of a stream
+
+    Vehicles are parked with lot.parkMany in batches of batchSize per
+    slot pool (one observer notification per batch). Invalid records and
+    registrations already parked are reported and skipped.
+
+    Args:
+        lot: ParkingLot to park in
+        stream: Text stream to read
+        fileFormat: 'csv' or 'jsonl'
+        batchSize: Vehicles per parkMany call
+        keepSlots: Park each vehicle in its record's slot (lot.parkAt)
+            instead of the lowest free one; no batching
+        maxErrors: Number of error messages kept in the report
+
+    Returns:
+        ImportReport
+    """
+    report = ImportReport(maxErrors)
+    pending = {False: [], True: []}
+    pendingRegNums = set()
+
+    def flush(isElectric):
+        batch = pending[isElectric]
+        if not batch:
+            return
+        slotNumbers = lot.parkMany(batch, isElectric)
+        turnedAway = slotNumbers.count(None)
+        report.turnedAway += turnedAway
+        report.parked += len(batch) - turnedAway
+        pendingRegNums.difference_update(vehicle.regNum for vehicle in batch)
+        pending[isElectric] = []
+
+    for lineNumber, record in readRecords(stream, fileFormat):
+        try:
+            if isinstance(record, Exception):
+                raise record
+            vehicle, isElectric = vehicleFromRecord(record)
+
+            if vehicle.regNum in pendingRegNums or lot.findByRegNum(vehicle.regNum) is not None:
+                raise ValueError(f"Vehicle {vehicle.regNum} is already parked")
+
+            if keepSlots and record.get('slot') not in (None, ''):
+                lot.parkAt(vehicle, int(record['slot']), isElectric)
+                report.parked += 1
+                continue
+        except (ValueError, TypeError) as e:
+            report.addError(lineNumber, e)
+            continue
+
+        pending[isElectric].append(vehicle)
+        pendingRegNums.add(vehicle.regNum)
+        if len(pending[isElectric]) >= batchSize:
+            flush(isElectric)
+
+    flush(False)
+    flush(True)
+    return report
+
+def exportVehicles(lot, stream, fileFormat):
+    """
+    Write every parked vehicle of a lot, slot by slot
+
+    Returns:
+        Number of vehicles written
+    """
+    if fileFormat not in FORMATS:
+        raise ValueError(f"Unknown file format: {fileFormat}")
+
+    if fileFormat == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(FIELDS)
+        write = writer.writerow
+    else:
+        def write(row):
+            stream.write(json.dumps(dict(zip(FIELDS, row)), separators=(',', ':')) + "\n")
+
+    count = 0
+    for isElectric, slots in ((False, lot.slots), (True, lot.evSlots)):
+        for slotIndex, vehicle in enumerate(slots):
+            if vehicle is None:
+                continue
+            charge = vehicle.charge if isinstance(vehicle, ElectricVehicle) else 0
+            write((slotIndex + 1, isElectric, vehicle.getType(), vehicle.regNum,
+                   vehicle.make, vehicle.model, vehicle.color, charge))
+            count += 1
+    return count
+
+def importFile(lot, path, fileFormat=None, **options):
+    """importVehicles from a file (format from the extension by default)"""
+    with open(path, newline='', encoding='utf-8') as stream:
+        return importVehicles(lot, stream, fileFormat or formatFor(path), **options)
+
+def exportFile(lot, path, fileFormat=None):
+    """exportVehicles to a file (format from the extension by default)"""
+    with open(path, 'w', newline='', encoding='utf-8') as stream:
+        return exportVehicles(lot, stream, fileFormat or formatFor(path))
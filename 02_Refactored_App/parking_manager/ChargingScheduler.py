@@ -0,0 +1,165 @@
+import heapq
+
+from .ParkingLot import ParkingObserver
+from .ParkingEvents import LotCreated, Parked, Left
+from .Vehicle import ElectricVehicle, VehicleType
+
+class ChargingSession:
+    """Charging state of one EV in an EV slot"""
+    __slots__ = ('slotNumber', 'regNum', 'charge', 'departure', 'batteryKwh', 'maxRateKw')
+
+    def __init__(self, slotNumber, regNum, charge, departure, batteryKwh, maxRateKw):
+        self.slotNumber = slotNumber
+        self.regNum = regNum
+        self.charge = float(charge)   # percent, fractional between ticks
+        self.departure = departure    # simulated seconds
+        self.batteryKwh = batteryKwh
+        self.maxRateKw = maxRateKw
+
+    def deficitKwh(self):
+        """Energy still needed to reach 100%"""
+        return (100.0 - self.charge) * self.batteryKwh / 100.0
+
+    def urgency(self, now):
+        """Average power (kW) needed to be full at departure"""
+        hoursLeft = max(self.departure - now, 60.0) / 3600.0
+        return self.deficitKwh() / hoursLeft
+
+class ChargingScheduler(ParkingObserver):
+    """
+    Shares a site power budget across the EVs parked in EV slots
+
+    Every tick, the EVs that most urgently need power (largest charge
+    deficit per hour left before expected departure) are picked with a
+    priority queue and given up to their maximum charging rate until the
+    budget is used. advance() then moves every charging session forward
+    in one pass and writes the whole-percent changes back to the lot with
+    a single ParkingLot.updateCharges() call.
+
+    Sessions follow the lot as an observer (Observer Pattern): EVs are
+    added when they park in an EV slot and dropped when they leave.
+    """
+
+    # Battery size and maximum charging power per vehicle type
+    BATTERY_KWH = {VehicleType.ELECTRIC_CAR.value: 60.0, VehicleType.ELECTRIC_BIKE.value: 5.0}
+    MAX_RATE_KW = {VehicleType.ELECTRIC_CAR.value: 11.0, VehicleType.ELECTRIC_BIKE.value: 3.0}
+
+    def __init__(self, lot, powerBudgetKw, defaultDwellSeconds=4 * 3600, now=0.0):
+        """
+        Args:
+            lot: ParkingLot whose EV slots are scheduled
+            powerBudgetKw: Power the site can deliver to all bays at once
+            defaultDwellSeconds: Expected stay of an EV whose departure
+                was not given with setDeparture()
+            now: Simulated start time in seconds
+        """
+        self.lot = lot
+        self.powerBudgetKw = powerBudgetKw
+        self.defaultDwellSeconds = defaultDwellSeconds
+        self.now = now
+        self.sessions = {}      # EV slot number -> ChargingSession
+        self.allocation = {}    # EV slot number -> kW from the last schedule()
+
+        for slotIndex, vehicle in enumerate(lot.evSlots):
+            if vehicle is not None:
+                self._addSession(slotIndex + 1, vehicle)
+        lot.attachObserver(self)
+
+    # Observer Pattern: keep sessions in step with the EV slots
+    def update(self, event):
+        if isinstance(event, Parked):
+            if event.isElectric:
+                self._addSession(event.slotNumber, event.vehicle)
+        elif isinstance(event, Left):
+            if event.isElectric:
+                self.sessions.pop(event.slotNumber, None)
+                self.allocation.pop(event.slotNumber, None)
+        elif isinstance(event, LotCreated):
+            self.sessions.clear()
+            self.allocation.clear()
+        elif hasattr(event, 'events'):
+            for single in event.events():
+                self.update(single)
+
+    def _addSession(self, slotNumber, vehicle):
+        """Start a session for an electric vehicle (others cannot charge)"""
+        if not isinstance(vehicle, ElectricVehicle):
+            return
+        vehicleType = vehicle.getType()
+        self.sessions[slotNumber] = ChargingSession(
+            slotNumber, vehicle.regNum, vehicle.charge,
+            self.now + self.defaultDwellSeconds,
+            self.BATTERY_KWH[vehicleType], self.MAX_RATE_KW[vehicleType]
+        )
+
+    def setDeparture(self, slotNumber, departure):
+        """Expected departure (simulated seconds) of the EV in a slot"""
+        session = self.sessions.get(slotNumber)
+        if session is not None:
+            session.departure = departure
+
+    # Scheduling
+    def schedule(self):
+        """
+        Split the power budget across sessions, most urgent first
+
+        Only as many sessions as the budget can feed are taken from the
+        priority queue, so a tick costs O(n log k) for k powered bays.
+
+        Returns:
+            Dictionary of EV slot number -> kW
+        """
+        needing = [session for session in self.sessions.values() if session.charge < 100.0]
+        if not needing or self.powerBudgetKw <= 0:
+            self.allocation = {}
+            return self.allocation
+
+        # Upper bound on how many bays the budget can power at full rate
+        slowestRate = min(session.maxRateKw for session in needing)
+        candidates = min(len(needing), int(self.powerBudgetKw // slowestRate) + 1)
+        now = self.now
+        mostUrgent = heapq.nlargest(candidates, needing, key=lambda session: session.urgency(now))
+
+        allocation = {}
+        remaining = self.powerBudgetKw
+        for session in mostUrgent:
+            if remaining <= 0:
+                break
+            rate = min(session.maxRateKw, remaining)
+            allocation[session.slotNumber] = rate
+            remaining -= rate
+
+        self.allocation = allocation
+        return allocation
+
+    def advance(self, seconds):
+        """
+        Schedule, then charge every powered EV for `seconds` of simulated time
+
+        Returns:
+            Number of EVs whose whole-percent charge changed
+        """
+        allocation = self.schedule()
+        hours = seconds / 3600.0
+        sessions = self.sessions
+
+        changedSlots = []
+        changedCharges = []
+        for slotNumber, rate in allocation.items():
+            session = sessions[slotNumber]
+            before = int(session.charge)
+            session.charge = min(100.0, session.charge + rate * hours * 100.0 / session.batteryKwh)
+            after = int(session.charge)
+            if after != before:
+                changedSlots.append(slotNumber)
+                changedCharges.append(after)
+
+        if changedSlots:
+            self.lot.updateCharges(changedSlots, changedCharges)
+
+        self.now += seconds
+        return len(changedSlots)
+
+    def deliveredKw(self):
+        """Power handed out by the last schedule()"""
+        return sum(self.allocation.values())
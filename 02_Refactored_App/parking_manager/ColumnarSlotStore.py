@@ -0,0 +1,124 @@
+import sys
+from array import array
+
+from .Vehicle import ElectricVehicle, VehicleFactory, VehicleType
+
+class ColumnarSlotStore:
+    """
+    Slot store that keeps vehicle fields in parallel columns
+
+    Drop-in replacement for the plain list ParkingLot uses per slot pool:
+    store[i] returns a Vehicle (or None) and store[i] = vehicle stores one.
+    Instead of one object per parked vehicle, each field lives in its own
+    column and repeated strings (make, model, color) are interned. That
+    saves the vehicle objects - about a third of the store - but not the
+    registration strings, which ParkingLot's indexes hold anyway; see
+    benchmarks/bench_memory.py for what a whole lot uses.
+
+    Vehicles read back are rebuilt through VehicleFactory, so changing
+    a returned vehicle does not change the store - assign it back instead.
+    """
+
+    # Type code 0 means "empty slot"
+    VEHICLE_TYPES = list(VehicleType)
+    TYPE_CODES = {vehicleType.value: code for code, vehicleType in enumerate(VEHICLE_TYPES, 1)}
+    ELECTRIC_TYPE_CODES = frozenset((
+        TYPE_CODES[VehicleType.ELECTRIC_CAR.value], TYPE_CODES[VehicleType.ELECTRIC_BIKE.value]
+    ))
+
+    def __init__(self, capacity, isElectric=False):
+        """
+        Create store with every slot empty
+
+        Args:
+            capacity: Number of slots in the pool
+            isElectric: True for the EV pool (status rows show charge)
+        """
+        self.capacity = capacity
+        self.isElectric = isElectric
+
+        self._types = bytearray(capacity)
+        self._regNums = [None] * capacity
+        self._makes = [None] * capacity
+        self._models = [None] * capacity
+        self._colors = [None] * capacity
+        # Both pools: an electric vehicle may park in a regular bay
+        self._charges = array('b', bytes(capacity))
+
+    def __len__(self):
+        return self.capacity
+
+    def __getitem__(self, slotIndex):
+        """Rebuild the vehicle in a slot, or None if the slot is empty"""
+        typeCode = self._types[slotIndex]
+        if typeCode == 0:
+            return None
+
+        charge = self._charges[slotIndex]
+        return VehicleFactory.createVehicle(
+            self.VEHICLE_TYPES[typeCode - 1],
+            self._regNums[slotIndex],
+            self._makes[slotIndex],
+            self._models[slotIndex],
+            self._colors[slotIndex],
+            charge
+        )
+
+    def __setitem__(self, slotIndex, vehicle):
+        """Store a vehicle in a slot, or clear it with None"""
+        if vehicle is None:
+            self._types[slotIndex] = 0
+            self._regNums[slotIndex] = None
+            self._makes[slotIndex] = None
+            self._models[slotIndex] = None
+            self._colors[slotIndex] = None
+            return
+
+        self._types[slotIndex] = self.TYPE_CODES[vehicle.getType()]
+        self._regNums[slotIndex] = vehicle.regNum
+        self._makes[slotIndex] = sys.intern(vehicle.make)
+        self._models[slotIndex] = sys.intern(vehicle.model)
+        self._colors[slotIndex] = sys.intern(vehicle.color)
+        self._charges[slotIndex] = getattr(vehicle, 'charge', 0)
+
+    def __iter__(self):
+        for slotIndex in range(self.capacity):
+            yield self[slotIndex]
+
+    def setCharge(self, slotIndex, charge):
+        """
+        Change the charge of the vehicle in a slot without rebuilding it
+        (see ParkingLot.updateCharges)
+
+        Returns:
+            True if the slot holds an electric vehicle, False otherwise
+        """
+        if self._types[slotIndex] not in self.ELECTRIC_TYPE_CODES:
+            return False
+        ElectricVehicle._validate_charge(charge)
+        self._charges[slotIndex] = charge
+        return True
+
+    def statusRows(self, level):
+        """
+        ParkingLot status rows read straight from the columns, without
+        building vehicle objects (see ParkingLot._poolStatus)
+        """
+        regNums, makes, models, colors, charges = (
+            self._regNums, self._makes, self._models, self._colors, self._charges
+        )
+        rows = []
+        for slotIndex, typeCode in enumerate(self._types):
+            if typeCode:
+                row = {
+                    'slot': slotIndex + 1,
+                    'level': level,
+                    'registration': regNums[slotIndex],
+                    'color': colors[slotIndex],
+                    'make': makes[slotIndex],
+                    'model': models[slotIndex]
+                }
+                if self.isElectric:
+                    row['charge'] = charges[slotIndex] if typeCode in self.ELECTRIC_TYPE_CODES else 0
+                rows.append(row)
+        return rows
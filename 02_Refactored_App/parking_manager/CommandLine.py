@@ -0,0 +1,201 @@
+"""
+Headless command-line driver for ParkingLot (no tkinter import)
+
+Reads one command per line from files or stdin, in the style of the
+original prototype:
+
+    create <capacity> <evCapacity> <level>
+    park <regNum> <make> <model> <color> [ev] [motorcycle] [charge=<0-100>]
+    leave <slotNumber> [ev]
+    status
+    find-reg <regNum>
+    find-color <color>
+    import <file.csv|file.jsonl> [keep-slots]
+    export <file.csv|file.jsonl>
+
+Blank lines and lines starting with '#' are ignored. Values containing
+spaces can be quoted: park ABC123 Tesla "Model 3" Red ev
+
+Usage: python -m parking_manager [--quiet] [--profile PATH] [commandFile ...]
+"""
+import argparse
+import shlex
+import sys
+
+from . import BulkTransfer, Profiling
+from .ParkingLot import ParkingLot, ParkingObserver
+from .Vehicle import VehicleFactory, VehicleType
+
+class StreamObserver(ParkingObserver):
+    """Concrete Observer that writes event messages to a text stream"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def update(self, event):
+        self.stream.write(f"{event}\n")
+
+class CommandProcessor:
+    """Parses command lines and runs them against a ParkingLot"""
+
+    def __init__(self, parkingLot, output, quiet=False):
+        """
+        Args:
+            parkingLot: ParkingLot to drive
+            output: Text stream for results and event messages
+            quiet: True to skip per-event messages (results still printed)
+        """
+        self.parkingLot = parkingLot
+        self.output = output
+        self.errors = 0
+
+        if not quiet:
+            self.parkingLot.attachObserver(StreamObserver(output))
+
+        self.commands = {
+            'create': self.create,
+            'park': self.park,
+            'leave': self.leave,
+            'status': self.status,
+            'find-reg': self.findRegNum,
+            'find-color': self.findColor,
+            'import': self.importVehicles,
+            'export': self.exportVehicles,
+        }
+
+    def runLines(self, lines, source="<stdin>"):
+        """Run every command in an iterable of lines"""
+        for lineNumber, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            try:
+                # shlex only when needed: plain split is much faster.
+                # An unbalanced quote raises ValueError: report the line, go on.
+                args = shlex.split(line) if ('"' in line or "'" in line) else line.split()
+                handler = self.commands.get(args[0].lower())
+                if handler is None:
+                    raise ValueError(f"Unknown command: {args[0]}")
+                handler(args[1:])
+            except (ValueError, IndexError, OSError) as e:
+                self.errors += 1
+                sys.stderr.write(f"{source}:{lineNumber}: error: {e}\n")
+
+    def create(self, args):
+        capacity, evCapacity, level = (int(arg) for arg in args[:3])
+        self.parkingLot.createParkingLot(capacity, evCapacity, level)
+
+    def park(self, args):
+        regNum, make, model, color = args[:4]
+        flags = {arg.lower() for arg in args[4:]}
+
+        charge = 0
+        for flag in flags:
+            if flag.startswith('charge='):
+                charge = int(flag.split('=', 1)[1])
+
+        isElectric = 'ev' in flags
+        isMotorcycle = 'motorcycle' in flags
+        if isElectric and isMotorcycle:
+            vehicleType = VehicleType.ELECTRIC_BIKE
+        elif isElectric:
+            vehicleType = VehicleType.ELECTRIC_CAR
+        elif isMotorcycle:
+            vehicleType = VehicleType.MOTORCYCLE
+        else:
+            vehicleType = VehicleType.CAR
+
+        vehicle = VehicleFactory.createVehicle(vehicleType, regNum, make, model, color, charge)
+        if self.parkingLot.park(vehicle, isElectric) is None:
+            self.output.write(f"Parking lot is full: {regNum} not parked\n")
+
+    def leave(self, args):
+        slotNumber = int(args[0])
+        isElectric = len(args) > 1 and args[1].lower() == 'ev'
+        if not self.parkingLot.leave(slotNumber, isElectric):
+            self.output.write(f"Unable to remove vehicle from slot {slotNumber}\n")
+
+    def status(self, args):
+        status = self.parkingLot.getStatus()
+        write = self.output.write
+
+        write("Regular Vehicles:\nSlot\tLevel\tReg No.\tColor\tMake\tModel\n")
+        for vehicle in status['regular']:
+            write(
+                f"{vehicle['slot']}\t{vehicle['level']}\t{vehicle['registration']}\t"
+                f"{vehicle['color']}\t{vehicle['make']}\t{vehicle['model']}\n"
+            )
+
+        write("Electric Vehicles:\nSlot\tLevel\tReg No.\tColor\tMake\tModel\tCharge\n")
+        for vehicle in status['electric']:
+            write(
+                f"{vehicle['slot']}\t{vehicle['level']}\t{vehicle['registration']}\t"
+                f"{vehicle['color']}\t{vehicle['make']}\t{vehicle['model']}\t"
+                f"{vehicle['charge']}%\n"
+            )
+
+    def findRegNum(self, args):
+        regNum = args[0]
+        result = self.parkingLot.findByRegNum(regNum)
+        if result:
+            slotNumber, isElectric = result
+            slotType = "EV" if isElectric else "Regular"
+            self.output.write(f"Found: {regNum} in {slotType} slot {slotNumber}\n")
+        else:
+            self.output.write(f"Vehicle {regNum} not found\n")
+
+    def findColor(self, args):
+        color = args[0]
+        results = self.parkingLot.findByColor(color)
+        self.output.write(f"Found {len(results)} {color} vehicle(s)\n")
+        for slotNumber, isElectric in results:
+            slotType = "EV" if isElectric else "Regular"
+            self.output.write(f"  - {slotType} slot {slotNumber}\n")
+
+    def importVehicles(self, args):
+        path = args[0]
+        keepSlots = any(arg.lower() == 'keep-slots' for arg in args[1:])
+        report = BulkTransfer.importFile(self.parkingLot, path, keepSlots=keepSlots)
+        self.output.write(f"{report}\n")
+        for lineNumber, message in report.errors:
+            sys.stderr.write(f"{path}:{lineNumber}: error: {message}\n")
+        if report.errorCount > len(report.errors):
+            sys.stderr.write(f"{path}: {report.errorCount - len(report.errors)} more errors\n")
+        # Rejected rows fail the run like failed commands (exit status 1)
+        self.errors += report.errorCount
+
+    def exportVehicles(self, args):
+        count = BulkTransfer.exportFile(self.parkingLot, args[0])
+        self.output.write(f"Exported {count} vehicles to {args[0]}\n")
+
+def main(argv=None):
+    """Entry point for python -m parking_manager"""
+    parser = argparse.ArgumentParser(
+        prog="python -m parking_manager",
+        description="Run parking lot commands without the GUI"
+    )
+    parser.add_argument('files', nargs='*', help="command files (default: stdin)")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="do not print a message for every park/leave")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="write collapsed profiling stacks to PATH at exit "
+                             f"({Profiling.ENV_VAR} does the same)")
+    parser.add_argument('--profile-mode', choices=Profiling.MODES,
+                        help="sampling (default) or cprofile (writes PATH.<category>.pstats "
+                             "for cli and lot)")
+    args = parser.parse_args(argv)
+
+    # Does nothing without --profile or PARKING_PROFILE
+    Profiling.installFromArguments(args.profile, args.profile_mode, commandLine=True)
+
+    processor = CommandProcessor(ParkingLot(), sys.stdout, args.quiet)
+
+    if not args.files:
+        processor.runLines(sys.stdin)
+    for path in args.files:
+        with open(path) as commandFile:
+            processor.runLines(commandFile, path)
+
+    sys.stdout.flush()
+    return 1 if processor.errors else 0
@@ -0,0 +1,159 @@
+import threading
+
+from .ParkingEvents import ParkedBatch
+from .ParkingLot import ParkingLot
+
+class ConcurrentParkingLot(ParkingLot):
+    """
+    ParkingLot that is safe to call from many gate threads at once
+
+    IMPROVEMENT: Fine-grained locking instead of one global lock
+    - one lock per slot pool (regular, EV) guards slot allocation, so a
+      regular gate and an EV gate never wait for each other's allocation
+    - one index lock guards the lot-wide indexes and status log, held
+      only for the short index update
+    The index lock is only ever taken inside (or without) a pool lock,
+    never the other way round, so there is no lock-ordering deadlock.
+    Observers are notified outside every lock.
+    """
+
+    def __init__(self, slotStoreFactory=None):
+        super().__init__(slotStoreFactory)
+        self.poolLocks = {False: threading.Lock(), True: threading.Lock()}
+        self.indexLock = threading.Lock()
+
+    def createParkingLot(self, capacity, evCapacity, level):
+        """Create (or re-create) the lot while no gate is using it"""
+        with self.poolLocks[False], self.poolLocks[True], self.indexLock:
+            return super().createParkingLot(capacity, evCapacity, level)
+
+    def _placeVehicle(self, vehicle, isElectric, slotNumber=None):
+        """
+        Reserve the registration, claim a slot, then index the vehicle
+
+        Raises:
+            ValueError: If the registration is parked (or being parked)
+        """
+        regNum = vehicle.regNum
+        with self.indexLock:
+            # Atomic duplicate check: reserve the registration first
+            if regNum in self.regNumIndex:
+                raise ValueError(f"Vehicle {regNum} is already parked")
+            self.regNumIndex[regNum] = None
+
+        # Pool lock held until indexed: nobody can empty the slot meanwhile
+        with self.poolLocks[bool(isElectric)]:
+            try:
+                slotNumber = self._claimSlot(vehicle, isElectric, slotNumber)
+            except Exception:
+                with self.indexLock:
+                    del self.regNumIndex[regNum]
+                raise
+
+            with self.indexLock:
+                if slotNumber is None:
+                    del self.regNumIndex[regNum]
+                else:
+                    self._indexVehicle(vehicle, slotNumber, isElectric)
+
+        return slotNumber
+
+    def parkMany(self, vehicles, isElectric=False):
+        """
+        Park a batch atomically: all of it, or nothing on an error
+
+        The pool lock is held for the whole batch, and the registrations
+        are checked and reserved in one index lock hold, so no other gate
+        can park a batch member in between. If the store rejects a
+        vehicle midway, the vehicles already placed are taken out again
+        before the error is raised.
+        """
+        vehicles = list(vehicles)
+        with self.poolLocks[bool(isElectric)]:
+            with self.indexLock:
+                batchRegNums = set()
+                for vehicle in vehicles:
+                    if vehicle.regNum in self.regNumIndex or vehicle.regNum in batchRegNums:
+                        raise ValueError(f"Vehicle {vehicle.regNum} is already parked")
+                    batchRegNums.add(vehicle.regNum)
+                for regNum in batchRegNums:
+                    self.regNumIndex[regNum] = None
+
+            slotNumbers = []
+            try:
+                for vehicle in vehicles:
+                    slotNumbers.append(self._claimSlot(vehicle, isElectric))
+            except Exception:
+                # Nobody else can use this pool meanwhile: undo the placed ones
+                for slotNumber in slotNumbers:
+                    if slotNumber is not None:
+                        self._releaseSlot(slotNumber, isElectric)
+                with self.indexLock:
+                    for regNum in batchRegNums:
+                        del self.regNumIndex[regNum]
+                raise
+
+            with self.indexLock:
+                for vehicle, slotNumber in zip(vehicles, slotNumbers):
+                    if slotNumber is None:
+                        del self.regNumIndex[vehicle.regNum]
+                    else:
+                        self._indexVehicle(vehicle, slotNumber, isElectric)
+
+        if vehicles and self.observers:
+            self.notifyObservers(
+                ParkedBatch(self.level, vehicles, slotNumbers, bool(isElectric))
+            )
+
+        return slotNumbers
+
+    def _removeVehicle(self, slotNumber, isElectric):
+        """Release the slot, then drop the vehicle from the indexes"""
+        # Pool lock held until unindexed: the slot cannot be re-used meanwhile
+        with self.poolLocks[bool(isElectric)]:
+            vehicle = self._releaseSlot(slotNumber, isElectric)
+
+            if vehicle is not None:
+                with self.indexLock:
+                    self._unindexVehicle(vehicle, slotNumber, isElectric)
+
+        return vehicle
+
+    def updateCharges(self, slotNumbers, charges):
+        """Charge updates touch the EV pool and the status log"""
+        with self.poolLocks[True], self.indexLock:
+            super().updateCharges(slotNumbers, charges)
+
+    # Readers that iterate shared structures take the matching lock
+    def find(self, **criteria):
+        with self.indexLock:
+            return super().find(**criteria)
+
+    def findByColor(self, color):
+        with self.indexLock:
+            return super().findByColor(color)
+
+    def getStatus(self):
+        """Status built pool by pool, each under its own lock"""
+        status = {}
+
+        with self.poolLocks[False]:
+            status['regular'] = self._poolStatus(self.slots, False)
+
+        with self.poolLocks[True]:
+            status['electric'] = self._poolStatus(self.evSlots, True)
+
+        return status
+
+    def getStatusSnapshot(self):
+        """
+        Version read before the rows: a change racing with the snapshot
+        is simply delivered again by the next getStatusChanges()
+        """
+        with self.indexLock:
+            version = self.statusVersion
+        return (version, self.getStatus())
+
+    def getStatusChanges(self, sinceVersion):
+        with self.indexLock:
+            return super().getStatusChanges(sinceVersion)
@@ -0,0 +1,456 @@
+import json
+import os
+import sys
+import threading
+import time
+
+from .ParkingLot import ParkingObserver
+from .ParkingEvents import LotCreated, Parked, Left, ChargesUpdated
+from .Vehicle import ElectricVehicle, VehicleFactory, VehicleType
+
+class EventJournal(ParkingObserver):
+    """
+    Durable parking state: append-only event journal plus snapshots
+
+    IMPROVEMENT: Facility state survives a restart
+    - every create/park/leave/charge event is appended to journal.jsonl
+      (write-ahead log, one JSON record per line, numbered by seq)
+    - every `snapshotEvery` records the journal is renamed to
+      journal.jsonl.old and a fresh one is started; a background thread
+      folds the old journal into snapshot.json (previous snapshot plus
+      its records - files only, never the live facility) and deletes it.
+      Recovery is "load snapshot + replay the short tail" in bounded
+      time, and park/leave never wait for a snapshot to be written.
+
+    fsync policies:
+    - 'always': every delivered event is written and fsynced
+    - 'batch':  group commit - records are buffered and written with one
+                fsync once `groupSize` records or `groupSeconds` have
+                accumulated (or on commit()/close()); a background timer
+                commits records of a quiet facility, so callers (GUI,
+                command line, server) need no timer of their own
+    - 'never':  grouped like 'batch' but never fsynced - written records
+                survive a process crash, not a power loss
+
+    Single writer: every change should reach the journal from one thread -
+    the one that called recover() (the GUI's LotWorker). Records of lots
+    changed from several threads at once (ConcurrentParkingLot) may be
+    journaled in a different order than they were applied, so replay can
+    diverge. update() runs after the lot has changed, so it cannot refuse
+    the change: an event from any other thread is still journaled (the
+    record is already true) and a warning is written once. The flush timer
+    and the snapshot thread only share the record buffer and the files,
+    under locks of their own.
+    """
+
+    FSYNC_POLICIES = ('always', 'batch', 'never')
+    JOURNAL_FILE = 'journal.jsonl'
+    OLD_JOURNAL_FILE = 'journal.jsonl.old'
+    SNAPSHOT_FILE = 'snapshot.json'
+
+    def __init__(self, directory, fsync='batch', groupSize=256, groupSeconds=0.05,
+                 snapshotEvery=10000):
+        """
+        Args:
+            directory: Folder holding the journal and snapshot files
+            fsync: One of FSYNC_POLICIES
+            groupSize: 'batch'/'never' - records per group commit
+            groupSeconds: 'batch'/'never' - maximum age of a buffered
+                record before it is committed (by the next event or the
+                flush timer)
+            snapshotEvery: Journal records between snapshots (0 = never)
+        """
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+
+        self.directory = directory
+        self.fsync = fsync
+        self.groupSize = groupSize
+        self.groupSeconds = groupSeconds
+        self.snapshotEvery = snapshotEvery
+
+        self.journalPath = os.path.join(directory, self.JOURNAL_FILE)
+        self.oldJournalPath = os.path.join(directory, self.OLD_JOURNAL_FILE)
+        self.snapshotPath = os.path.join(directory, self.SNAPSHOT_FILE)
+
+        self.facility = None
+        self.journalFile = None
+        self.writerThread = None     # ident of the thread expected to journal
+        self.warnedWriter = False    # foreign writer already reported
+        self.seq = 0                 # last record number handed out
+        self.recordsSinceSnapshot = 0
+        self.pending = []            # encoded records not yet written
+        self.pendingSince = 0.0
+
+        self.pendingLock = threading.Lock()   # pending, shared with the flush timer
+        self.fileLock = threading.RLock()     # journal writes and rotation, in order
+        self.stopped = threading.Event()
+        self.flusher = None          # flush timer thread
+        self.compactor = None        # snapshot thread
+        self.snapshotError = None    # why the last background snapshot failed
+
+    # Recovery
+    def recover(self, facility):
+        """
+        Restore a facility from disk, then start journaling its changes
+
+        Call once at startup, on an empty Facility, before other observers
+        are attached (they would see every restored vehicle as parked).
+
+        Returns:
+            Number of journal records replayed after the snapshot
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.facility = facility
+        self.writerThread = threading.get_ident()
+
+        snapshotSeq = self._loadSnapshot()
+        self.seq = snapshotSeq
+        # A snapshot interrupted by a crash leaves its rotated journal behind
+        interrupted = os.path.exists(self.oldJournalPath)
+        replayed = self._replayJournal(self.oldJournalPath, snapshotSeq)[0] if interrupted else 0
+        tailReplayed, goodLength = self._replayJournal(self.journalPath, snapshotSeq)
+        replayed += tailReplayed
+        self.recordsSinceSnapshot = replayed
+
+        # Drop a torn last record left by a crash before appending after it
+        self.journalFile = open(self.journalPath, 'ab')
+        if self.journalFile.tell() != goodLength:
+            self.journalFile.truncate(goodLength)
+
+        if interrupted:
+            self._startCompaction()
+        if self.fsync != 'always' and self.groupSeconds > 0:
+            self.flusher = threading.Thread(target=self._flushLoop, name="journal-flush", daemon=True)
+            self.flusher.start()
+
+        facility.attachObserver(self)
+        return replayed
+
+    def _loadSnapshot(self):
+        """Re-create every level of the snapshot; returns its seq (0 if none)"""
+        try:
+            with open(self.snapshotPath, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return 0
+
+        for level in snapshot['levels']:
+            lot = self.facility.createLevel(level['capacity'], level['evCapacity'], level['level'])
+            for slotNumber, isElectric, vehicleType, regNum, make, model, color, charge in level['vehicles']:
+                vehicle = VehicleFactory.createVehicle(
+                    VehicleType(vehicleType), regNum, make, model, color, charge
+                )
+                lot.parkAt(vehicle, slotNumber, isElectric)
+
+        return snapshot['seq']
+
+    def _replayJournal(self, path, snapshotSeq):
+        """
+        Apply journal records newer than the snapshot
+
+        Returns:
+            Tuple of (records applied, byte length of the intact journal)
+        """
+        replayed = 0
+        goodLength = 0
+        for record, length in self._readJournal(path):
+            goodLength += length
+            if record['seq'] <= snapshotSeq:
+                continue  # already in the snapshot
+            self._applyRecord(record)
+            self.seq = record['seq']
+            replayed += 1
+        return (replayed, goodLength)
+
+    @staticmethod
+    def _readJournal(path):
+        """Yield (record, line length) for every intact record of a journal file"""
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return
+
+        with f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete record")
+                    record = json.loads(line)
+                except ValueError:
+                    return  # torn write at the tail: everything after it is lost
+                yield record, len(line)
+
+    def _applyRecord(self, record):
+        op = record['op']
+        if op == 'create':
+            self.facility.createLevel(record['capacity'], record['evCapacity'], record['level'])
+        elif op == 'park':
+            vehicle = VehicleFactory.createVehicle(
+                VehicleType(record['type']), record['regNum'], record['make'],
+                record['model'], record['color'], record['charge']
+            )
+            self.facility.getLevel(record['level']).parkAt(vehicle, record['slot'], record['ev'])
+        elif op == 'leave':
+            self.facility.leave(record['level'], record['slot'], record['ev'])
+        elif op == 'charge':
+            self.facility.getLevel(record['level']).updateCharges(record['slots'], record['charges'])
+        else:
+            raise ValueError(f"Unknown journal record: {op}")
+
+    # Journaling (Observer Pattern)
+    def update(self, event):
+        """Append the records of one event delivery, commit per fsync policy"""
+        if self.journalFile is None:
+            return
+        if threading.get_ident() != self.writerThread and not self.warnedWriter:
+            # Raising here would lose a change the lot already made and stop
+            # delivery to the observers after this one: report and journal it
+            self.warnedWriter = True
+            sys.stderr.write(
+                f"warning: journal in {self.directory} changed from a thread other "
+                f"than the one that called recover(); records may be out of order\n"
+            )
+
+        events = event.events() if hasattr(event, 'events') else (event,)
+        records = [record for record in map(self._record, events) if record is not None]
+
+        if records:
+            with self.pendingLock:
+                # Numbered under the lock, so a foreign writer never reuses a seq
+                start = self.seq
+                self.seq += len(records)
+                self.recordsSinceSnapshot += len(records)
+                records = [
+                    json.dumps({'seq': seq, **record}, separators=(',', ':'))
+                    for seq, record in enumerate(records, start + 1)
+                ]
+                if not self.pending:
+                    self.pendingSince = time.monotonic()
+                self.pending.extend(records)
+
+        if self._commitDue():
+            self.commit()
+
+        if self.snapshotEvery and self.recordsSinceSnapshot >= self.snapshotEvery:
+            self.startSnapshot()
+
+    def _commitDue(self):
+        """True when the buffered records must be written per the fsync policy"""
+        return bool(self.pending) and (
+            self.fsync == 'always' or len(self.pending) >= self.groupSize or
+            time.monotonic() - self.pendingSince >= self.groupSeconds
+        )
+
+    @staticmethod
+    def _record(event):
+        """Journal record for one event (None for events that change nothing)"""
+        if isinstance(event, Parked):
+            vehicle = event.vehicle
+            return {
+                'op': 'park', 'level': event.level, 'slot': event.slotNumber,
+                'ev': event.isElectric, 'type': vehicle.getType(),
+                'regNum': vehicle.regNum, 'make': vehicle.make,
+                'model': vehicle.model, 'color': vehicle.color,
+                'charge': vehicle.charge if isinstance(vehicle, ElectricVehicle) else 0
+            }
+        if isinstance(event, Left):
+            return {'op': 'leave', 'level': event.level, 'slot': event.slotNumber, 'ev': event.isElectric}
+        if isinstance(event, LotCreated):
+            return {
+                'op': 'create', 'level': event.level,
+                'capacity': event.capacity, 'evCapacity': event.evCapacity
+            }
+        if isinstance(event, ChargesUpdated):
+            return {
+                'op': 'charge', 'level': event.level,
+                'slots': list(event.slotNumbers), 'charges': list(event.charges)
+            }
+        return None
+
+    def commit(self):
+        """Write buffered records (one write) and fsync unless policy is 'never'"""
+        with self.fileLock:
+            if self.journalFile is None:
+                return
+            with self.pendingLock:
+                records, self.pending = self.pending, []
+            if not records:
+                return
+
+            self.journalFile.write(("\n".join(records) + "\n").encode('utf-8'))
+            self.journalFile.flush()
+            if self.fsync != 'never':
+                os.fsync(self.journalFile.fileno())
+
+    def _flushLoop(self):
+        """Flush timer: commit records that waited groupSeconds with no new event"""
+        while not self.stopped.wait(self.groupSeconds):
+            if self.pending and time.monotonic() - self.pendingSince >= self.groupSeconds:
+                try:
+                    self.commit()
+                except OSError as e:
+                    sys.stderr.write(f"warning: could not commit journal in {self.directory}: {e}\n")
+
+    # Snapshots
+    def startSnapshot(self):
+        """
+        Rotate the journal and build snapshot.json from it in the background
+
+        The journal is committed and renamed to journal.jsonl.old, and new
+        records go to a fresh journal.jsonl. A background thread then
+        loads the previous snapshot, applies the old journal's records and
+        writes the result (see _compact). Nothing is rotated while an
+        earlier snapshot is still being written, or while a failed one
+        left its journal behind (that one is retried instead).
+
+        The record count restarts either way, so a skipped or failing
+        snapshot is tried again after another `snapshotEvery` records,
+        not on every record.
+
+        Returns:
+            The snapshot thread, or None if one is already running
+        """
+        self.recordsSinceSnapshot = 0
+        if self.compactor is not None and self.compactor.is_alive():
+            return None
+        if not os.path.exists(self.oldJournalPath):
+            with self.fileLock:
+                self.commit()
+                self.journalFile.close()
+                os.replace(self.journalPath, self.oldJournalPath)
+                self.journalFile = open(self.journalPath, 'ab')
+                if self.fsync != 'never':
+                    self._syncDirectory()  # records fsynced from now on need the new file to exist
+        return self._startCompaction()
+
+    def snapshot(self):
+        """
+        Write snapshot.json now and wait for it
+
+        Raises:
+            OSError, ValueError: If the snapshot could not be written
+        """
+        self.waitForSnapshot()
+        self.startSnapshot()
+        self.waitForSnapshot()
+        if self.snapshotError is not None:
+            raise self.snapshotError
+
+    def waitForSnapshot(self):
+        """Wait until a snapshot being written in the background is done"""
+        if self.compactor is not None:
+            self.compactor.join()
+
+    def _startCompaction(self):
+        self.snapshotError = None
+        self.compactor = threading.Thread(target=self._compactOrWarn, name="journal-snapshot", daemon=True)
+        self.compactor.start()
+        return self.compactor
+
+    def _compactOrWarn(self):
+        try:
+            self._compact()
+        except (OSError, ValueError, KeyError) as e:
+            # The old journal is kept: recovery replays it, the next snapshot retries
+            self.snapshotError = e
+            sys.stderr.write(f"warning: journal snapshot in {self.directory} failed: {e}\n")
+
+    def _compact(self):
+        """
+        Fold journal.jsonl.old into snapshot.json, then delete it
+
+        Reads only files, so it can run while the facility changes. The
+        snapshot is written to a temporary file and renamed over the old
+        one, so a crash leaves either the old or the new snapshot; records
+        it already contains are skipped by seq on recovery, so a crash
+        before the old journal is deleted is harmless too.
+        """
+        levels = {}   # level -> {'capacity', 'evCapacity', 'vehicles': {(slot, ev): row}}
+        seq = 0
+        try:
+            with open(self.snapshotPath, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            seq = snapshot['seq']
+            for level in snapshot['levels']:
+                levels[level['level']] = {
+                    'capacity': level['capacity'], 'evCapacity': level['evCapacity'],
+                    'vehicles': {(row[0], row[1]): row for row in level['vehicles']}
+                }
+        except FileNotFoundError:
+            pass
+
+        for record, _ in self._readJournal(self.oldJournalPath):
+            if record['seq'] > seq:
+                self._foldRecord(levels, record)
+                seq = record['seq']
+
+        snapshot = {'seq': seq, 'levels': [
+            {
+                'level': levelNumber, 'capacity': level['capacity'], 'evCapacity': level['evCapacity'],
+                # Regular slots first, each pool in slot order
+                'vehicles': sorted(level['vehicles'].values(), key=lambda row: (row[1], row[0]))
+            }
+            for levelNumber, level in sorted(levels.items())
+        ]}
+
+        temporaryPath = self.snapshotPath + '.tmp'
+        with open(temporaryPath, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporaryPath, self.snapshotPath)
+        self._syncDirectory()
+        os.remove(self.oldJournalPath)
+
+    @staticmethod
+    def _foldRecord(levels, record):
+        """Apply one journal record to the snapshot rows of _compact"""
+        op = record['op']
+        if op == 'create':
+            levels[record['level']] = {
+                'capacity': record['capacity'], 'evCapacity': record['evCapacity'], 'vehicles': {}
+            }
+            return
+
+        vehicles = levels[record['level']]['vehicles']
+        if op == 'park':
+            ev = bool(record['ev'])
+            vehicles[(record['slot'], ev)] = [
+                record['slot'], ev, record['type'], record['regNum'],
+                record['make'], record['model'], record['color'], record['charge']
+            ]
+        elif op == 'leave':
+            vehicles.pop((record['slot'], bool(record['ev'])), None)
+        elif op == 'charge':
+            for slotNumber, charge in zip(record['slots'], record['charges']):
+                row = vehicles.get((slotNumber, True))
+                if row is not None:
+                    row[7] = charge
+        else:
+            raise ValueError(f"Unknown journal record: {op}")
+
+    def _syncDirectory(self):
+        """Make renames in the directory durable (not supported on Windows)"""
+        if hasattr(os, 'O_DIRECTORY'):
+            descriptor = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(descriptor)
+            finally:
+                os.close(descriptor)
+
+    def close(self):
+        """Stop the flush timer, finish a running snapshot, commit and stop journaling"""
+        if self.journalFile is None:
+            return
+        self.stopped.set()
+        if self.flusher is not None:
+            self.flusher.join()
+        self.waitForSnapshot()
+        self.commit()
+        with self.fileLock:
+            if self.fsync == 'never':
+                os.fsync(self.journalFile.fileno())  # clean shutdown loses nothing
+            self.journalFile.close()
+            self.journalFile = None
+        self.facility.detachObserver(self)
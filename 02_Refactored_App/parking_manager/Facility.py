@@ -0,0 +1,323 @@
+from bisect import bisect_left
+
+from .ParkingLot import ParkingLot, ParkingObserver
+from .ParkingEvents import LotCreated, Parked, Left, ParkedBatch, LeftBatch
+
+class LevelFreeTree:
+    """
+    Segment tree of free slot counts, one leaf per level
+
+    Answers "first/last level position with a free slot" in O(log levels)
+    instead of polling every level.
+    """
+
+    def __init__(self, counts):
+        """
+        Args:
+            counts: Free slot count per level position
+        """
+        self.size = 1
+        while self.size < max(len(counts), 1):
+            self.size *= 2
+        self.tree = [0] * (2 * self.size)
+        self.tree[self.size:self.size + len(counts)] = counts
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = self.tree[2 * node] + self.tree[2 * node + 1]
+
+    def total(self):
+        """Free slots across all levels"""
+        return self.tree[1]
+
+    def set(self, position, count):
+        """Update the free count of one level position"""
+        node = self.size + position
+        self.tree[node] = count
+        node //= 2
+        while node:
+            self.tree[node] = self.tree[2 * node] + self.tree[2 * node + 1]
+            node //= 2
+
+    def firstFreeFrom(self, position):
+        """Lowest position >= position with a free slot, or None"""
+        return self._search(1, 0, self.size, position, self.size, True)
+
+    def lastFreeBefore(self, position):
+        """Highest position < position with a free slot, or None"""
+        return self._search(1, 0, self.size, 0, position, False)
+
+    def _search(self, node, nodeStart, nodeEnd, start, end, lowest):
+        """Find the lowest/highest free leaf within [start, end)"""
+        if nodeEnd <= start or end <= nodeStart or self.tree[node] == 0:
+            return None
+        if nodeEnd - nodeStart == 1:
+            return nodeStart
+
+        middle = (nodeStart + nodeEnd) // 2
+        halves = [(2 * node, nodeStart, middle), (2 * node + 1, middle, nodeEnd)]
+        if not lowest:
+            halves.reverse()
+        for child, childStart, childEnd in halves:
+            found = self._search(child, childStart, childEnd, start, end, lowest)
+            if found is not None:
+                return found
+        return None
+
+class Facility(ParkingObserver):
+    """
+    Multi-level parking facility: one ParkingLot per floor level
+
+    The facility observes its levels (Observer Pattern) to keep per-level
+    free counts in a LevelFreeTree per slot pool, so finding the nearest
+    level with a free bay costs O(log levels), and a facility-wide
+    regNum -> level index, so duplicate checks and findByRegNum cost
+    O(1) instead of asking every level.
+    """
+
+    def __init__(self, slotStoreFactory=None, lotFactory=None):
+        """
+        Args:
+            slotStoreFactory: Passed to every level's ParkingLot
+            lotFactory: Optional callable() returning a new, empty lot for
+                a level (e.g. a SqliteParkingLot on a shared connection).
+                Defaults to ParkingLot(slotStoreFactory).
+        """
+        self.slotStoreFactory = slotStoreFactory
+        self.lotFactory = lotFactory
+        self.levels = {}         # level number -> ParkingLot
+        self.levelNumbers = []   # sorted level numbers (tree positions)
+        self.regNumLevels = {}   # registration number -> level it is parked on
+        self.observers = []
+        self._rebuildFreeTrees()
+
+    # Observer Pattern methods: observers are attached to every level
+    def attachObserver(self, observer):
+        """Register an observer on every current and future level"""
+        if observer not in self.observers:
+            self.observers.append(observer)
+            for lot in self.levels.values():
+                lot.attachObserver(observer)
+
+    def detachObserver(self, observer):
+        """Remove an observer from every level"""
+        if observer in self.observers:
+            self.observers.remove(observer)
+            for lot in self.levels.values():
+                lot.detachObserver(observer)
+
+    def update(self, event):
+        """Called by a level when it changes: refresh its free counts and regNum index"""
+        if event.level not in self.levels:
+            return
+        self._indexEvent(event)
+        self._refreshLevel(event.level)
+
+    def _indexEvent(self, event):
+        """Apply one event (or batch of events) to regNumLevels"""
+        regNumLevels = self.regNumLevels
+        if isinstance(event, Parked):
+            regNumLevels[event.vehicle.regNum] = event.level
+        elif isinstance(event, Left):
+            if regNumLevels.get(event.vehicle.regNum) == event.level:
+                del regNumLevels[event.vehicle.regNum]
+        elif isinstance(event, ParkedBatch):
+            for vehicle, slotNumber in zip(event.vehicles, event.slotNumbers):
+                if slotNumber is not None:
+                    regNumLevels[vehicle.regNum] = event.level
+        elif isinstance(event, LeftBatch):
+            for vehicle in event.vehicles:
+                if regNumLevels.get(vehicle.regNum) == event.level:
+                    del regNumLevels[vehicle.regNum]
+        elif isinstance(event, LotCreated):
+            self._unindexLevel(event.level)   # a re-created level is empty
+        elif hasattr(event, 'events'):
+            for single in event.events():
+                self._indexEvent(single)
+
+    def _unindexLevel(self, level):
+        """Drop every registration of one level from regNumLevels"""
+        self.regNumLevels = {
+            regNum: parkedLevel for regNum, parkedLevel in self.regNumLevels.items()
+            if parkedLevel != level
+        }
+
+    # Level management
+    def createLevel(self, capacity, evCapacity, level):
+        """
+        Create a level, or re-create an existing one with new capacities
+
+        Returns:
+            The level's ParkingLot
+        """
+        lot = self.levels.get(level)
+
+        if lot is None:
+            lot = self.newLot()
+            for observer in self.observers:
+                lot.attachObserver(observer)
+            lot.createParkingLot(capacity, evCapacity, level)
+
+            self.levels[level] = lot
+            self.levelNumbers = sorted(self.levels)
+            self._rebuildFreeTrees()
+            # Attached last: the trees must cover the level before its first event
+            lot.attachObserver(self)
+        else:
+            lot.createParkingLot(capacity, evCapacity, level)
+
+        return lot
+
+    def adoptLevel(self, slots, evSlots, level):
+        """
+        Add (or replace) a level from slot stores that already hold
+        vehicles, e.g. MmapSlotStore files reopened after a restart
+
+        The lot rebuilds its own indexes (ParkingLot.adoptSlotStores);
+        the facility then indexes the level's vehicles and rebuilds its
+        free count trees. Observers are not notified: nothing arrived.
+
+        Returns:
+            The level's ParkingLot
+        """
+        lot = self.levels.get(level)
+        if lot is None:
+            lot = self.newLot()
+            for observer in self.observers:
+                lot.attachObserver(observer)
+        else:
+            self._unindexLevel(level)
+        lot.adoptSlotStores(slots, evSlots, level)
+
+        for regNum in lot.regNumIndex:
+            self.regNumLevels[regNum] = level
+        self.levels[level] = lot
+        self.levelNumbers = sorted(self.levels)
+        self._rebuildFreeTrees()
+        lot.attachObserver(self)
+        return lot
+
+    def newLot(self):
+        """Build the (not yet created) ParkingLot for a new level"""
+        if self.lotFactory is None:
+            return ParkingLot(self.slotStoreFactory)
+        return self.lotFactory()
+
+    def getLevel(self, level):
+        """ParkingLot for a level, or None"""
+        return self.levels.get(level)
+
+    def _rebuildFreeTrees(self):
+        """Build the free count trees after the set of levels changed"""
+        lots = [self.levels[level] for level in self.levelNumbers]
+        self.freeTrees = {
+            False: LevelFreeTree([lot.capacity - lot.numOfOccupiedSlots for lot in lots]),
+            True: LevelFreeTree([lot.evCapacity - lot.numOfOccupiedEvSlots for lot in lots]),
+        }
+
+    def _refreshLevel(self, level):
+        """Copy one level's free counts into the trees"""
+        lot = self.levels[level]
+        position = bisect_left(self.levelNumbers, level)
+        self.freeTrees[False].set(position, lot.capacity - lot.numOfOccupiedSlots)
+        self.freeTrees[True].set(position, lot.evCapacity - lot.numOfOccupiedEvSlots)
+
+    def nearestFreeLevel(self, isElectric=False, nearLevel=None):
+        """
+        Find the level with a free slot closest to nearLevel
+
+        Args:
+            isElectric: Look for a free EV slot instead of a regular one
+            nearLevel: Entry level; None means the lowest level
+
+        Returns:
+            Level number, or None if the whole facility is full
+        """
+        tree = self.freeTrees[bool(isElectric)]
+        if not self.levelNumbers or tree.total() == 0:
+            return None
+
+        if nearLevel is None:
+            return self.levelNumbers[tree.firstFreeFrom(0)]
+
+        position = bisect_left(self.levelNumbers, nearLevel)
+        candidates = [
+            self.levelNumbers[found]
+            for found in (tree.firstFreeFrom(position), tree.lastFreeBefore(position))
+            if found is not None
+        ]
+        # Closest level wins; on a tie the lower level
+        return min(candidates, key=lambda level: (abs(level - nearLevel), level))
+
+    # Parking operations across levels
+    def park(self, vehicle, isElectric=False, nearLevel=None):
+        """
+        Park a vehicle on the nearest level with a free slot
+
+        Returns:
+            Tuple of (level, slotNumber), or None if the facility is full
+
+        Raises:
+            ValueError: If the vehicle is already parked on any level
+        """
+        if vehicle.regNum in self.regNumLevels:
+            raise ValueError(f"Vehicle {vehicle.regNum} is already parked")
+
+        level = self.nearestFreeLevel(isElectric, nearLevel)
+        if level is None:
+            return None
+
+        return (level, self.levels[level].park(vehicle, isElectric))
+
+    def leave(self, level, slotNumber, isElectric=False):
+        """
+        Remove a vehicle from a slot on a level
+
+        Returns:
+            True if successful, False if the level or slot was empty
+        """
+        lot = self.levels.get(level)
+        if lot is None:
+            return False
+        return lot.leave(slotNumber, isElectric)
+
+    def findByRegNum(self, regNum):
+        """
+        Returns:
+            Tuple of (level, slotNumber, isElectric) or None if not found
+        """
+        level = self.regNumLevels.get(regNum)
+        if level is None:
+            return None
+        found = self.levels[level].findByRegNum(regNum)
+        return None if found is None else (level,) + found
+
+    def find(self, **criteria):
+        """
+        Find vehicles matching all criteria on every level
+
+        Returns:
+            List of tuples: (level, slotNumber, isElectric)
+        """
+        return [
+            (level,) + found
+            for level in self.levelNumbers
+            for found in self.levels[level].find(**criteria)
+        ]
+
+    def findByColor(self, color):
+        """
+        Returns:
+            List of tuples: (level, slotNumber, isElectric)
+        """
+        return self.find(color=color)
+
+    def getStatus(self):
+        """
+        Returns:
+            Dictionary with regular and EV vehicle lists for all levels
+        """
+        status = {'regular': [], 'electric': []}
+        for level in self.levelNumbers:
+            levelStatus = self.levels[level].getStatus()
+            status['regular'].extend(levelStatus['regular'])
+            status['electric'].extend(levelStatus['electric'])
+        return status
@@ -0,0 +1,135 @@
+import tkinter as tk
+from bisect import bisect_left, insort
+from tkinter import ttk
+
+class BoundedLog:
+    """
+    Message log on a tk.Text that keeps only the newest lines (ring buffer)
+
+    IMPROVEMENT: The widget never grows without bound, so insert/see cost
+    stays constant no matter how long the application has been running
+    """
+
+    def __init__(self, textWidget, maxLines=1000):
+        """
+        Args:
+            textWidget: Tkinter Text widget to write to
+            maxLines: Number of lines kept before the oldest are dropped
+        """
+        self.textWidget = textWidget
+        self.maxLines = maxLines
+        self.lineCount = 0
+
+    def append(self, text):
+        """Add text at the end, drop the oldest lines if over the limit"""
+        self.textWidget.insert(tk.END, text)
+        self.lineCount += text.count("\n")
+
+        excess = self.lineCount - self.maxLines
+        if excess > 0:
+            self.textWidget.delete("1.0", f"{excess + 1}.0")
+            self.lineCount -= excess
+
+        self.textWidget.see(tk.END)  # Auto-scroll to bottom
+
+class VirtualTable(tk.Frame):
+    """
+    Scrollable table that only materializes the visible rows
+
+    All rows live in a sorted model (key -> values); the ttk.Treeview
+    holds at most `visibleRows` items, re-filled from the model when the
+    user scrolls or visible data changes. Rendering cost therefore
+    depends on the window height, not on the number of rows.
+    """
+
+    def __init__(self, parent, columns, visibleRows=12, columnWidth=80):
+        """
+        Args:
+            parent: Parent widget
+            columns: Column headings
+            visibleRows: Number of rows shown at once
+        """
+        super().__init__(parent)
+        self.visibleRows = visibleRows
+        self.keys = []     # sorted row keys
+        self.values = {}   # key -> tuple of column values
+        self.offset = 0    # index of the first visible row
+        self.renderPending = False
+
+        # Plain column ids: headings may contain spaces or punctuation
+        columnIds = [f"column{i}" for i in range(len(columns))]
+        self.tree = ttk.Treeview(self, columns=columnIds, show='headings', height=visibleRows)
+        for columnId, heading in zip(columnIds, columns):
+            self.tree.heading(columnId, text=heading)
+            self.tree.column(columnId, width=columnWidth, anchor=tk.W)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+        self.columnconfigure(0, weight=1)
+
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self.onMouseWheel)
+
+    # Model updates
+    def setRow(self, key, values):
+        """Add or replace a row"""
+        if key not in self.values:
+            insort(self.keys, key)
+        self.values[key] = tuple(values)
+        self.scheduleRender()
+
+    def removeRow(self, key):
+        """Remove a row if present"""
+        if key in self.values:
+            del self.values[key]
+            del self.keys[bisect_left(self.keys, key)]
+            self.scheduleRender()
+
+    def removeRows(self, predicate):
+        """Remove every row whose key matches predicate(key)"""
+        self.keys = [key for key in self.keys if not predicate(key)]
+        self.values = {key: self.values[key] for key in self.keys}
+        self.scheduleRender()
+
+    # Rendering
+    def scheduleRender(self):
+        """Render once when Tk is idle, however many rows changed"""
+        if not self.renderPending:
+            self.renderPending = True
+            self.after_idle(self.render)
+
+    def render(self):
+        """Fill the Treeview with the rows in the visible window"""
+        self.renderPending = False
+        maxOffset = max(len(self.keys) - self.visibleRows, 0)
+        self.offset = min(max(self.offset, 0), maxOffset)
+
+        self.tree.delete(*self.tree.get_children())
+        for key in self.keys[self.offset:self.offset + self.visibleRows]:
+            self.tree.insert('', tk.END, values=self.values[key])
+
+        total = len(self.keys)
+        if total:
+            self.scrollbar.set(self.offset / total, min((self.offset + self.visibleRows) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    # Scrolling
+    def yview(self, *args):
+        """Scrollbar command: 'moveto fraction' or 'scroll n units|pages'"""
+        if args[0] == 'moveto':
+            self.offset = int(float(args[1]) * len(self.keys))
+        elif args[0] == 'scroll':
+            step = self.visibleRows if args[2] == 'pages' else 1
+            self.offset += int(args[1]) * step
+        self.render()
+
+    def onMouseWheel(self, event):
+        """Scroll three rows per wheel notch (Windows/macOS and X11)"""
+        if event.num == 4 or event.delta > 0:
+            self.offset -= 3
+        else:
+            self.offset += 3
+        self.render()
+        return "break"
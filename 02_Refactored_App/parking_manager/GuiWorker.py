@@ -0,0 +1,74 @@
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+class LotWorker:
+    """
+    Runs parking lot operations off the Tk event thread
+
+    Every operation goes to a single background thread, so the lot has
+    exactly one writer and needs no locking for GUI use. Results and
+    errors are queued and handed to callbacks on the Tk thread, polled
+    with root.after (Tk widgets must only be touched from that thread).
+    """
+
+    def __init__(self, root, pollMs=20):
+        """
+        Args:
+            root: Tk root window used to schedule result polling
+            pollMs: How often finished results are delivered, in ms
+        """
+        self.root = root
+        self.pollMs = pollMs
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parking-lot")
+        self.results = queue.SimpleQueue()
+        self.running = True
+        self.root.after(self.pollMs, self.deliverResults)
+
+    def submit(self, operation, onDone=None, onError=None):
+        """
+        Run operation() on the worker thread
+
+        Args:
+            operation: Callable doing the lot work
+            onDone: Called on the Tk thread with the result
+            onError: Called on the Tk thread with the exception
+        """
+        future = self.executor.submit(operation)
+        future.add_done_callback(lambda done: self.results.put((done, onDone, onError)))
+
+    def callInGui(self, func, *args):
+        """Schedule func(*args) on the Tk thread (safe from any thread)"""
+        self.results.put((None, lambda _: func(*args), None))
+
+    def deliverResults(self):
+        """
+        Tk thread: run the callbacks of every finished operation
+
+        A callback that raises is reported like any Tk callback error and
+        does not stop the others, nor the polling.
+        """
+        try:
+            while True:
+                try:
+                    future, onDone, onError = self.results.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    error = future.exception() if future is not None else None
+                    if error is not None:
+                        if onError is not None:
+                            onError(error)
+                    elif onDone is not None:
+                        onDone(future.result() if future is not None else None)
+                except Exception:
+                    self.root.report_callback_exception(*sys.exc_info())
+        finally:
+            if self.running:
+                self.root.after(self.pollMs, self.deliverResults)
+
+    def shutdown(self):
+        """Stop polling and let queued operations finish"""
+        self.running = False
+        self.executor.shutdown(wait=True)
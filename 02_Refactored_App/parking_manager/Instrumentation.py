@@ -0,0 +1,357 @@
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .LatencyHistogram import LatencyHistogram
+from .ParkingLot import ParkingLot
+
+# PARKING_METRICS=<target> turns instrumentation on for the whole process:
+#   metrics.json / metrics.prom   file rewritten every PARKING_METRICS_INTERVAL
+#                                 seconds (default 10) and at exit
+#   http://127.0.0.1:9464         local endpoint serving /metrics (Prometheus)
+#                                 and /metrics.json
+ENV_VAR = 'PARKING_METRICS'
+INTERVAL_ENV_VAR = 'PARKING_METRICS_INTERVAL'
+PROMETHEUS_SUFFIXES = ('.prom', '.txt')
+
+# ParkingLot methods timed into one histogram each
+TIMED_METHODS = (
+    'createParkingLot', 'park', 'parkAt', 'parkMany', 'leave', 'leaveMany',
+    'findByRegNum', 'findByColor', 'find', 'getStatus', 'getStatusChanges',
+    'updateCharges',
+)
+
+class Metrics:
+    """
+    Latency histograms and counters for ParkingLot operations
+
+    IMPROVEMENT: Nothing is measured unless install() is called (see
+    installFromEnvironment), so an uninstrumented lot pays no cost at all.
+    Once installed, each call costs two perf_counter() reads and one
+    O(1) histogram update under a lock, safe for the GUI worker and
+    ConcurrentParkingLot threads.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operations = {}   # method name -> LatencyHistogram
+        self.observers = {}    # observer class name -> LatencyHistogram of update() time
+        self.counters = {'rejectedFull.regular': 0, 'rejectedFull.electric': 0}
+        self.active = threading.local()   # names being timed on this thread
+        self.patched = []                 # (class, name, original) to undo install()
+
+    def record(self, histograms, name, seconds):
+        with self.lock:
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = histograms[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    # Installation
+    def install(self, lotClass=ParkingLot):
+        """Time the methods of lotClass, its subclasses and subclasses defined later"""
+        self.patched = patchLotClasses(self._wrap, lotClass)
+        return self
+
+    def uninstall(self):
+        """Put every patched method back"""
+        unpatch(self.patched)
+        self.patched = []
+
+    def _wrap(self, cls, name, method):
+        if name == 'notifyObservers':
+            return self._timedNotify(method)
+        if name in TIMED_METHODS:
+            return self._timed(name, method)
+        return None
+
+    def _timed(self, name, method):
+        """
+        Wrap one method; a subclass override calling super() is timed once
+        (the outermost call), not once per class
+        """
+        metrics = self
+        operations = self.operations
+        active = self.active
+        clock = time.perf_counter
+        countRejections = name in ('park', 'parkMany')
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            inProgress = active.__dict__.setdefault('names', set())
+            if name in inProgress:
+                return method(*args, **kwargs)
+
+            inProgress.add(name)
+            start = clock()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                inProgress.discard(name)
+                metrics.record(operations, name, elapsed)
+
+            if countRejections:
+                rejected = result is None if name == 'park' else result.count(None)
+                if rejected:
+                    isElectric = kwargs.get('isElectric', args[2] if len(args) > 2 else False)
+                    metrics.count('rejectedFull.electric' if isElectric else 'rejectedFull.regular', rejected)
+            return result
+
+        return wrapper
+
+    def _timedNotify(self, method):
+        """notifyObservers timed as a whole and per observer class"""
+        metrics = self
+        operations = self.operations
+        observerTimes = self.observers
+        clock = time.perf_counter
+
+        @functools.wraps(method)
+        def notifyObservers(lot, event):
+            start = clock()
+            for observer in lot.observers:
+                observerStart = clock()
+                observer.update(event)
+                metrics.record(observerTimes, type(observer).__name__, clock() - observerStart)
+            metrics.record(operations, 'notifyObservers', clock() - start)
+
+        return notifyObservers
+
+    # Export
+    def asDict(self):
+        """JSON-able snapshot: summaries plus cumulative buckets"""
+        def histograms(source):
+            result = {}
+            for name, histogram in sorted(source.items()):
+                entry = histogram.summary()
+                entry['total'] = histogram.total
+                entry['buckets'] = histogram.buckets()
+                result[name] = entry
+            return result
+
+        with self.lock:
+            return {
+                'unit': 'seconds',
+                'operations': histograms(self.operations),
+                'observers': histograms(self.observers),
+                'counters': dict(self.counters),
+            }
+
+    def toJson(self):
+        return json.dumps(self.asDict(), indent=2)
+
+    def toPrometheus(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+
+        def histogramLines(metric, label, source, description):
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in sorted(source.items()):
+                labels = f'{label}="{name}"'
+                for upperBound, cumulative in histogram.buckets():
+                    lines.append(f'{metric}_bucket{{{labels},le="{upperBound:.6g}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f'{metric}_sum{{{labels}}} {histogram.total:.9f}')
+                lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+
+        with self.lock:
+            histogramLines('parking_operation_seconds', 'operation', self.operations,
+                           "Time spent in ParkingLot operations")
+            histogramLines('parking_observer_seconds', 'observer', self.observers,
+                           "Time spent in observer update() calls")
+            lines.append("# HELP parking_rejected_full_total Vehicles turned away because the pool was full")
+            lines.append("# TYPE parking_rejected_full_total counter")
+            for name, value in sorted(self.counters.items()):
+                if name.startswith('rejectedFull.'):
+                    pool = name.split('.', 1)[1]
+                    lines.append(f'parking_rejected_full_total{{pool="{pool}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """
+        Write the metrics to a file, atomically
+
+        Files ending in .prom or .txt get the Prometheus text format
+        (e.g. for node_exporter's textfile collector), anything else JSON.
+        """
+        text = self.toPrometheus() if path.endswith(PROMETHEUS_SUFFIXES) else self.toJson()
+        temporary = path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temporary, path)
+
+    def startFileExport(self, path, intervalSeconds=10.0):
+        """
+        Rewrite `path` every intervalSeconds (daemon thread) and at exit
+
+        Raises:
+            ValueError: If intervalSeconds is not positive
+            OSError: If the file cannot be written (checked right away
+                with a first, empty dump)
+        """
+        if not intervalSeconds > 0:
+            raise ValueError(f"Metrics interval must be positive, not {intervalSeconds}")
+        self.dump(path)
+        stopped = threading.Event()
+
+        def dumpOrWarn():
+            try:
+                self.dump(path)
+            except OSError as e:
+                sys.stderr.write(f"warning: could not write metrics to {path}: {e}\n")
+
+        def loop():
+            while not stopped.wait(intervalSeconds):
+                dumpOrWarn()
+
+        def final():
+            stopped.set()
+            dumpOrWarn()
+
+        threading.Thread(target=loop, name="metrics-export", daemon=True).start()
+        atexit.register(final)
+
+    def serve(self, host='127.0.0.1', port=9464):
+        """
+        Serve /metrics (Prometheus) and /metrics.json from a daemon thread
+
+        Returns:
+            The HTTP server (server_address holds the bound port)
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body, contentType = metrics.toPrometheus(), 'text/plain; version=0.0.4'
+                elif self.path == '/metrics.json':
+                    body, contentType = metrics.toJson(), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', contentType)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass   # scrapes would flood the console
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+def patchLotClasses(wrap, lotClass=ParkingLot):
+    """
+    Replace methods of lotClass, of its subclasses and of subclasses
+    defined later (through __init_subclass__)
+
+    Args:
+        wrap: Callable(cls, name, method) returning the replacement, or
+            None to leave that method alone; called for each method
+            defined directly in each class
+        lotClass: Root class to patch
+
+    Returns:
+        List of (class, name, original) for unpatch()
+    """
+    patched = []
+
+    def patchClass(cls):
+        for name, method in list(cls.__dict__.items()):
+            if callable(method) and not name.startswith('__'):
+                replacement = wrap(cls, name, method)
+                if replacement is not None:
+                    patched.append((cls, name, method))
+                    setattr(cls, name, replacement)
+
+    def classTree(cls):
+        yield cls
+        for subclass in cls.__subclasses__():
+            yield from classTree(subclass)
+
+    for cls in list(classTree(lotClass)):
+        patchClass(cls)
+
+    originalHook = lotClass.__dict__.get('__init_subclass__')
+
+    def initSubclass(cls, **kwargs):
+        if originalHook is not None:
+            originalHook.__get__(None, cls)(**kwargs)
+        else:
+            super(lotClass, cls).__init_subclass__(**kwargs)
+        patchClass(cls)
+
+    lotClass.__init_subclass__ = classmethod(initSubclass)
+    patched.append((lotClass, '__init_subclass__', originalHook))
+    return patched
+
+def unpatch(patched):
+    """Undo patchLotClasses()"""
+    for cls, name, original in reversed(patched):
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+# The process-wide Metrics once installed, None otherwise
+metrics = None
+
+def install(target=None, intervalSeconds=10.0):
+    """
+    Instrument ParkingLot (once per process) and start exporting
+
+    Args:
+        target: File path (.json, or .prom/.txt for Prometheus text),
+            'http://host:port' for a local endpoint, or None to only
+            collect (read Instrumentation.metrics yourself)
+        intervalSeconds: How often a file target is rewritten
+
+    Returns:
+        The Metrics instance
+    """
+    global metrics
+    if metrics is None:
+        # Export first: if the file or port is unusable nothing gets patched
+        newMetrics = Metrics()
+        if target:
+            if target.startswith('http://'):
+                address = urlsplit(target)
+                newMetrics.serve(address.hostname or '127.0.0.1', address.port or 9464)
+            else:
+                newMetrics.startFileExport(target, intervalSeconds)
+        metrics = newMetrics.install()
+    return metrics
+
+def installFromEnvironment():
+    """
+    Install when PARKING_METRICS is set; does nothing (and costs nothing) otherwise
+
+    Metrics are optional: a bad setting (unwritable file, busy port,
+    malformed interval) is reported on stderr and the process carries on
+    uninstrumented instead of failing to import.
+    """
+    target = os.environ.get(ENV_VAR)
+    if not target:
+        return None
+    try:
+        return install(target, float(os.environ.get(INTERVAL_ENV_VAR, 10.0)))
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"warning: {ENV_VAR}={target}: metrics disabled: {e}\n")
+        return None
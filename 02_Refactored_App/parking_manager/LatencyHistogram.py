@@ -0,0 +1,93 @@
+import math
+
+class LatencyHistogram:
+    """
+    Fixed-memory latency histogram with log-scale buckets
+
+    IMPROVEMENT: Recording is O(1) and memory is constant however many
+    samples are recorded; percentiles are accurate to one bucket
+    (about 19% with 4 buckets per power of two), the mean and maximum
+    are exact.
+    """
+
+    BUCKETS_PER_OCTAVE = 4
+    MIN_SECONDS = 1e-7      # everything faster lands in bucket 0
+    OCTAVES = 32            # 100 ns .. ~7 minutes
+
+    def __init__(self):
+        self.counts = [0] * (self.BUCKETS_PER_OCTAVE * self.OCTAVES + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def bucketIndex(self, seconds):
+        """Bucket holding a duration"""
+        if seconds <= self.MIN_SECONDS:
+            return 0
+        index = int(math.log2(seconds / self.MIN_SECONDS) * self.BUCKETS_PER_OCTAVE) + 1
+        return min(index, len(self.counts) - 1)
+
+    def upperBound(self, index):
+        """Largest duration (seconds) counted in a bucket"""
+        return self.MIN_SECONDS * 2 ** (index / self.BUCKETS_PER_OCTAVE)
+
+    def record(self, seconds):
+        """Add one duration in seconds"""
+        self.counts[self.bucketIndex(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other):
+        """Add every sample of another histogram"""
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        """
+        Duration below which `fraction` of the samples fall
+
+        Args:
+            fraction: 0.0 - 1.0 (0.99 for p99)
+
+        Returns:
+            Upper bound of the bucket reaching that rank (capped at the
+            exact maximum), or 0.0 without samples
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, bucketCount in enumerate(self.counts):
+            seen += bucketCount
+            if seen >= rank:
+                return min(self.upperBound(index), self.max)
+        return self.max
+
+    def buckets(self):
+        """Non-empty buckets as (upper bound seconds, cumulative count)"""
+        cumulative = 0
+        result = []
+        for index, bucketCount in enumerate(self.counts):
+            if bucketCount:
+                cumulative += bucketCount
+                result.append((self.upperBound(index), cumulative))
+        return result
+
+    def summary(self):
+        """Dictionary of count, mean, p50, p90, p99 and max (seconds)"""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'p50': self.percentile(0.50),
+            'p90': self.percentile(0.90),
+            'p99': self.percentile(0.99),
+            'max': self.max,
+        }
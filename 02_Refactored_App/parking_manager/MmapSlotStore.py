@@ -0,0 +1,237 @@
+import mmap
+import operator
+import os
+import struct
+import weakref
+from itertools import compress
+
+from .Vehicle import VehicleFactory, VehicleType
+
+class MmapSlotStore:
+    """
+    Slot store backed by a memory-mapped file of fixed-width records
+
+    Drop-in replacement for the plain list ParkingLot uses per slot pool
+    (store[i] / store[i] = vehicle), for lots with hundreds of thousands
+    of bays:
+    - no Python object per slot: a slot is one 128 byte record in the
+      page cache, so memory use does not grow with the Python heap
+    - status scans read the mapping in place: the type codes through a
+      strided memoryview (no copy), and only occupied records are unpacked
+    - reopening an existing file maps it instead of parsing it, so the
+      slots are available at once (see ParkingLot.adoptSlotStores)
+    - other processes can open the same file read-only and see updates
+
+    Record: type code (0 = empty slot), charge, then registration number,
+    make, model and color as fixed-width UTF-8 fields. The type code is
+    written last when parking, and cleared alone when leaving, so a
+    reader never sees a half-written vehicle as occupied.
+
+    Field limits (UTF-8 bytes): registration number 24, make 32, model 32,
+    color 36. Longer values raise ValueError and leave the lot unchanged
+    (see checkVehicle), where the in-memory stores would accept them.
+    """
+
+    MAGIC = b"PKSLOTS2"
+    HEADER = struct.Struct('<8sQ?7x')                  # magic, capacity, isElectric
+    RECORD = struct.Struct('<Bb2x24s32s32s36s')        # 128 bytes per slot
+    FIELD_SIZES = {'regNum': 24, 'make': 32, 'model': 32, 'color': 36}
+
+    # Type code 0 means "empty slot"
+    VEHICLE_TYPES = list(VehicleType)
+    TYPE_CODES = {vehicleType.value: code for code, vehicleType in enumerate(VEHICLE_TYPES, 1)}
+
+    # Writable stores open in this process, by real path
+    _writers = weakref.WeakValueDictionary()
+
+    def __init__(self, path, capacity=None, isElectric=False, reset=False, readOnly=False):
+        """
+        Open (or create) a slot file
+
+        Args:
+            path: Slot file
+            capacity: Number of slots; None opens an existing file with
+                its stored capacity
+            isElectric: True for the EV pool (only used when creating)
+            reset: Start with every slot empty even if the file exists.
+                The empty file replaces the old one, so readers that
+                still map the old file keep valid (stale) pages.
+            readOnly: Map the file read-only (for other processes)
+
+        Raises:
+            ValueError: If reset is asked for a file another open store
+                of this process maps (close that store first)
+        """
+        self.path = path
+        self.readOnly = readOnly
+
+        if not readOnly and (reset or not os.path.exists(path)):
+            self._create(capacity, isElectric)
+        else:
+            self._open(capacity)
+
+    @classmethod
+    def factory(cls, directory, prefix='lot'):
+        """
+        slotStoreFactory for ParkingLot: one file per level and pool in directory
+
+        Stores made by the factory always start empty (a created lot is
+        empty); reopen the files with pathFor() to restore a lot.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        def newStore(capacity, isElectric, level=None):
+            return cls(cls.pathFor(directory, prefix, isElectric, level), capacity, isElectric, reset=True)
+        newStore.perLevel = True   # ParkingLot.newSlotStore passes the lot's level
+        return newStore
+
+    @staticmethod
+    def pathFor(directory, prefix, isElectric, level=None):
+        """File used by factory() for one pool (of one level)"""
+        levelPart = "" if level is None else f"-L{level}"
+        return os.path.join(directory, f"{prefix}{levelPart}-{'ev' if isElectric else 'regular'}.slots")
+
+    def _create(self, capacity, isElectric):
+        if os.path.realpath(self.path) in self._writers:
+            raise ValueError(f"{self.path} is mapped by an open slot store; close it before resetting")
+
+        # Build the empty file beside the old one and swap it in: a reader
+        # mapping the old file must not see it truncated under it (SIGBUS)
+        temporary = self.path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, capacity, bool(isElectric)))
+            f.truncate(self.HEADER.size + capacity * self.RECORD.size)  # zero-filled: all empty
+        os.replace(temporary, self.path)
+        self._open(capacity)
+
+    def _open(self, capacity):
+        mode = 'rb' if self.readOnly else 'r+b'
+        with open(self.path, mode) as f:
+            access = mmap.ACCESS_READ if self.readOnly else mmap.ACCESS_WRITE
+            self._map = mmap.mmap(f.fileno(), 0, access=access)
+
+        magic, storedCapacity, isElectric = self.HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f"{self.path} is not a slot file")
+        if capacity is not None and capacity != storedCapacity:
+            raise ValueError(f"{self.path} has {storedCapacity} slots, expected {capacity}")
+
+        self.capacity = storedCapacity
+        self.isElectric = isElectric
+        self._records = memoryview(self._map)[self.HEADER.size:]
+        self._typeCodes = self._records[::self.RECORD.size]   # first byte of every record
+        if not self.readOnly:
+            self._writers[os.path.realpath(self.path)] = self
+
+    def __len__(self):
+        return self.capacity
+
+    def _offset(self, slotIndex):
+        if not 0 <= slotIndex < self.capacity:
+            raise IndexError("slot index out of range")
+        return slotIndex * self.RECORD.size
+
+    def __getitem__(self, slotIndex):
+        """Rebuild the vehicle in a slot, or None if the slot is empty"""
+        return self._vehicle(self.RECORD.unpack_from(self._records, self._offset(slotIndex)))
+
+    def __setitem__(self, slotIndex, vehicle):
+        """Store a vehicle in a slot, or clear it with None"""
+        offset = self._offset(slotIndex)
+        if vehicle is None:
+            self._records[offset] = 0
+            return
+
+        fields = self.checkVehicle(vehicle)
+        # Everything but the type code first, so readers never see a partial vehicle
+        self.RECORD.pack_into(self._records, offset, 0, getattr(vehicle, 'charge', 0), *fields)
+        self._records[offset] = self.TYPE_CODES[vehicle.getType()]
+
+    @classmethod
+    def checkVehicle(cls, vehicle):
+        """
+        Encode the text fields of a vehicle for its record
+
+        ParkingLot.parkMany calls it while validating a batch, so a
+        vehicle that does not fit parks nothing; park() gets the same
+        ValueError from store[i] = vehicle and releases the slot again.
+
+        Returns:
+            List of encoded regNum, make, model and color
+
+        Raises:
+            ValueError: If a field is longer than FIELD_SIZES allows
+        """
+        fields = []
+        for name, value in (
+            ('regNum', vehicle.regNum), ('make', vehicle.make),
+            ('model', vehicle.model), ('color', vehicle.color)
+        ):
+            encoded = value.encode('utf-8')
+            if len(encoded) > cls.FIELD_SIZES[name]:
+                raise ValueError(f"{name} '{value}' is longer than {cls.FIELD_SIZES[name]} bytes")
+            fields.append(encoded)
+        return fields
+
+    def _vehicle(self, record):
+        typeCode, charge, regNum, make, model, color = record
+        if typeCode == 0:
+            return None
+        return VehicleFactory.createVehicle(
+            self.VEHICLE_TYPES[typeCode - 1],
+            regNum.rstrip(b"\0").decode('utf-8'),
+            make.rstrip(b"\0").decode('utf-8'),
+            model.rstrip(b"\0").decode('utf-8'),
+            color.rstrip(b"\0").decode('utf-8'),
+            charge
+        )
+
+    def __iter__(self):
+        """Vehicles (or None) in slot order, unpacked straight from the mapping"""
+        vehicle = self._vehicle
+        for record in self.RECORD.iter_unpack(self._records):
+            yield vehicle(record) if record[0] else None
+
+    def statusRows(self, level):
+        """
+        ParkingLot status rows read straight from the records
+
+        The type codes are scanned in place to find occupied slots; only
+        those records are unpacked, and no vehicle objects are built (see
+        ParkingLot._poolStatus).
+        """
+        unpack = self.RECORD.unpack_from
+        records = self._records
+        recordSize = self.RECORD.size
+        rows = []
+        for slotIndex in compress(range(self.capacity), self._typeCodes):
+            _, charge, regNum, make, model, color = unpack(records, slotIndex * recordSize)
+            row = {
+                'slot': slotIndex + 1,
+                'level': level,
+                'registration': regNum.rstrip(b"\0").decode('utf-8'),
+                'color': color.rstrip(b"\0").decode('utf-8'),
+                'make': make.rstrip(b"\0").decode('utf-8'),
+                'model': model.rstrip(b"\0").decode('utf-8')
+            }
+            if self.isElectric:
+                row['charge'] = charge
+            rows.append(row)
+        return rows
+
+    def occupiedCount(self):
+        """Number of occupied slots (counts the type codes in place)"""
+        return self.capacity - operator.countOf(self._typeCodes, 0)
+
+    def flush(self):
+        """Write dirty pages to disk"""
+        if not self.readOnly:
+            self._map.flush()
+
+    def close(self):
+        """Unmap the file"""
+        if not self.readOnly and self._writers.get(os.path.realpath(self.path)) is self:
+            del self._writers[os.path.realpath(self.path)]
+        self._typeCodes.release()
+        self._records.release()
+        self._map.close()
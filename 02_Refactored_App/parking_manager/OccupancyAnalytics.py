@@ -0,0 +1,204 @@
+"""
+Vectorized occupancy analytics (requires NumPy)
+
+Only this module needs NumPy; the rest of the package does not import it.
+"""
+import numpy as np
+
+from .AttributeIndex import AttributeIndex
+from .ColumnarSlotStore import ColumnarSlotStore
+from .ParkingLot import ParkingObserver
+from .ParkingEvents import LotCreated, Parked, Left, ParkedBatch, LeftBatch, ChargesUpdated
+from .Vehicle import ElectricVehicle, VehicleType
+
+class PoolArrays:
+    """NumPy mirror of one slot pool: one array entry per slot"""
+    __slots__ = ('occupied', 'typeCodes', 'charges', 'colorCodes')
+
+    def __init__(self, capacity):
+        self.occupied = np.zeros(capacity, dtype=bool)
+        self.typeCodes = np.zeros(capacity, dtype=np.uint8)   # ColumnarSlotStore codes
+        self.charges = np.zeros(capacity, dtype=np.int8)
+        self.colorCodes = np.zeros(capacity, dtype=np.int32)  # index into colors
+
+class OccupancyAnalytics(ParkingObserver):
+    """
+    Answers aggregate occupancy questions with vectorized NumPy operations
+
+    IMPROVEMENT: Slot state is mirrored into arrays (occupancy mask, type
+    codes, charge levels, color codes) kept current as an observer, so
+    "free slots per level", "EVs below 20% charge" or "counts by color"
+    cost one array operation instead of a Python loop over every slot.
+
+    Works on one ParkingLot or a whole Facility (every level, including
+    levels created later). Charge changes made through
+    ParkingLot.updateCharges() arrive as ChargesUpdated events; call
+    setCharges() after changing vehicles' charge any other way.
+    """
+
+    TYPE_NAMES = [vehicleType.value for vehicleType in ColumnarSlotStore.VEHICLE_TYPES]
+    ELECTRIC_TYPE_CODES = [
+        ColumnarSlotStore.TYPE_CODES[vehicleType.value]
+        for vehicleType in (VehicleType.ELECTRIC_CAR, VehicleType.ELECTRIC_BIKE)
+    ]
+
+    def __init__(self, source=None):
+        """
+        Args:
+            source: Optional ParkingLot or Facility to mirror (see attach)
+        """
+        self.pools = {}        # (level, isElectric) -> PoolArrays
+        self.colors = []       # color code -> normalized color
+        self.colorCodes = {}   # normalized color -> color code
+        if source is not None:
+            self.attach(source)
+
+    def attach(self, source):
+        """Copy the current state of a lot or facility, then observe it"""
+        lots = source.levels.values() if hasattr(source, 'levels') else (source,)
+        for lot in lots:
+            self.load(lot)
+        source.attachObserver(self)
+
+    def load(self, lot):
+        """Copy every slot of a lot into fresh arrays (one Python scan)"""
+        for isElectric, slots in ((False, lot.slots), (True, lot.evSlots)):
+            pool = PoolArrays(len(slots))
+            self.pools[(lot.level, isElectric)] = pool
+            for slotIndex, vehicle in enumerate(slots):
+                if vehicle is not None:
+                    self._store(pool, slotIndex, vehicle)
+
+    def colorCode(self, color):
+        """Stable small integer for a (normalized) color"""
+        color = AttributeIndex.normalize(color)
+        code = self.colorCodes.get(color)
+        if code is None:
+            code = len(self.colors)
+            self.colors.append(color)
+            self.colorCodes[color] = code
+        return code
+
+    def _store(self, pool, slotIndex, vehicle):
+        pool.occupied[slotIndex] = True
+        pool.typeCodes[slotIndex] = ColumnarSlotStore.TYPE_CODES[vehicle.getType()]
+        pool.charges[slotIndex] = vehicle.charge if isinstance(vehicle, ElectricVehicle) else 0
+        pool.colorCodes[slotIndex] = self.colorCode(vehicle.color)
+
+    # Observer Pattern: keep the arrays current
+    def update(self, event):
+        """Apply one event (or batch of events) to the arrays"""
+        if isinstance(event, Parked):
+            pool = self.pools.get((event.level, event.isElectric))
+            if pool is not None:
+                self._store(pool, event.slotNumber - 1, event.vehicle)
+        elif isinstance(event, Left):
+            pool = self.pools.get((event.level, event.isElectric))
+            if pool is not None:
+                pool.occupied[event.slotNumber - 1] = False
+        elif isinstance(event, ParkedBatch):
+            self._parkBatch(event)
+        elif isinstance(event, LeftBatch):
+            pool = self.pools.get((event.level, event.isElectric))
+            if pool is not None and event.slotNumbers:
+                pool.occupied[np.asarray(event.slotNumbers) - 1] = False
+        elif isinstance(event, ChargesUpdated):
+            if (event.level, True) in self.pools:
+                self.setCharges(event.level, event.slotNumbers, event.charges)
+        elif isinstance(event, LotCreated):
+            self.pools[(event.level, False)] = PoolArrays(event.capacity)
+            self.pools[(event.level, True)] = PoolArrays(event.evCapacity)
+        elif hasattr(event, 'events'):
+            for single in event.events():
+                self.update(single)
+
+    def _parkBatch(self, event):
+        """Write a whole ParkedBatch with fancy indexing"""
+        pool = self.pools.get((event.level, event.isElectric))
+        if pool is None:
+            return
+        placed = [
+            (slotNumber - 1, vehicle)
+            for slotNumber, vehicle in zip(event.slotNumbers, event.vehicles)
+            if slotNumber is not None
+        ]
+        if not placed:
+            return
+
+        slotIndexes = np.fromiter((slotIndex for slotIndex, _ in placed), dtype=np.intp, count=len(placed))
+        pool.occupied[slotIndexes] = True
+        pool.typeCodes[slotIndexes] = [
+            ColumnarSlotStore.TYPE_CODES[vehicle.getType()] for _, vehicle in placed
+        ]
+        pool.charges[slotIndexes] = [
+            vehicle.charge if isinstance(vehicle, ElectricVehicle) else 0 for _, vehicle in placed
+        ]
+        pool.colorCodes[slotIndexes] = [self.colorCode(vehicle.color) for _, vehicle in placed]
+
+    def setCharges(self, level, slotNumbers, charges, isElectric=True):
+        """Record new charge levels for many slots at once"""
+        pool = self.pools[(level, isElectric)]
+        pool.charges[np.asarray(slotNumbers) - 1] = charges
+
+    # Aggregate queries
+    def _selected(self, level=None, isElectric=None):
+        """(level, isElectric, pool) for the pools a query covers"""
+        return [
+            (poolLevel, poolIsElectric, pool)
+            for (poolLevel, poolIsElectric), pool in sorted(self.pools.items())
+            if (level is None or poolLevel == level) and
+               (isElectric is None or poolIsElectric == isElectric)
+        ]
+
+    def freeCounts(self):
+        """
+        Returns:
+            {level: {'regular': free slots, 'electric': free EV slots}}
+        """
+        counts = {}
+        for level, isElectric, pool in self._selected():
+            free = pool.occupied.size - int(np.count_nonzero(pool.occupied))
+            counts.setdefault(level, {})['electric' if isElectric else 'regular'] = free
+        return counts
+
+    def occupancyRate(self, level=None, isElectric=None):
+        """Occupied share of the selected slots (0.0 for no slots)"""
+        pools = self._selected(level, isElectric)
+        total = sum(pool.occupied.size for _, _, pool in pools)
+        if total == 0:
+            return 0.0
+        return sum(int(np.count_nonzero(pool.occupied)) for _, _, pool in pools) / total
+
+    def lowCharge(self, threshold, level=None):
+        """
+        Electric vehicles in EV slots charged below a threshold
+
+        Returns:
+            List of tuples: (level, slotNumber), by level then slot
+        """
+        results = []
+        for poolLevel, _, pool in self._selected(level, True):
+            isElectricVehicle = np.isin(pool.typeCodes, self.ELECTRIC_TYPE_CODES)
+            mask = pool.occupied & isElectricVehicle & (pool.charges < threshold)
+            results.extend((poolLevel, int(slotIndex) + 1) for slotIndex in np.flatnonzero(mask))
+        return results
+
+    def countsByColor(self, level=None, isElectric=None):
+        """
+        Returns:
+            {normalized color: number of parked vehicles}
+        """
+        totals = np.zeros(len(self.colors), dtype=np.int64)
+        for _, _, pool in self._selected(level, isElectric):
+            totals += np.bincount(pool.colorCodes[pool.occupied], minlength=len(self.colors))
+        return {self.colors[code]: int(count) for code, count in enumerate(totals) if count}
+
+    def countsByType(self, level=None, isElectric=None):
+        """
+        Returns:
+            {vehicle type name: number of parked vehicles}
+        """
+        totals = np.zeros(len(self.TYPE_NAMES) + 1, dtype=np.int64)
+        for _, _, pool in self._selected(level, isElectric):
+            totals += np.bincount(pool.typeCodes[pool.occupied], minlength=len(totals))
+        return {name: int(totals[code]) for code, name in enumerate(self.TYPE_NAMES, 1) if totals[code]}
@@ -0,0 +1,171 @@
+import time
+from abc import ABC, abstractmethod
+
+### Events delivered to ParkingObserver.update (Observer Pattern)
+# Events carry data only; message text is rendered on demand by observers
+# that want it (str(event)), so metrics/audit observers never pay for it.
+
+def slotLabel(isElectric):
+    """Slot pool name used in messages"""
+    return "EV" if isElectric else "regular"
+
+class ParkingEvent(ABC):
+    """Abstract base class for parking lot events"""
+    # ABC declares empty __slots__, so events still have no __dict__
+    __slots__ = ('level', 'timestamp')
+
+    def __init__(self, level, timestamp=None):
+        """
+        Args:
+            level: Floor level of the lot that raised the event
+            timestamp: Seconds since the epoch (defaults to now)
+        """
+        self.level = level
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    @abstractmethod
+    def message(self):
+        """Human readable description of the event"""
+
+    def __str__(self):
+        return self.message()
+
+class LotCreated(ParkingEvent):
+    """A lot was created (or re-created) with new capacities"""
+    __slots__ = ('capacity', 'evCapacity')
+
+    def __init__(self, level, capacity, evCapacity, timestamp=None):
+        super().__init__(level, timestamp)
+        self.capacity = capacity
+        self.evCapacity = evCapacity
+
+    def message(self):
+        return (
+            f"Created parking lot with {self.capacity} regular slots and "
+            f"{self.evCapacity} EV slots on level: {self.level}"
+        )
+
+class Parked(ParkingEvent):
+    """A vehicle was parked in a slot"""
+    __slots__ = ('vehicle', 'slotNumber', 'isElectric')
+
+    def __init__(self, level, vehicle, slotNumber, isElectric, timestamp=None):
+        super().__init__(level, timestamp)
+        self.vehicle = vehicle
+        self.slotNumber = slotNumber
+        self.isElectric = isElectric
+
+    def message(self):
+        return (
+            f"Vehicle {self.vehicle.regNum} parked "
+            f"in {slotLabel(self.isElectric)} slot {self.slotNumber}"
+        )
+
+class Left(ParkingEvent):
+    """A vehicle left its slot"""
+    __slots__ = ('vehicle', 'slotNumber', 'isElectric')
+
+    def __init__(self, level, vehicle, slotNumber, isElectric, timestamp=None):
+        super().__init__(level, timestamp)
+        self.vehicle = vehicle
+        self.slotNumber = slotNumber
+        self.isElectric = isElectric
+
+    def message(self):
+        return (
+            f"Vehicle {self.vehicle.regNum} removed "
+            f"from {slotLabel(self.isElectric)} slot {self.slotNumber}"
+        )
+
+class ParkedBatch(ParkingEvent):
+    """A batch of vehicles was parked by ParkingLot.parkMany"""
+    __slots__ = ('vehicles', 'slotNumbers', 'isElectric')
+
+    def __init__(self, level, vehicles, slotNumbers, isElectric, timestamp=None):
+        """
+        Args:
+            vehicles: Vehicles in the batch
+            slotNumbers: Slot per vehicle, None where the lot was full
+        """
+        super().__init__(level, timestamp)
+        self.vehicles = vehicles
+        self.slotNumbers = slotNumbers
+        self.isElectric = isElectric
+
+    def events(self):
+        """Yield one Parked event per vehicle that got a slot"""
+        for vehicle, slotNumber in zip(self.vehicles, self.slotNumbers):
+            if slotNumber is not None:
+                yield Parked(self.level, vehicle, slotNumber, self.isElectric, self.timestamp)
+
+    def message(self):
+        turnedAway = self.slotNumbers.count(None)
+        message = (
+            f"{len(self.vehicles) - turnedAway} vehicles parked "
+            f"in {slotLabel(self.isElectric)} slots"
+        )
+        if turnedAway:
+            message += f" ({turnedAway} turned away, lot full)"
+        return message
+
+class LeftBatch(ParkingEvent):
+    """A batch of slots was cleared by ParkingLot.leaveMany"""
+    __slots__ = ('vehicles', 'slotNumbers', 'isElectric')
+
+    def __init__(self, level, vehicles, slotNumbers, isElectric, timestamp=None):
+        """
+        Args:
+            vehicles: Vehicles that left
+            slotNumbers: Slot each of them left
+        """
+        super().__init__(level, timestamp)
+        self.vehicles = vehicles
+        self.slotNumbers = slotNumbers
+        self.isElectric = isElectric
+
+    def events(self):
+        """Yield one Left event per vehicle"""
+        for vehicle, slotNumber in zip(self.vehicles, self.slotNumbers):
+            yield Left(self.level, vehicle, slotNumber, self.isElectric, self.timestamp)
+
+    def message(self):
+        return (
+            f"{len(self.vehicles)} vehicles removed "
+            f"from {slotLabel(self.isElectric)} slots"
+        )
+
+class ChargesUpdated(ParkingEvent):
+    """Charge levels of parked EVs changed (ParkingLot.updateCharges)"""
+    __slots__ = ('slotNumbers', 'charges')
+
+    def __init__(self, level, slotNumbers, charges, timestamp=None):
+        """
+        Args:
+            slotNumbers: EV slots whose vehicle got a new charge
+            charges: New charge (0-100) for each slot
+        """
+        super().__init__(level, timestamp)
+        self.slotNumbers = slotNumbers
+        self.charges = charges
+
+    def message(self):
+        return f"Charge updated for {len(self.slotNumbers)} vehicles in EV slots"
+
+class EventBatch(ParkingEvent):
+    """Several events merged into one delivery (see AsyncObserverDispatcher)"""
+    __slots__ = ('batchedEvents',)
+
+    def __init__(self, batchedEvents, timestamp=None):
+        """
+        Args:
+            batchedEvents: Events in the order they happened
+        """
+        super().__init__(batchedEvents[-1].level, timestamp)
+        self.batchedEvents = batchedEvents
+
+    def events(self):
+        """Yield the merged events in order"""
+        return iter(self.batchedEvents)
+
+    def message(self):
+        return "\n".join(event.message() for event in self.batchedEvents)
@@ -1,17 +1,39 @@
+from collections import deque
+
 from .Vehicle import Vehicle, ElectricVehicle
+from .SlotAllocator import SlotAllocator
+from .AttributeIndex import AttributeIndex
+from .ParkingEvents import LotCreated, Parked, Left, ParkedBatch, LeftBatch, ChargesUpdated, slotLabel
 
 ### DESIGN PATTERN: OBSERVER PATTERN (GoF Behavioral Pattern)
 class ParkingObserver:
     """Observer interface for Observer Pattern"""
-    def update(self, message):
-        """Called when parking lot state changes"""
+    def update(self, event):
+        """
+        Called when parking lot state changes
+
+        Args:
+            event: ParkingEvent describing the change; str(event) renders
+                the message text only for observers that need it
+        """
         pass  # To be implemented by concrete observers
 
 class ParkingLot:
     """ParkingLot class - manages vehicle parking"""
 
-    def __init__(self):
-        """Initialize empty parking lot"""
+    # Number of slot changes kept for getStatusChanges()
+    STATUS_HISTORY = 10000
+
+    def __init__(self, slotStoreFactory=None):
+        """
+        Initialize empty parking lot
+
+        Args:
+            slotStoreFactory: Optional callable(capacity, isElectric) that
+                builds the container for one slot pool, e.g.
+                ColumnarSlotStore. Defaults to a plain list.
+        """
+        self.slotStoreFactory = slotStoreFactory
         self.capacity = 0
         self.evCapacity = 0
         self.level = 0
@@ -20,6 +42,24 @@ class ParkingLot:
         self.numOfOccupiedSlots = 0
         self.numOfOccupiedEvSlots = 0
 
+        # Empty until createParkingLot() sizes them
+        self.slots = []
+        self.evSlots = []
+        self.freeSlots = SlotAllocator(0)
+        self.freeEvSlots = SlotAllocator(0)
+
+        # Registration number index: regNum -> AttributeIndex.encodeKey(slotNumber, isElectric)
+        self.regNumIndex = {}
+
+        # Secondary indexes for color/make/model/type queries
+        self.attributeIndex = AttributeIndex()
+
+        # Status versioning: every park/leave bumps the version and logs
+        # (version, slotNumber, isElectric) so pollers can fetch deltas
+        self.statusVersion = 0
+        self.statusBaseVersion = 0
+        self.statusChanges = deque(maxlen=self.STATUS_HISTORY)
+
         # Observer pattern: list of observers to notify
         self.observers = []
 
@@ -39,15 +79,15 @@ class ParkingLot:
         if observer in self.observers:
             self.observers.remove(observer)
 
-    def notifyObservers(self, message):
+    def notifyObservers(self, event):
         """
         Notify all observers of a change
 
         Args:
-            message: What changed in the parking lot
+            event: ParkingEvent describing what changed in the parking lot
         """
         for observer in self.observers:
-            observer.update(message)
+            observer.update(event)
 
     def createParkingLot(self, capacity, evCapacity, level):
         """
@@ -59,25 +99,99 @@ class ParkingLot:
         self.evCapacity = evCapacity
         self.level = level
 
+        # Stores holding files (MmapSlotStore) are released before new ones are made
+        self.closeSlotStores()
+
         # None is clearer than -1 for "empty slot"
-        self.slots = [None] * capacity
-        self.evSlots = [None] * evCapacity
+        self.slots = self.newSlotStore(capacity, False)
+        self.evSlots = self.newSlotStore(evCapacity, True)
+
+        # Free slot allocators: lowest free slot in O(log n), no scanning
+        self.freeSlots = SlotAllocator(capacity)
+        self.freeEvSlots = SlotAllocator(evCapacity)
+        self.regNumIndex = {}
+        self.attributeIndex = AttributeIndex()
+        self.numOfOccupiedSlots = 0
+        self.numOfOccupiedEvSlots = 0
+
+        # Older versions refer to the previous lot: force a full snapshot
+        self.statusVersion += 1
+        self.statusBaseVersion = self.statusVersion
+        self.statusChanges.clear()
+
+        if self.observers:
+            self.notifyObservers(LotCreated(level, capacity, evCapacity))
+
+        return self.level
+
+    def adoptSlotStores(self, slots, evSlots, level):
+        """
+        Use slot stores that already hold vehicles, e.g. reopened
+        MmapSlotStore files, instead of creating an empty lot
+
+        Free slots, counters and indexes are rebuilt from the stores.
+        Observers are not notified: no vehicle arrived or left.
+
+        Returns:
+            The level
+        """
+        self.capacity = len(slots)
+        self.evCapacity = len(evSlots)
+        self.level = level
+        self.slots = slots
+        self.evSlots = evSlots
+
+        self.freeSlots = SlotAllocator(self.capacity)
+        self.freeEvSlots = SlotAllocator(self.evCapacity)
+        self.regNumIndex = {}
+        self.attributeIndex = AttributeIndex()
+
+        for isElectric, store, freeSlots in ((False, slots, self.freeSlots),
+                                             (True, evSlots, self.freeEvSlots)):
+            for slotIndex, vehicle in enumerate(store):
+                if vehicle is not None:
+                    freeSlots.claim(slotIndex)
+                    key = AttributeIndex.encodeKey(slotIndex + 1, isElectric)
+                    self.regNumIndex[vehicle.regNum] = key
+                    self.attributeIndex.add(vehicle, key)
+
+        self.numOfOccupiedSlots = self.capacity - len(self.freeSlots)
+        self.numOfOccupiedEvSlots = self.evCapacity - len(self.freeEvSlots)
+
+        # Older versions refer to the previous lot: force a full snapshot
+        self.statusVersion += 1
+        self.statusBaseVersion = self.statusVersion
+        self.statusChanges.clear()
 
         return self.level
 
+    def newSlotStore(self, capacity, isElectric):
+        """
+        Build an empty container for one slot pool
+
+        Factories with a true `perLevel` attribute (MmapSlotStore.factory)
+        also receive the lot's level, so every level gets its own storage.
+        """
+        if self.slotStoreFactory is None:
+            return [None] * capacity
+        if getattr(self.slotStoreFactory, 'perLevel', False):
+            return self.slotStoreFactory(capacity, isElectric, self.level)
+        return self.slotStoreFactory(capacity, isElectric)
+
+    def closeSlotStores(self):
+        """Release slot stores that hold resources (those with a close())"""
+        for store in (self.slots, self.evSlots):
+            close = getattr(store, 'close', None)
+            if close is not None:
+                close()
+
     def getEmptySlot(self):
         """Find first empty regular slot"""
-        for i in range(len(self.slots)):
-            if self.slots[i] is None:  # Clearer than == -1
-                return i
-        return None
+        return self.freeSlots.peek()
 
     def getEmptyEvSlot(self):
         """Find first empty EV slot"""
-        for i in range(len(self.evSlots)):
-            if self.evSlots[i] is None:  # Clearer than == -1
-                return i
-        return None
+        return self.freeEvSlots.peek()
 
     def park(self, vehicle, isElectric=False):
         """
@@ -94,49 +208,93 @@ class ParkingLot:
 
         Returns:
             Slot number if successful, None if lot is full
+
+        Raises:
+            ValueError: If a vehicle with the same registration is parked
         """
-        # Check if electric vehicle
-        if isElectric:
-            # Check EV capacity
-            if self.numOfOccupiedEvSlots < self.evCapacity:
-                slotIndex = self.getEmptyEvSlot()
+        # Registration numbers are unique across the whole lot
+        if vehicle.regNum in self.regNumIndex:
+            raise ValueError(f"Vehicle {vehicle.regNum} is already parked")
 
-                if slotIndex is not None:
-                    # Park the vehicle
-                    self.evSlots[slotIndex] = vehicle
-                    self.slotEvId += 1
-                    self.numOfOccupiedEvSlots += 1
+        slotNumber = self._placeVehicle(vehicle, isElectric)
 
-                    # Notify observers (instead of directly updating GUI)
-                    self.notifyObservers(
-                        f"Vehicle {vehicle.regNum} parked "
-                        f"in EV slot {self.slotEvId}"
-                    )
+        if slotNumber is not None and self.observers:
+            # Notify observers (instead of directly updating GUI)
+            self.notifyObservers(Parked(self.level, vehicle, slotNumber, bool(isElectric)))
 
-                    return self.slotEvId
+        # None means the lot is full
+        return slotNumber
 
-        # Regular vehicle
-        else:
-            # Check regular capacity
-            if self.numOfOccupiedSlots < self.capacity:
-                slotIndex = self.getEmptySlot()
+    def parkAt(self, vehicle, slotNumber, isElectric=False):
+        """
+        Park a vehicle in one specific slot
+
+        Used to restore a saved lot (see EventJournal), where every
+        vehicle must come back to the slot it was recorded in.
+
+        Args:
+            vehicle: Vehicle object to park
+            slotNumber: Slot to park in (1-indexed)
+            isElectric: True if it is an EV slot
 
-                if slotIndex is not None:
-                    # Park the vehicle
-                    self.slots[slotIndex] = vehicle
-                    self.slotId += 1
-                    self.numOfOccupiedSlots += 1
+        Returns:
+            The slot number
+
+        Raises:
+            ValueError: If the registration is already parked, or the
+                slot does not exist or is taken
+        """
+        if vehicle.regNum in self.regNumIndex:
+            raise ValueError(f"Vehicle {vehicle.regNum} is already parked")
+
+        if self._placeVehicle(vehicle, isElectric, slotNumber) is None:
+            raise ValueError(f"{slotLabel(isElectric).capitalize()} slot {slotNumber} is not available")
 
-                    # Notify observers (instead of directly updating GUI)
-                    self.notifyObservers(
-                        f"Vehicle {vehicle.regNum} parked "
-                        f"in regular slot {self.slotId}"
-                    )
+        if self.observers:
+            self.notifyObservers(Parked(self.level, vehicle, slotNumber, bool(isElectric)))
 
-                    return self.slotId
+        return slotNumber
 
-        # Lot is full
-        return None
+    def parkMany(self, vehicles, isElectric=False):
+        """
+        Park a batch of vehicles with a single observer notification
+
+        Used to replay gate events or restore a lot after an outage,
+        where one notification per vehicle would dominate the cost.
+
+        Args:
+            vehicles: Iterable of Vehicle objects to park
+            isElectric: True to park them in EV slots
+
+        Returns:
+            List of slot numbers in the same order, None where the lot was full
+
+        Raises:
+            ValueError: If any registration is already parked or repeated
+                in the batch, or the slot store cannot hold a vehicle
+                (nothing is parked in that case)
+        """
+        vehicles = list(vehicles)
+        # Stores with fixed-width fields (MmapSlotStore)
+        checkVehicle = getattr(self.evSlots if isElectric else self.slots, 'checkVehicle', None)
+
+        # Validate the whole batch first so a bad entry parks nothing
+        batchRegNums = set()
+        for vehicle in vehicles:
+            if vehicle.regNum in self.regNumIndex or vehicle.regNum in batchRegNums:
+                raise ValueError(f"Vehicle {vehicle.regNum} is already parked")
+            if checkVehicle is not None:
+                checkVehicle(vehicle)
+            batchRegNums.add(vehicle.regNum)
+
+        slotNumbers = [self._placeVehicle(vehicle, isElectric) for vehicle in vehicles]
+
+        if vehicles and self.observers:
+            self.notifyObservers(
+                ParkedBatch(self.level, vehicles, slotNumbers, bool(isElectric))
+            )
+
+        return slotNumbers
 
     def leave(self, slotNumber, isElectric=False):
         """
@@ -151,41 +309,186 @@ class ParkingLot:
         Returns:
             True if successful, False if slot was empty
         """
+        vehicle = self._removeVehicle(slotNumber, isElectric)
+
+        if vehicle is None:
+            return False
+
+        # Notify observers
+        if self.observers:
+            self.notifyObservers(Left(self.level, vehicle, slotNumber, bool(isElectric)))
+
+        return True
+
+    def leaveMany(self, slotNumbers, isElectric=False):
+        """
+        Clear a batch of slots with a single observer notification
+
+        Args:
+            slotNumbers: Iterable of slot numbers (1-indexed)
+            isElectric: True if they are EV slots
 
+        Returns:
+            List of booleans in the same order, False where the slot was empty
+        """
+        results = []
+        removedVehicles = []
+        removedSlots = []
+        for slotNumber in slotNumbers:
+            vehicle = self._removeVehicle(slotNumber, isElectric)
+            results.append(vehicle is not None)
+            if vehicle is not None:
+                removedVehicles.append(vehicle)
+                removedSlots.append(slotNumber)
+
+        if results and self.observers:
+            self.notifyObservers(
+                LeftBatch(self.level, removedVehicles, removedSlots, bool(isElectric))
+            )
+
+        return results
+
+    def updateCharges(self, slotNumbers, charges):
+        """
+        Set the charge of the vehicles in many EV slots at once
+
+        Used by ChargingScheduler once per tick. Every vehicle is written
+        back to its slot, so stores that copy vehicle fields (mmap) stay
+        current, or its charge is set in place by stores with a
+        setCharge() (columnar); changed slots show up in getStatusChanges()
+        and observers get one ChargesUpdated event.
+
+        Args:
+            slotNumbers: EV slot numbers (1-indexed)
+            charges: New charge (0-100) for each slot
+        """
+        evSlots = self.evSlots
+        # Stores that can change one field in place (ColumnarSlotStore)
+        setCharge = getattr(evSlots, 'setCharge', None)
+        updatedSlots = []
+        updatedCharges = []
+        for slotNumber, charge in zip(slotNumbers, charges):
+            if setCharge is not None:
+                if not setCharge(slotNumber - 1, charge):
+                    continue
+            else:
+                vehicle = evSlots[slotNumber - 1]
+                if not isinstance(vehicle, ElectricVehicle):
+                    continue
+                vehicle.charge = charge
+                evSlots[slotNumber - 1] = vehicle
+            self._logStatusChange(slotNumber, True)
+            updatedSlots.append(slotNumber)
+            updatedCharges.append(charge)
+
+        if updatedSlots and self.observers:
+            self.notifyObservers(ChargesUpdated(self.level, updatedSlots, updatedCharges))
+
+    def _placeVehicle(self, vehicle, isElectric, slotNumber=None):
+        """
+        Put a vehicle in the lowest free slot of its pool (or in slotNumber)
+        and index it
+
+        No duplicate check and no notification - callers handle both.
+
+        Returns:
+            Slot number, or None if the pool is full (or slotNumber is not free)
+        """
+        slotNumber = self._claimSlot(vehicle, isElectric, slotNumber)
+        if slotNumber is not None:
+            self._indexVehicle(vehicle, slotNumber, isElectric)
+        return slotNumber
+
+    def _removeVehicle(self, slotNumber, isElectric):
+        """
+        Clear a slot and drop its vehicle from the indexes
+
+        No notification - callers handle it.
+
+        Returns:
+            The vehicle that left, or None if the slot was empty or invalid
+        """
+        vehicle = self._releaseSlot(slotNumber, isElectric)
+        if vehicle is not None:
+            self._unindexVehicle(vehicle, slotNumber, isElectric)
+        return vehicle
+
+    # Slot pool bookkeeping (touches only one pool)
+    def _claimSlot(self, vehicle, isElectric, slotNumber=None):
+        """Store a vehicle in the lowest free slot of its pool (or in slotNumber)"""
+        if isElectric:
+            slots, freeSlots = self.evSlots, self.freeEvSlots
+        else:
+            slots, freeSlots = self.slots, self.freeSlots
+
+        if slotNumber is None:
+            slotIndex = freeSlots.allocate()
+            if slotIndex is None:
+                return None
+        else:
+            if not 0 < slotNumber <= len(slots) or not freeSlots.claim(slotNumber - 1):
+                return None
+            slotIndex = slotNumber - 1
+
+        try:
+            slots[slotIndex] = vehicle
+        except Exception:
+            # The store rejected the vehicle (e.g. a field too long for it)
+            freeSlots.release(slotIndex)
+            raise
+        slotNumber = slotIndex + 1
+
+        if isElectric:
+            self.slotEvId = slotNumber
+            self.numOfOccupiedEvSlots += 1
+        else:
+            self.slotId = slotNumber
+            self.numOfOccupiedSlots += 1
+
+        return slotNumber
+
+    def _releaseSlot(self, slotNumber, isElectric):
+        """Empty a slot of its pool and return the vehicle that was in it"""
         if isElectric:
-            # EV slot
-            if (self.numOfOccupiedEvSlots > 0 and
-                    slotNumber <= len(self.evSlots) and
-                    self.evSlots[slotNumber - 1] is not None):
-                vehicle = self.evSlots[slotNumber - 1]
-                self.evSlots[slotNumber - 1] = None
-                self.numOfOccupiedEvSlots -= 1
-
-                # Notify observers
-                self.notifyObservers(
-                    f"Vehicle {vehicle.regNum} removed "
-                    f"from EV slot {slotNumber}"
-                )
-
-                return True
+            slots, freeSlots = self.evSlots, self.freeEvSlots
         else:
-            # Regular slot
-            if (self.numOfOccupiedSlots > 0 and
-                    slotNumber <= len(self.slots) and
-                    self.slots[slotNumber - 1] is not None):
-                vehicle = self.slots[slotNumber - 1]
-                self.slots[slotNumber - 1] = None
-                self.numOfOccupiedSlots -= 1
+            slots, freeSlots = self.slots, self.freeSlots
 
-                # Notify observers
-                self.notifyObservers(
-                    f"Vehicle {vehicle.regNum} removed "
-                    f"from regular slot {slotNumber}"
-                )
+        if not 0 < slotNumber <= len(slots):
+            return None
 
-                return True
+        vehicle = slots[slotNumber - 1]
+        if vehicle is None:
+            return None
 
-        return False
+        slots[slotNumber - 1] = None
+        freeSlots.release(slotNumber - 1)
+
+        if isElectric:
+            self.numOfOccupiedEvSlots -= 1
+        else:
+            self.numOfOccupiedSlots -= 1
+
+        return vehicle
+
+    # Lot-wide bookkeeping (indexes and status log, shared by both pools)
+    def _indexVehicle(self, vehicle, slotNumber, isElectric):
+        """Add a parked vehicle to the indexes and the status log"""
+        key = AttributeIndex.encodeKey(slotNumber, isElectric)
+        self.regNumIndex[vehicle.regNum] = key
+        self.attributeIndex.add(vehicle, key)
+        self._logStatusChange(slotNumber, isElectric)
+
+    def _unindexVehicle(self, vehicle, slotNumber, isElectric):
+        """Drop a vehicle that left from the indexes, log the change"""
+        self.regNumIndex.pop(vehicle.regNum, None)
+        self.attributeIndex.remove(vehicle, AttributeIndex.encodeKey(slotNumber, isElectric))
+        self._logStatusChange(slotNumber, isElectric)
+
+    def _logStatusChange(self, slotNumber, isElectric):
+        """Bump the status version and record which slot changed"""
+        self.statusVersion += 1
+        self.statusChanges.append((self.statusVersion, slotNumber, bool(isElectric)))
 
     def getStatus(self):
         """
@@ -197,56 +500,100 @@ class ParkingLot:
         Returns:
             Dictionary with regular and EV vehicle lists
         """
-        status = {
-            'regular': [],
-            'electric': []
+        return {
+            'regular': self._poolStatus(self.slots, False),
+            'electric': self._poolStatus(self.evSlots, True)
+        }
+
+    def _poolStatus(self, slots, isElectric):
+        """Status rows of one slot pool, in slot order"""
+        # Stores that can read rows without building vehicles (MmapSlotStore)
+        statusRows = getattr(slots, 'statusRows', None)
+        if statusRows is not None:
+            return statusRows(self.level)
+
+        return [
+            self._statusRow(i + 1, vehicle, isElectric)
+            for i, vehicle in enumerate(slots)
+            if vehicle
+        ]
+
+    def _statusRow(self, slotNumber, vehicle, isElectric):
+        """Status dictionary for one occupied slot"""
+        row = {
+            'slot': slotNumber,
+            'level': self.level,
+            'registration': vehicle.regNum,
+            'color': vehicle.color,
+            'make': vehicle.make,
+            'model': vehicle.model
         }
+        if isElectric:
+            row['charge'] = vehicle.charge if isinstance(vehicle, ElectricVehicle) else 0
+        return row
+
+    def getStatusSnapshot(self):
+        """
+        Get full status together with its version
 
-        # Get regular vehicles
-        for i, vehicle in enumerate(self.slots):
-            if vehicle:
-                status['regular'].append({
-                    'slot': i + 1,
-                    'level': self.level,
-                    'registration': vehicle.regNum,
-                    'color': vehicle.color,
-                    'make': vehicle.make,
-                    'model': vehicle.model
-                })
-
-        # Get EV vehicles
-        for i, eVehicle in enumerate(self.evSlots):
-            if eVehicle:
-                status['electric'].append({
-                    'slot': i + 1,
-                    'level': self.level,
-                    'registration': eVehicle.regNum,
-                    'color': eVehicle.color,
-                    'make': eVehicle.make,
-                    'model': eVehicle.model,
-                    'charge': eVehicle.charge if isinstance(eVehicle, ElectricVehicle) else 0
-                })
-
-        return status
+        Returns:
+            Tuple of (version, status) - pass version to getStatusChanges()
+        """
+        return (self.statusVersion, self.getStatus())
+
+    def getStatusChanges(self, sinceVersion):
+        """
+        Get only the slots that changed since a status version
+
+        IMPROVEMENT: Pollers apply deltas instead of rebuilding full status
+
+        Args:
+            sinceVersion: Version from getStatusSnapshot() or a previous call
+
+        Returns:
+            Tuple of (version, changes) where changes is
+            {'regular': {slot: row or None}, 'electric': {slot: row or None}}
+            (None means the slot is now empty), or None if sinceVersion is
+            too old or unknown and a full snapshot is needed
+        """
+        if (sinceVersion is None or
+                sinceVersion < self.statusBaseVersion or
+                sinceVersion > self.statusVersion):
+            return None
+
+        # The log must reach back to the version right after sinceVersion
+        if (sinceVersion < self.statusVersion and
+                self.statusChanges[0][0] > sinceVersion + 1):
+            return None
+
+        touched = set()
+        for version, slotNumber, isElectric in reversed(self.statusChanges):
+            if version <= sinceVersion:
+                break
+            touched.add((slotNumber, isElectric))
+
+        changes = {'regular': {}, 'electric': {}}
+        for slotNumber, isElectric in touched:
+            slots = self.evSlots if isElectric else self.slots
+            vehicle = slots[slotNumber - 1]
+            row = None if vehicle is None else self._statusRow(slotNumber, vehicle, isElectric)
+            changes['electric' if isElectric else 'regular'][slotNumber] = row
+
+        return (self.statusVersion, changes)
 
     def findByRegNum(self, regNum):
         """
         Find vehicle by registration number
 
+        IMPROVEMENT: O(1) lookup in the index maintained by park()/leave()
+
         Returns:
             Tuple of (slotNumber, isElectric) or None if not found
         """
-        # Search regular slots
-        for i, vehicle in enumerate(self.slots):
-            if (vehicle is not None and vehicle.regNum == regNum):
-                return (i + 1, False)
-
-        # Search EV slots
-        for i, eVehicle in enumerate(self.evSlots):
-            if (eVehicle is not None and eVehicle.regNum == regNum):
-                return (i + 1, True)
-
-        return None
+        key = self.regNumIndex.get(regNum)
+        if key is None:
+            return None
+        return (key >> 1, (key & 1) == 1)   # AttributeIndex.decodeKey, inlined
 
     def findByColor(self, color):
         """
@@ -255,18 +602,17 @@ class ParkingLot:
         Returns:
             List of tuples: (slotNumber, isElectric)
         """
-        results = []
+        return self.attributeIndex.find(color=color)
 
-        # Search regular slots
-        for i, vehicle in enumerate(self.slots):
-            if (vehicle is not None and vehicle.color.lower() == color.lower()):
-                results.append((i + 1, False))
+    def find(self, **criteria):
+        """
+        Find vehicles matching all criteria (color, make, model, type)
 
-        # Search EV slots
-        for i, eVehicle in enumerate(self.evSlots):
-            if (eVehicle is not None and eVehicle.color.lower() == color.lower()):
-                results.append((i + 1, True))
+        IMPROVEMENT: Intersects the secondary indexes instead of scanning
 
-        return results
+        Returns:
+            List of tuples: (slotNumber, isElectric)
+        """
+        return self.attributeIndex.find(**criteria)
 
     # Remove other unused functions
@@ -0,0 +1,678 @@
+import tkinter as tk
+from tkinter import messagebox
+from .Vehicle import VehicleFactory, VehicleType
+from .ParkingLot import ParkingObserver
+from .Facility import Facility
+from .EventJournal import EventJournal
+from .GuiWidgets import BoundedLog, VirtualTable
+from .GuiWorker import LotWorker
+
+### Concrete Observer Implementation
+
+class GUIObserver(ParkingObserver):
+    """
+    Concrete Observer that updates GUI when parking lot changes
+
+    Part of Observer Pattern implementation
+    """
+
+    def __init__(self, log, worker):
+        """
+        Initialize observer with the message log to update
+
+        Args:
+            log: BoundedLog displaying messages
+            worker: LotWorker used to reach the Tk thread
+        """
+        self.log = log
+        self.worker = worker
+
+    def update(self, event):
+        """
+        Called by ParkingLot when something changes (on the worker thread)
+
+        Args:
+            event: ParkingEvent to display (rendered as text here)
+        """
+        self.worker.callInGui(self.log.append, f"{event}\n")
+
+class StatusView:
+    """
+    Keeps the status table current with status deltas
+
+    collect() asks every level for the slots changed since the version
+    last seen (a level falls back to a full snapshot when it was
+    re-created or too many changes happened in between); apply() then
+    updates only those table rows. collect() reads the lots and runs on
+    the worker thread, apply() touches widgets and runs on the Tk thread.
+    """
+
+    COLUMNS = ('Type', 'Level', 'Slot', 'Reg No.', 'Color', 'Make', 'Model', 'Charge')
+
+    def __init__(self, table):
+        """
+        Args:
+            table: VirtualTable showing one row per parked vehicle
+        """
+        self.table = table
+        self.versions = {}  # level -> last applied status version
+
+    def collect(self, facility):
+        """
+        Gather status changes from every level of the facility
+
+        Returns:
+            List of (level, version, changes, isSnapshot) for apply()
+        """
+        updates = []
+        for level, lot in list(facility.levels.items()):
+            delta = lot.getStatusChanges(self.versions.get(level))
+
+            if delta is None:
+                version, status = lot.getStatusSnapshot()
+                changes = {
+                    'regular': {row['slot']: row for row in status['regular']},
+                    'electric': {row['slot']: row for row in status['electric']},
+                }
+                updates.append((level, version, changes, True))
+            else:
+                version, changes = delta
+                updates.append((level, version, changes, False))
+
+        return updates
+
+    def apply(self, updates):
+        """Apply the output of collect() to the table"""
+        for level, version, changes, isSnapshot in updates:
+            if isSnapshot:
+                self.table.removeRows(lambda key: key[1] == level)
+
+            for isElectric, kind in ((False, 'regular'), (True, 'electric')):
+                for slotNumber, row in changes[kind].items():
+                    # Key orders the table: regular first, then level, then slot
+                    key = (isElectric, level, slotNumber)
+                    if row is None:
+                        self.table.removeRow(key)
+                    else:
+                        self.table.setRow(key, self.rowValues(row, isElectric))
+
+            self.versions[level] = version
+
+    @staticmethod
+    def rowValues(row, isElectric):
+        """Table values for one vehicle"""
+        return (
+            "EV" if isElectric else "Regular",
+            row['level'],
+            row['slot'],
+            row['registration'],
+            row['color'],
+            row['make'],
+            row['model'],
+            f"{row['charge']}%" if isElectric else "",
+        )
+
+# Main GUI Application - Remove global variables
+class ParkingManagerGUI:
+    """Parking Manager GUI Application"""
+
+    LOG_MAX_LINES = 1000
+    STATUS_REFRESH_MS = 1000
+
+    def __init__(self, root, journalDir=None):
+        """
+        Initialize GUI application
+
+        IMPROVEMENT: All variables are instance variables, not globals
+
+        Args:
+            root: Tk root window
+            journalDir: Folder for the event journal and snapshots; the
+                facility is restored from it and every change is saved
+                there. None keeps the state in memory only.
+        """
+        self.root = root
+        self.root.geometry("700x900")
+        self.root.resizable(True, True) # elf.root.resizable(0, 0) -> self.root.resizable(True, True): Display full content
+        self.root.title("Parking Lot Manager - Refactored")
+
+        # Create facility instance: one parking lot per floor level
+        self.facility = Facility()
+
+        # All facility work runs on this worker thread, never the Tk thread
+        self.worker = LotWorker(self.root)
+        self.statusRefreshPending = False
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Initialize all GUI variables as instance variables (Not global)
+        self.initVariables()
+
+        # Build GUI components
+        self.buildGui()
+
+        # Create observer and attach to every level of the facility
+        self.observer = GUIObserver(self.log, self.worker)
+        self.journal = EventJournal(journalDir) if journalDir is not None else None
+        if self.journal is not None:
+            self.restoreFacility()
+        else:
+            self.facility.attachObserver(self.observer)
+
+        # Status table follows the facility through cheap status deltas
+        self.statusView = StatusView(self.statusTable)
+        self.scheduleStatusRefresh()
+
+    def initVariables(self):
+        """
+        Initialize all GUI variables as instance variables
+
+        IMPROVEMENT: Encapsulated in class instead of global scope
+        """
+        # Lot creation variables
+        self.numValue = tk.StringVar()
+        self.evValue = tk.StringVar()
+        self.levelValue = tk.StringVar()
+        self.levelValue.set("1")  # Default level
+
+        # Vehicle details variables
+        self.makeValue = tk.StringVar()
+        self.modelValue = tk.StringVar()
+        self.colorValue = tk.StringVar()
+        self.regNumValue = tk.StringVar()
+
+        # Boolean variables
+        self.isElectric = tk.BooleanVar()
+        self.isMotorcycle = tk.BooleanVar()
+
+        # Removal variables
+        self.slotValue = tk.StringVar()
+        self.removeEv = tk.BooleanVar()
+        self.removeLevelValue = tk.StringVar()
+        self.removeLevelValue.set("1")  # Default level
+
+        # Search variables
+        self.searchRegNum = tk.StringVar()
+        self.searchColor = tk.StringVar()
+
+    def buildGui(self):
+        """Build all GUI components"""
+
+        # Header
+        tk.Label(
+            self.root,
+            text='Parking Lot Manager - Refactored',
+            font='Arial 14 bold'
+        ).grid(row=0, column=0, padx=10, pady=10, columnspan=4)
+
+        # Lot Creation Section
+        self.buildLotCreationSection()
+
+        # Vehicle Management Section
+        self.buildVehicleSection()
+
+        # Search Section
+        self.buildSearchSection()
+
+        # Status Section
+        self.buildStatusSection()
+
+        # Output text field
+        self.buildOutputSection()
+
+    def buildLotCreationSection(self):
+        """Build parking lot creation section"""
+        row = 1
+
+        tk.Label(
+            self.root,
+            text='Lot Creation',
+            font='Arial 12 bold'
+        ).grid(row=row, column=0, padx=10, columnspan=4)
+        row += 1
+
+        # Regular spaces
+        tk.Label(
+            self.root,
+            text='Number of Regular Spaces',
+            font='Arial 12'
+        ).grid(row=row, column=0, padx=5)
+
+        tk.Entry(
+            self.root,
+            textvariable=self.numValue,
+            width=6,
+            font='Arial 12'
+        ).grid(row=row, column=1, padx=4, pady=2)
+
+        # EV spaces
+        tk.Label(
+            self.root,
+            text='Number of EV Spaces',
+            font='Arial 12'
+        ).grid(row=row, column=2, padx=5)
+
+        tk.Entry(
+            self.root,
+            textvariable=self.evValue,
+            width=6,
+            font='Arial 12'
+        ).grid(row=row, column=3, padx=4, pady=4)
+        row += 1
+
+        # Floor level
+        tk.Label(
+            self.root,
+            text='Floor Level',
+            font='Arial 12'
+        ).grid(row=row, column=0, padx=5)
+
+        tk.Entry(
+            self.root,
+            textvariable=self.levelValue,
+            width=6,
+            font='Arial 12'
+        ).grid(row=row, column=1, padx=4, pady=4)
+        row += 1
+
+        # Create button
+        tk.Button(
+            self.root,
+            text="Create Parking Lot",
+            command=self.createLot,
+            font="Arial 12",
+            bg='lightblue',
+            fg='black',
+            activebackground="teal",
+            padx=5,
+            pady=5
+        ).grid(row=row, column=0, padx=4, pady=4)
+
+    def buildVehicleSection(self):
+        """Build vehicle management section"""
+        row = 5
+
+        tk.Label(
+            self.root,
+            text='Vehicle Management',
+            font='Arial 12 bold'
+        ).grid(row=row, column=0, padx=10, columnspan=4)
+        row += 1
+
+        # Make and Model
+        tk.Label(self.root, text='Make', font='Arial 12').grid(row=row, column=0, padx=5)
+        tk.Entry(self.root, textvariable=self.makeValue, width=12, font='Arial 12').grid(row=row, column=1, padx=4,
+                                                                                          pady=4)
+
+        tk.Label(self.root, text='Model', font='Arial 12').grid(row=row, column=2, padx=5)
+        tk.Entry(self.root, textvariable=self.modelValue, width=12, font='Arial 12').grid(row=row, column=3, padx=4,
+                                                                                           pady=4)
+        row += 1
+
+        # Color and Registration
+        tk.Label(self.root, text='Color', font='Arial 12').grid(row=row, column=0, padx=5)
+        tk.Entry(self.root, textvariable=self.colorValue, width=12, font='Arial 12').grid(row=row, column=1, padx=4,
+                                                                                           pady=4)
+
+        tk.Label(self.root, text='Registration #', font='Arial 12').grid(row=row, column=2, padx=5)
+        tk.Entry(self.root, textvariable=self.regNumValue, width=12, font='Arial 12').grid(row=row, column=3, padx=4,
+                                                                                         pady=4)
+        row += 1
+
+        # Checkboxes - using BooleanVar instead of IntVar
+        tk.Checkbutton(
+            self.root,
+            text='Electric Vehicle',
+            variable=self.isElectric,
+            font='Arial 12'
+        ).grid(column=0, row=row, padx=4, pady=4)
+
+        tk.Checkbutton(
+            self.root,
+            text='Motorcycle',
+            variable=self.isMotorcycle,
+            font='Arial 12'
+        ).grid(column=1, row=row, padx=4, pady=4)
+        row += 1
+
+        # Park button
+        tk.Button(
+            self.root,
+            command=self.parkVehicle,
+            text="Park Vehicle",
+            font="Arial 11",
+            bg='lightblue',
+            fg='black',
+            activebackground="teal",
+            padx=5,
+            pady=5
+        ).grid(column=0, row=row, padx=4, pady=4)
+        row += 1
+
+        # Remove section
+        tk.Label(self.root, text='Slot #', font='Arial 12').grid(row=row, column=0, padx=5)
+        tk.Entry(self.root, textvariable=self.slotValue, width=12, font='Arial 12').grid(row=row, column=1, padx=4,
+                                                                                          pady=4)
+
+        tk.Checkbutton(
+            self.root,
+            text='EV Slot?',
+            variable=self.removeEv,
+            font='Arial 12'
+        ).grid(column=2, row=row, padx=4, pady=4)
+        row += 1
+
+        tk.Button(
+            self.root,
+            command=self.removeVehicle,
+            text="Remove Vehicle",
+            font="Arial 11",
+            bg='lightblue',
+            fg='black',
+            activebackground="teal",
+            padx=5,
+            pady=5
+        ).grid(column=0, row=row, padx=4, pady=4)
+
+        tk.Label(self.root, text='Level', font='Arial 12').grid(row=row, column=1, padx=5)
+        tk.Entry(self.root, textvariable=self.removeLevelValue, width=6, font='Arial 12').grid(row=row, column=2,
+                                                                                                padx=4, pady=4)
+
+    def buildSearchSection(self):
+        """Build search section"""
+        row = 12
+
+        # Search by registration
+        tk.Button(
+            self.root,
+            command=self.searchByRegNum,
+            text="Find by Registration #",
+            font="Arial 11",
+            bg='lightblue',
+            fg='black',
+            activebackground="teal",
+            padx=5,
+            pady=5
+        ).grid(column=0, row=row, padx=4, pady=4)
+
+        tk.Entry(
+            self.root,
+            textvariable=self.searchRegNum,
+            width=12,
+            font='Arial 12'
+        ).grid(row=row, column=1, padx=4, pady=4)
+
+        # Search by color
+        tk.Button(
+            self.root,
+            command=self.searchByColor,
+            text="Find by Color",
+            font="Arial 11",
+            bg='lightblue',
+            fg='black',
+            activebackground="teal",
+            padx=5,
+            pady=5
+        ).grid(column=2, row=row, padx=4, pady=4)
+
+        tk.Entry(
+            self.root,
+            textvariable=self.searchColor,
+            width=12,
+            font='Arial 12'
+        ).grid(row=row, column=3, padx=4, pady=4)
+
+    def buildStatusSection(self):
+        """Build status section"""
+        row = 13
+
+        tk.Button(
+            self.root,
+            command=self.showStatus,
+            text="Show All Vehicles",
+            font="Arial 11",
+            bg='PaleGreen1',
+            fg='black',
+            activebackground="PaleGreen3",
+            padx=5,
+            pady=5
+        ).grid(column=0, row=row, padx=4, pady=4)
+        row += 1
+
+        # Virtualized table: only the visible rows exist as widgets
+        self.statusTable = VirtualTable(self.root, StatusView.COLUMNS, visibleRows=10)
+        self.statusTable.grid(column=0, row=row, padx=10, pady=4, columnspan=4, sticky='ew')
+
+    def buildOutputSection(self):
+        """Build output text area"""
+        row = 15
+
+        # Create text field as instance variable (Not global)
+        self.textField = tk.Text(self.root, width=90, height=12)
+        self.textField.grid(column=0, row=row, padx=10, pady=10, columnspan=4)
+
+        # Bounded log: oldest lines are dropped so the widget stays fast
+        self.log = BoundedLog(self.textField, self.LOG_MAX_LINES)
+
+    # Command Handlers
+    # IMPROVEMENT: Input is read and validated on the Tk thread, the lot
+    # operation runs on the worker, and the result comes back in a callback
+    def showError(self, error):
+        """Worker error callback: report the exception in a dialog"""
+        messagebox.showerror("Error", str(error))
+
+    def createLot(self):
+        """Create parking lot"""
+        try:
+            capacity = int(self.numValue.get())
+            evCapacity = int(self.evValue.get())
+            level = int(self.levelValue.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid numbers")
+            return
+
+        # Adds the level, or re-creates it; observer displays LotCreated
+        self.worker.submit(
+            lambda: self.facility.createLevel(capacity, evCapacity, level),
+            onError=self.showError
+        )
+
+    def parkVehicle(self):
+        """Park a vehicle using Factory Pattern"""
+        try:
+            # Get values from GUI
+            regNum = self.regNumValue.get()
+            make = self.makeValue.get()
+            model = self.modelValue.get()
+            color = self.colorValue.get()
+
+            # Determine vehicle type using boolean flags
+            isElectric = self.isElectric.get()
+            isMotorcycle = self.isMotorcycle.get()
+
+            # Use Factory Pattern to create vehicle
+            if isElectric and isMotorcycle:
+                vehicleType = VehicleType.ELECTRIC_BIKE
+            elif isElectric:
+                vehicleType = VehicleType.ELECTRIC_CAR
+            elif isMotorcycle:
+                vehicleType = VehicleType.MOTORCYCLE
+            else:
+                vehicleType = VehicleType.CAR
+
+            # Create vehicle using factory
+            vehicle = VehicleFactory.createVehicle(
+                vehicleType,
+                regNum,
+                make,
+                model,
+                color
+            )
+
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        def parked(placement):
+            if placement is None:
+                messagebox.showwarning("Full", "Parking lot is full")
+            else:
+                # Observer automatically displays message
+                # Clear form
+                self.clearVehicleForm()
+
+        # Park the vehicle on the free level nearest the selected floor
+        nearLevel = self.getSelectedLevel()
+        self.worker.submit(
+            lambda: self.facility.park(vehicle, isElectric, nearLevel=nearLevel),
+            onDone=parked,
+            onError=self.showError
+        )
+
+    def removeVehicle(self):
+        """Remove a vehicle from a slot"""
+        try:
+            slotNumber = int(self.slotValue.get())
+            level = int(self.removeLevelValue.get())
+            isElectric = self.removeEv.get()  # Boolean, not 0/1
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid slot and level numbers")
+            return
+
+        def removed(success):
+            if success:
+                # Observer automatically displays message
+                self.slotValue.set("")
+            else:
+                messagebox.showwarning(
+                    "Error",
+                    f"Unable to remove vehicle from slot {slotNumber} on level {level}"
+                )
+
+        self.worker.submit(
+            lambda: self.facility.leave(level, slotNumber, isElectric),
+            onDone=removed,
+            onError=self.showError
+        )
+
+    def searchByRegNum(self):
+        """Search for vehicle by registration number"""
+        regNum = self.searchRegNum.get()
+
+        if not regNum:
+            messagebox.showwarning("Warning", "Please enter registration number")
+            return
+
+        def found(result):
+            if result:
+                level, slotNumber, isElectric = result
+                slotType = "EV" if isElectric else "Regular"
+                message = f"Found: {regNum} in {slotType} slot {slotNumber} on level {level}\n"
+                self.log.append(message)
+            else:
+                message = f"Vehicle {regNum} not found\n"
+                self.log.append(message)
+
+        self.worker.submit(
+            lambda: self.facility.findByRegNum(regNum),
+            onDone=found,
+            onError=self.showError
+        )
+
+    def searchByColor(self):
+        """Search for vehicles by color"""
+        color = self.searchColor.get()
+
+        if not color:
+            messagebox.showwarning("Warning", "Please enter color")
+            return
+
+        def found(results):
+            if results:
+                message = f"Found {len(results)} {color} vehicle(s):\n"
+                for level, slotNumber, isElectric in results:
+                    slotType = "EV" if isElectric else "Regular"
+                    message += f"  - {slotType} slot {slotNumber} on level {level}\n"
+                self.log.append(message)
+            else:
+                message = f"No {color} vehicles found\n"
+                self.log.append(message)
+
+        self.worker.submit(
+            lambda: self.facility.findByColor(color),
+            onDone=found,
+            onError=self.showError
+        )
+
+    def showStatus(self):
+        """
+        Bring the status table up to date
+
+        IMPROVEMENT: Only slots changed since the last refresh are applied
+        (status deltas), and the table only renders its visible rows
+        """
+        # One refresh in flight at a time: StatusView versions stay consistent
+        if self.statusRefreshPending:
+            return
+        self.statusRefreshPending = True
+
+        def collected(updates):
+            self.statusRefreshPending = False
+            self.statusView.apply(updates)
+
+        def failed(error):
+            self.statusRefreshPending = False
+            self.showError(error)
+
+        self.worker.submit(
+            lambda: self.statusView.collect(self.facility),
+            onDone=collected,
+            onError=failed
+        )
+
+    def scheduleStatusRefresh(self):
+        """Refresh the status table periodically so it follows the lot"""
+        self.showStatus()
+        self.root.after(self.STATUS_REFRESH_MS, self.scheduleStatusRefresh)
+
+    def restoreFacility(self):
+        """Load the saved facility on the worker, then start showing events"""
+        def restore():
+            replayed = self.journal.recover(self.facility)
+            # Attached after recovery: restored vehicles are not logged one by one
+            self.facility.attachObserver(self.observer)
+            # Counted here: the levels belong to the worker thread
+            levels = self.facility.levels.values()
+            vehicles = sum(lot.numOfOccupiedSlots + lot.numOfOccupiedEvSlots for lot in levels)
+            return (replayed, len(levels), vehicles)
+
+        def restored(result):
+            replayed, levels, vehicles = result
+            self.log.append(
+                f"Restored {levels} levels and {vehicles} vehicles "
+                f"({replayed} journal records replayed)\n"
+            )
+
+        self.worker.submit(restore, onDone=restored, onError=self.showError)
+
+    def close(self):
+        """Window closed: finish queued lot work, then destroy the window"""
+        if self.journal is not None:
+            self.worker.submit(self.journal.close)
+        self.worker.shutdown()
+        self.root.destroy()
+
+    def getSelectedLevel(self):
+        """Floor level entered in the form, or None if it is not a number"""
+        try:
+            return int(self.levelValue.get())
+        except ValueError:
+            return None
+
+    def clearVehicleForm(self):
+        """Clear vehicle input form"""
+        self.regNumValue.set("")
+        self.makeValue.set("")
+        self.modelValue.set("")
+        self.colorValue.set("")
+        self.isElectric.set(False)
+        self.isMotorcycle.set(False)
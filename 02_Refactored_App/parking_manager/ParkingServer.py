@@ -0,0 +1,191 @@
+"""
+Asyncio parking lot service speaking JSON lines over TCP or a Unix socket
+
+Each request is one JSON object per line, each response one JSON object
+per line, in request order:
+
+    {"id": 1, "op": "create", "capacity": 100, "evCapacity": 10, "level": 1}
+    {"id": 2, "op": "park", "type": "Car", "regNum": "ABC123",
+     "make": "Toyota", "model": "Corolla", "color": "Red"}
+    {"id": 3, "op": "leave", "slot": 1, "ev": false}
+    {"id": 4, "op": "find-reg", "regNum": "ABC123"}
+    {"id": 5, "op": "find", "color": "red", "make": "toyota"}
+    {"id": 6, "op": "status"}
+
+    -> {"id": 2, "ok": true, "result": 1}
+    -> {"id": 9, "ok": false, "error": "Vehicle ABC123 is already parked"}
+
+Clients may pipeline: send many requests without waiting. The server
+handles every complete line it has received, then writes all of their
+responses with a single write.
+
+Usage: python -m parking_manager.ParkingServer [--host H] [--port P | --unix PATH]
+"""
+import argparse
+import asyncio
+import json
+
+from .ParkingLot import ParkingLot
+from .Vehicle import ElectricVehicle, VehicleFactory, VehicleType
+
+MAX_LINE = 64 * 1024
+READ_SIZE = 64 * 1024
+
+class ParkingService:
+    """Turns request dictionaries into ParkingLot calls"""
+
+    def __init__(self, parkingLot=None):
+        """
+        Args:
+            parkingLot: Lot to serve (a new empty ParkingLot by default).
+                All requests run on the event loop thread, so a plain
+                ParkingLot is safe here.
+        """
+        self.parkingLot = parkingLot if parkingLot is not None else ParkingLot()
+        self.operations = {
+            'create': self.create,
+            'park': self.park,
+            'leave': self.leave,
+            'find-reg': self.findRegNum,
+            'find-color': self.findColor,
+            'find': self.find,
+            'status': self.status,
+        }
+
+    def handle(self, request):
+        """
+        Run one request
+
+        Returns:
+            Response dictionary (errors are reported, never raised)
+        """
+        requestId = request.get('id')
+        try:
+            operation = self.operations.get(request.get('op'))
+            if operation is None:
+                raise ValueError(f"Unknown operation: {request.get('op')}")
+            return {'id': requestId, 'ok': True, 'result': operation(request)}
+        except (ValueError, KeyError, TypeError, ArithmeticError) as e:
+            # ArithmeticError: e.g. int(1e999) raises OverflowError
+            return {'id': requestId, 'ok': False, 'error': str(e)}
+
+    def create(self, request):
+        return self.parkingLot.createParkingLot(
+            int(request['capacity']), int(request['evCapacity']), int(request['level'])
+        )
+
+    def park(self, request):
+        vehicle = VehicleFactory.createVehicle(
+            VehicleType(request.get('type', VehicleType.CAR.value)),
+            request['regNum'],
+            request['make'],
+            request['model'],
+            request['color'],
+            int(request.get('charge', 0))
+        )
+        isElectric = request.get('ev', isinstance(vehicle, ElectricVehicle))
+        return self.parkingLot.park(vehicle, bool(isElectric))
+
+    def leave(self, request):
+        return self.parkingLot.leave(int(request['slot']), bool(request.get('ev', False)))
+
+    def findRegNum(self, request):
+        return self.parkingLot.findByRegNum(request['regNum'])
+
+    def findColor(self, request):
+        return self.parkingLot.findByColor(request['color'])
+
+    def find(self, request):
+        criteria = {name: value for name, value in request.items() if name not in ('id', 'op')}
+        return self.parkingLot.find(**criteria)
+
+    def status(self, request):
+        return self.parkingLot.getStatus()
+
+class ParkingServer:
+    """JSON-lines server around a ParkingService"""
+
+    def __init__(self, service=None):
+        self.service = service if service is not None else ParkingService()
+        self.server = None
+
+    async def start(self, host='127.0.0.1', port=8765, unixPath=None):
+        """Start listening on TCP host:port, or on a Unix socket path"""
+        if unixPath is not None:
+            self.server = await asyncio.start_unix_server(self.handleClient, unixPath)
+        else:
+            self.server = await asyncio.start_server(self.handleClient, host, port)
+        return self.server
+
+    async def serveForever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handleClient(self, reader, writer):
+        """Serve one connection: every chunk read -> one batched write"""
+        pending = b""
+        try:
+            while True:
+                chunk = await reader.read(READ_SIZE)
+                if not chunk:
+                    break
+
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()  # incomplete last line, if any
+                if len(pending) > MAX_LINE:
+                    writer.write(self.encode({'id': None, 'ok': False, 'error': "Request line too long"}))
+                    break
+
+                responses = [self.respond(line) for line in lines if line.strip()]
+                if responses:
+                    writer.write(b"".join(responses))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def respond(self, line):
+        """Decode one request line and encode its response"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return self.encode({'id': None, 'ok': False, 'error': "Invalid JSON"})
+        if not isinstance(request, dict):
+            return self.encode({'id': None, 'ok': False, 'error': "Request must be an object"})
+        return self.encode(self.service.handle(request))
+
+    @staticmethod
+    def encode(response):
+        return json.dumps(response, separators=(',', ':')).encode() + b"\n"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m parking_manager.ParkingServer",
+        description="Serve a parking lot over JSON lines"
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', metavar='PATH', help="listen on a Unix socket instead of TCP")
+    args = parser.parse_args(argv)
+
+    async def run():
+        server = ParkingServer()
+        await server.start(args.host, args.port, args.unix)
+        await server.serveForever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+import atexit
+import functools
+import os
+import sys
+import threading
+from collections import Counter
+
+# PARKING_PROFILE=<path> (or --profile PATH on main.py / python -m
+# parking_manager) profiles the run and writes the result at exit.
+# Entry points import this module unconditionally, so it imports only
+# the standard basics; cProfile, pstats and Instrumentation are loaded
+# once profiling is actually installed.
+ENV_VAR = 'PARKING_PROFILE'
+MODE_ENV_VAR = 'PARKING_PROFILE_MODE'
+MODES = ('sampling', 'cprofile')
+
+# Tk-thread handlers of the GUI, by class name
+GUI_HANDLERS = {
+    'ParkingManagerGUI': ('createLot', 'parkVehicle', 'removeVehicle', 'searchByRegNum',
+                          'searchByColor', 'showStatus'),
+    'StatusView': ('apply',),
+    'LotWorker': ('deliverResults',),
+}
+COMMAND_HANDLERS = ('create', 'park', 'leave', 'status', 'findRegNum', 'findColor',
+                    'importVehicles', 'exportVehicles')
+
+class Profiler:
+    """
+    Opt-in profiler attributing time to GUI handlers and ParkingLot calls
+
+    Wrapped methods push an operation tag, e.g. ('gui', 'parkVehicle')
+    or ('lot', 'park'), for the thread running them; the outermost tag
+    of a thread names its samples.
+
+    sampling: a background thread reads every thread's stack with
+    sys._current_frames() each intervalSeconds and counts collapsed
+    stacks, written to `path` for flamegraph.pl, speedscope or inferno.
+    Stacks are rooted at the outermost tag's category and every wrapped
+    call appears as its tag ("gui:parkVehicle", "lot:park"). Threads are
+    sampled while tagged; the main thread also when untagged (under
+    "gui;tk" with the GUI: the Tk loop drawing and dispatching events).
+
+    cprofile: every outermost tagged call runs under a per-thread
+    cProfile.Profile, and the results are written per tag category
+    ('gui', 'lot', 'cli') as `<path>.<category>.pstats` (python -m
+    pstats, snakeviz); a category's file covers all its operations.
+    """
+
+    def __init__(self, path, mode='sampling', intervalSeconds=0.005):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.intervalSeconds = intervalSeconds
+        self.untaggedMainRoot = 'main;untagged'
+        self.tags = {}               # thread ident -> stack of (category, operation)
+        self.samples = Counter()     # collapsed stack -> sample count
+        self.profiles = {}           # (thread ident, category) -> cProfile.Profile
+        self.profilesLock = threading.Lock()
+        self.patched = []
+        self.stopped = threading.Event()
+        self.sampler = None
+        self.wrapperCodes = set()    # wrapper frames left out of the stacks
+        if mode == 'cprofile':
+            import cProfile
+            self.newProfile = cProfile.Profile
+
+    # Wrapping
+    def tagged(self, category, operation, method):
+        """Wrap a method so it runs under an operation tag"""
+        tags = self.tags
+        profiling = self.mode == 'cprofile'
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            ident = threading.get_ident()
+            stack = tags.get(ident)
+            if stack is None:
+                stack = tags[ident] = []
+            outermost = not stack
+            stack.append((category, operation))
+            profile = self._startProfile(ident, category) if profiling and outermost else None
+            try:
+                return method(*args, **kwargs)
+            finally:
+                if profile is not None:
+                    profile.disable()
+                stack.pop()
+
+        self.wrapperCodes.add(wrapper.__code__)
+        return wrapper
+
+    def _startProfile(self, ident, category):
+        with self.profilesLock:
+            profile = self.profiles.get((ident, category))
+            if profile is None:
+                profile = self.profiles[(ident, category)] = self.newProfile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows one cProfile at a time: another thread has it
+            return None
+        return profile
+
+    def instrumentLot(self):
+        """Tag ParkingLot (and subclass) operations as 'lot'"""
+        from .Instrumentation import TIMED_METHODS, patchLotClasses
+
+        def wrap(cls, name, method):
+            return self.tagged('lot', name, method) if name in TIMED_METHODS else None
+        self.patched.extend(patchLotClasses(wrap))
+
+    def instrumentHandlers(self, cls, names, category):
+        """Tag methods of one class; call before instances bind them"""
+        for name in names:
+            method = cls.__dict__[name]
+            self.patched.append((cls, name, method))
+            setattr(cls, name, self.tagged(category, name, method))
+
+    def instrumentGui(self):
+        """Tag the Tk-thread handlers of the GUI as 'gui' (imports tkinter)"""
+        from . import GuiWorker, ParkingManagerGUI
+        classes = {
+            'ParkingManagerGUI': ParkingManagerGUI.ParkingManagerGUI,
+            'StatusView': ParkingManagerGUI.StatusView,
+            'LotWorker': GuiWorker.LotWorker,
+        }
+        for className, names in GUI_HANDLERS.items():
+            self.instrumentHandlers(classes[className], names, 'gui')
+        self.untaggedMainRoot = 'gui;tk'
+
+    def instrumentCommandLine(self):
+        """Tag the headless command handlers as 'cli'"""
+        from .CommandLine import CommandProcessor
+        self.instrumentHandlers(CommandProcessor, COMMAND_HANDLERS, 'cli')
+
+    # Running
+    def start(self):
+        if self.mode == 'sampling':
+            self.sampler = threading.Thread(target=self._sampleLoop, name="profile-sampler", daemon=True)
+            self.sampler.start()
+        return self
+
+    def _sampleLoop(self):
+        mainIdent = threading.main_thread().ident
+        while not self.stopped.wait(self.intervalSeconds):
+            self.sample(mainIdent)
+
+    def sample(self, mainIdent):
+        """Count one collapsed stack for every tagged thread (and the main thread)"""
+        for ident, frame in sys._current_frames().items():
+            tagStack = list(self.tags.get(ident) or ())
+            if tagStack:
+                root = tagStack[0][0]
+            elif ident == mainIdent:
+                root = self.untaggedMainRoot
+            else:
+                continue
+
+            frames = []
+            while frame is not None:
+                frames.append(frame.f_code)
+                frame = frame.f_back
+
+            # Outermost first; each wrapper frame becomes its tag, e.g. "lot:getStatus"
+            names = [root]
+            tagIndex = 0
+            for code in reversed(frames):
+                if code in self.wrapperCodes:
+                    if tagIndex < len(tagStack):
+                        category, operation = tagStack[tagIndex]
+                        names.append(f"{category}:{operation}")
+                    tagIndex += 1
+                else:
+                    names.append(
+                        f"{getattr(code, 'co_qualname', code.co_name)} "
+                        f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                    )
+            self.samples[";".join(names)] += 1
+
+    def stop(self):
+        """Stop sampling, restore the wrapped methods and write the output"""
+        if self.stopped.is_set():
+            return
+        self.stopped.set()
+        if self.sampler is not None:
+            self.sampler.join()
+        from .Instrumentation import unpatch
+        unpatch(self.patched)
+        self.patched = []
+        self.write()
+
+    def write(self):
+        if self.mode == 'sampling':
+            with open(self.path, 'w', encoding='utf-8') as f:
+                for stack, count in self.samples.most_common():
+                    f.write(f"{stack} {count}\n")
+            return
+
+        import pstats
+        byCategory = {}
+        for (_, category), profile in self.profiles.items():
+            byCategory.setdefault(category, []).append(profile)
+        for category, profiles in byCategory.items():
+            stats = pstats.Stats(profiles[0])
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(f"{self.path}.{category}.pstats")
+
+# The process-wide Profiler once installed, None otherwise
+profiler = None
+
+def install(path, mode='sampling', gui=False, commandLine=False):
+    """
+    Start profiling the process; the output is written at exit
+
+    Args:
+        path: Collapsed-stack file (sampling) or pstats prefix (cprofile)
+        mode: 'sampling' or 'cprofile'
+        gui: Also tag the GUI's Tk-thread handlers
+        commandLine: Also tag the headless command handlers
+
+    Returns:
+        The Profiler
+    """
+    global profiler
+    if profiler is None:
+        profiler = Profiler(path, mode)
+        profiler.instrumentLot()
+        if gui:
+            profiler.instrumentGui()
+        if commandLine:
+            profiler.instrumentCommandLine()
+        profiler.start()
+        atexit.register(profiler.stop)
+    return profiler
+
+def installFromArguments(path=None, mode=None, **targets):
+    """
+    install() from --profile/--profile-mode, falling back to
+    PARKING_PROFILE/PARKING_PROFILE_MODE; nothing happens without a path
+    """
+    path = path or os.environ.get(ENV_VAR)
+    if not path:
+        return None
+    return install(path, mode or os.environ.get(MODE_ENV_VAR) or 'sampling', **targets)
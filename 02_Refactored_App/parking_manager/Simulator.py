@@ -0,0 +1,293 @@
+"""
+Discrete-event simulation of a parking lot under realistic traffic
+
+Vehicles arrive as a seeded Poisson process, stay for a dwell time drawn
+from a distribution and leave; drivers look vehicles up by registration
+in between. Every event calls the real ParkingLot (park, leave,
+findByRegNum), timed into per-operation latency histograms, and the
+occupancy is sampled at a fixed simulated interval.
+
+Usage: python -m parking_manager.Simulator [--capacity N] [--ev N]
+           [--rate PER_SECOND] [--dwell SECONDS] [--hours H] [--seed S]
+           [--store list|columnar] [--json PATH]
+"""
+import argparse
+import heapq
+import json
+import math
+import random
+import sys
+import time
+
+from .ColumnarSlotStore import ColumnarSlotStore
+from .LatencyHistogram import LatencyHistogram
+from .ParkingLot import ParkingLot
+from .Vehicle import ElectricVehicle, VehicleFactory, VehicleType
+
+# Event kinds, in the order they run when they fall on the same instant
+DEPARTURE, ARRIVAL, LOOKUP, SAMPLE = range(4)
+
+DEFAULT_MIX = {
+    VehicleType.CAR: 0.75,
+    VehicleType.MOTORCYCLE: 0.10,
+    VehicleType.ELECTRIC_CAR: 0.12,
+    VehicleType.ELECTRIC_BIKE: 0.03,
+}
+COLORS = ("Red", "Blue", "White", "Black", "Silver", "Green")
+MAKES = (("Toyota", "Corolla"), ("Honda", "Civic"), ("Tesla", "Model 3"), ("Ford", "Focus"))
+
+class DwellTime:
+    """Random stay durations with a given mean (seconds)"""
+
+    DISTRIBUTIONS = ('exponential', 'lognormal', 'fixed')
+    LOGNORMAL_SIGMA = 0.75
+
+    def __init__(self, meanSeconds, distribution='lognormal'):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown dwell distribution: {distribution}")
+        self.meanSeconds = meanSeconds
+        self.distribution = distribution
+        # lognormal mean is exp(mu + sigma^2 / 2)
+        self.mu = math.log(meanSeconds) - self.LOGNORMAL_SIGMA ** 2 / 2
+
+    def sample(self, rng):
+        if self.distribution == 'exponential':
+            return rng.expovariate(1.0 / self.meanSeconds)
+        if self.distribution == 'lognormal':
+            return rng.lognormvariate(self.mu, self.LOGNORMAL_SIGMA)
+        return self.meanSeconds
+
+class SimulationReport:
+    """Results of one simulation run"""
+
+    def __init__(self, histograms):
+        self.histograms = histograms   # operation name -> LatencyHistogram
+        self.simulatedSeconds = 0.0
+        self.wallSeconds = 0.0
+        self.arrivals = 0
+        self.turnedAway = 0
+        self.occupancy = []            # (simulated seconds, regular occupied, EV occupied)
+
+    @property
+    def operations(self):
+        return sum(histogram.count for histogram in self.histograms.values())
+
+    @property
+    def throughput(self):
+        """Lot operations per wall-clock second"""
+        return self.operations / self.wallSeconds if self.wallSeconds else 0.0
+
+    def asDict(self):
+        return {
+            'simulatedSeconds': self.simulatedSeconds,
+            'wallSeconds': self.wallSeconds,
+            'operations': self.operations,
+            'throughput': self.throughput,
+            'arrivals': self.arrivals,
+            'turnedAway': self.turnedAway,
+            'latency': {name: histogram.summary() for name, histogram in self.histograms.items()},
+            'occupancy': self.occupancy,
+        }
+
+    def format(self):
+        """Human readable summary"""
+        lines = [
+            f"Simulated {self.simulatedSeconds / 3600:.1f} h in {self.wallSeconds:.2f} s: "
+            f"{self.operations} operations, {self.throughput:,.0f} ops/s",
+            f"Arrivals: {self.arrivals}, turned away (lot full): {self.turnedAway}",
+            f"{'operation':<10}{'count':>10}{'mean us':>10}{'p50 us':>10}"
+            f"{'p99 us':>10}{'max us':>10}",
+        ]
+        for name, histogram in self.histograms.items():
+            summary = histogram.summary()
+            lines.append(
+                f"{name:<10}{summary['count']:>10}{summary['mean'] * 1e6:>10.2f}"
+                f"{summary['p50'] * 1e6:>10.2f}{summary['p99'] * 1e6:>10.2f}"
+                f"{summary['max'] * 1e6:>10.2f}"
+            )
+        if self.occupancy:
+            peak = max(self.occupancy, key=lambda sample: sample[1] + sample[2])
+            lines.append(
+                f"Peak occupancy at {peak[0] / 3600:.1f} h: "
+                f"{peak[1]} regular, {peak[2]} EV"
+            )
+        return "\n".join(lines)
+
+class Simulator:
+    """
+    Discrete-event engine driving a real ParkingLot
+
+    Events live in a heap ordered by (simulated time, kind, sequence),
+    so the run is deterministic for a given seed. Electric vehicles
+    park in EV slots and fall back to regular slots when those are full.
+    """
+
+    def __init__(self, lot, arrivalRate=1.0, dwell=None, mix=None, lookupRate=0.5,
+                 sampleSeconds=300.0, seed=0):
+        """
+        Args:
+            lot: Created ParkingLot (or subclass) to drive
+            arrivalRate: Mean arrivals per simulated second (Poisson)
+            dwell: DwellTime (default lognormal with a 2 hour mean)
+            mix: VehicleType -> weight (default DEFAULT_MIX)
+            lookupRate: Mean findByRegNum calls per simulated second
+            sampleSeconds: Simulated interval between occupancy samples
+            seed: Random seed
+        """
+        self.lot = lot
+        self.arrivalRate = arrivalRate
+        self.dwell = dwell if dwell is not None else DwellTime(2 * 3600)
+        mix = mix if mix is not None else DEFAULT_MIX
+        self.vehicleTypes = list(mix)
+        self.cumulativeWeights = []
+        total = 0.0
+        for vehicleType in self.vehicleTypes:
+            total += mix[vehicleType]
+            self.cumulativeWeights.append(total)
+        self.lookupRate = lookupRate
+        self.sampleSeconds = sampleSeconds
+        self.rng = random.Random(seed)
+
+        self.queue = []
+        self.sequence = 0
+        self.vehicleNumber = 0
+        # Parked registrations, with positions for O(1) random pick/removal
+        self.parkedRegNums = []
+        self.parkedPositions = {}
+
+    def schedule(self, when, kind, payload=None):
+        self.sequence += 1
+        heapq.heappush(self.queue, (when, kind, self.sequence, payload))
+
+    def newVehicle(self):
+        vehicleType = self.rng.choices(self.vehicleTypes, cum_weights=self.cumulativeWeights)[0]
+        self.vehicleNumber += 1
+        make, model = MAKES[self.vehicleNumber % len(MAKES)]
+        return VehicleFactory.createVehicle(
+            vehicleType, f"SIM{self.vehicleNumber:08d}", make, model,
+            COLORS[self.vehicleNumber % len(COLORS)], self.rng.randrange(101)
+        )
+
+    def _track(self, regNum):
+        self.parkedPositions[regNum] = len(self.parkedRegNums)
+        self.parkedRegNums.append(regNum)
+
+    def _untrack(self, regNum):
+        position = self.parkedPositions.pop(regNum)
+        last = self.parkedRegNums.pop()
+        if last != regNum:
+            self.parkedRegNums[position] = last
+            self.parkedPositions[last] = position
+
+    def run(self, durationSeconds):
+        """
+        Simulate `durationSeconds` of traffic
+
+        Every run starts from simulated time 0 with an empty schedule.
+        Vehicles parked by an earlier run stay in the lot, so re-create
+        it first for an independent run; vehicle numbers keep counting
+        up so registrations never repeat.
+
+        Returns:
+            SimulationReport
+        """
+        histograms = {name: LatencyHistogram() for name in ('park', 'leave', 'find')}
+        report = SimulationReport(histograms)
+        parkTimes, leaveTimes, findTimes = (histograms[name] for name in ('park', 'leave', 'find'))
+        lot = self.lot
+        rng = self.rng
+        clock = time.perf_counter
+
+        self.queue = []
+        self.sequence = 0
+        self.parkedRegNums = []
+        self.parkedPositions = {}
+        self.schedule(rng.expovariate(self.arrivalRate), ARRIVAL)
+        if self.lookupRate > 0:
+            self.schedule(rng.expovariate(self.lookupRate), LOOKUP)
+        self.schedule(0.0, SAMPLE)
+
+        wallStart = clock()
+        while self.queue and self.queue[0][0] <= durationSeconds:
+            now, kind, _, payload = heapq.heappop(self.queue)
+
+            if kind == ARRIVAL:
+                report.arrivals += 1
+                vehicle = self.newVehicle()
+                isElectric = isinstance(vehicle, ElectricVehicle)
+
+                start = clock()
+                slotNumber = lot.park(vehicle, isElectric)
+                if slotNumber is None and isElectric:
+                    isElectric = False
+                    slotNumber = lot.park(vehicle, False)
+                parkTimes.record(clock() - start)
+
+                if slotNumber is None:
+                    report.turnedAway += 1
+                else:
+                    self._track(vehicle.regNum)
+                    self.schedule(now + self.dwell.sample(rng), DEPARTURE,
+                                  (vehicle.regNum, slotNumber, isElectric))
+                self.schedule(now + rng.expovariate(self.arrivalRate), ARRIVAL)
+
+            elif kind == DEPARTURE:
+                regNum, slotNumber, isElectric = payload
+                start = clock()
+                lot.leave(slotNumber, isElectric)
+                leaveTimes.record(clock() - start)
+                self._untrack(regNum)
+
+            elif kind == LOOKUP:
+                # Mostly parked vehicles, some misses (already gone)
+                if self.parkedRegNums and rng.random() < 0.9:
+                    regNum = self.parkedRegNums[rng.randrange(len(self.parkedRegNums))]
+                else:
+                    regNum = f"SIM{rng.randrange(1, self.vehicleNumber + 2):08d}"
+                start = clock()
+                lot.findByRegNum(regNum)
+                findTimes.record(clock() - start)
+                self.schedule(now + rng.expovariate(self.lookupRate), LOOKUP)
+
+            else:
+                report.occupancy.append((now, lot.numOfOccupiedSlots, lot.numOfOccupiedEvSlots))
+                self.schedule(now + self.sampleSeconds, SAMPLE)
+
+        report.wallSeconds = clock() - wallStart
+        report.simulatedSeconds = durationSeconds
+        return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m parking_manager.Simulator",
+        description="Simulate parking traffic against a ParkingLot"
+    )
+    parser.add_argument('--capacity', type=int, default=10_000, help="regular slots")
+    parser.add_argument('--ev', type=int, default=1_000, help="EV slots")
+    parser.add_argument('--rate', type=float, default=1.5, help="arrivals per simulated second")
+    parser.add_argument('--dwell', type=float, default=2 * 3600, help="mean stay in seconds")
+    parser.add_argument('--distribution', choices=DwellTime.DISTRIBUTIONS, default='lognormal')
+    parser.add_argument('--lookups', type=float, default=0.5, help="lookups per simulated second")
+    parser.add_argument('--hours', type=float, default=24.0, help="simulated hours")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--store', choices=('list', 'columnar'), default='list',
+                        help="slot storage of the simulated lot")
+    parser.add_argument('--json', metavar='PATH', help="also write the full report as JSON")
+    args = parser.parse_args(argv)
+
+    lot = ParkingLot(ColumnarSlotStore if args.store == 'columnar' else None)
+    lot.createParkingLot(args.capacity, args.ev, 1)
+    simulator = Simulator(
+        lot, args.rate, DwellTime(args.dwell, args.distribution),
+        lookupRate=args.lookups, seed=args.seed
+    )
+    report = simulator.run(args.hours * 3600)
+    print(report.format())
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report.asDict(), f, indent=2)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
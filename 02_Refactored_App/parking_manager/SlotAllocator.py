@@ -0,0 +1,87 @@
+import heapq
+
+class SlotAllocator:
+    """
+    Free-slot allocator for one pool of parking slots
+
+    IMPROVEMENT: Keeps free slot indexes in a min-heap so the lowest
+    free slot is found in O(log n) instead of scanning every slot
+    """
+
+    def __init__(self, capacity):
+        """
+        Create allocator with every slot free
+
+        Args:
+            capacity: Number of slots in the pool
+        """
+        self.capacity = capacity
+
+        # range() output is already ordered, so it is a valid min-heap
+        self._freeHeap = list(range(capacity))
+        self._isFree = bytearray(b"\x01") * capacity
+        self._freeCount = capacity
+
+    def __len__(self):
+        """Number of free slots"""
+        return self._freeCount
+
+    def _dropClaimedTop(self):
+        """Pop heap entries left behind by claim() (lazy deletion)"""
+        while self._freeHeap and not self._isFree[self._freeHeap[0]]:
+            heapq.heappop(self._freeHeap)
+
+    def peek(self):
+        """Lowest free slot index without claiming it, or None if full"""
+        self._dropClaimedTop()
+        if self._freeHeap:
+            return self._freeHeap[0]
+        return None
+
+    def allocate(self):
+        """
+        Claim the lowest free slot
+
+        Returns:
+            Slot index (0-indexed) or None if every slot is taken
+        """
+        self._dropClaimedTop()
+        if not self._freeHeap:
+            return None
+
+        slotIndex = heapq.heappop(self._freeHeap)
+        self._isFree[slotIndex] = 0
+        self._freeCount -= 1
+        return slotIndex
+
+    def claim(self, slotIndex):
+        """
+        Claim one specific slot (used when restoring a saved lot)
+
+        The slot's heap entry is left in place and skipped when it
+        reaches the top, so claiming costs O(1).
+
+        Args:
+            slotIndex: Slot index (0-indexed) to claim
+
+        Returns:
+            True if the slot was free, False if it was already taken
+        """
+        if not self._isFree[slotIndex]:
+            return False
+
+        self._isFree[slotIndex] = 0
+        self._freeCount -= 1
+        return True
+
+    def release(self, slotIndex):
+        """
+        Return a slot to the free pool
+
+        Args:
+            slotIndex: Slot index (0-indexed) to free
+        """
+        if not self._isFree[slotIndex]:
+            self._isFree[slotIndex] = 1
+            self._freeCount += 1
+            heapq.heappush(self._freeHeap, slotIndex)
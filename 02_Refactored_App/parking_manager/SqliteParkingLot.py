@@ -0,0 +1,440 @@
+import sqlite3
+from contextlib import contextmanager
+
+from .AttributeIndex import AttributeIndex
+from .ParkingEvents import ParkedBatch, LeftBatch, ChargesUpdated
+from .ParkingLot import ParkingLot
+from .SlotAllocator import SlotAllocator
+from .Vehicle import ElectricVehicle, VehicleFactory, VehicleType
+
+# One row per lot (level) and one row per parked vehicle. Several lots
+# (a whole facility) can share one database; registration numbers are
+# unique across all of them.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lots (
+    level INTEGER PRIMARY KEY,
+    capacity INTEGER NOT NULL,
+    evCapacity INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vehicles (
+    level INTEGER NOT NULL,
+    ev INTEGER NOT NULL,
+    slot INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    regNum TEXT NOT NULL UNIQUE,
+    make TEXT NOT NULL,
+    model TEXT NOT NULL,
+    color TEXT NOT NULL,
+    charge INTEGER NOT NULL,
+    colorKey TEXT NOT NULL,
+    makeKey TEXT NOT NULL,
+    modelKey TEXT NOT NULL,
+    PRIMARY KEY (level, ev, slot)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS vehiclesByColor ON vehicles (colorKey, level);
+"""
+
+VEHICLE_COLUMNS = "type, regNum, make, model, color, charge"
+
+INSERT_VEHICLE = (
+    "INSERT INTO vehicles (level, ev, slot, type, regNum, make, model, color, "
+    "charge, colorKey, makeKey, modelKey) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# find() criterion -> column holding its normalized value
+CRITERIA_COLUMNS = {
+    'color': 'colorKey',
+    'make': 'makeKey',
+    'model': 'modelKey',
+    'type': 'lower(type)',
+}
+
+def vehicleRow(level, isElectric, slotNumber, vehicle):
+    """Parameters for INSERT_VEHICLE"""
+    normalize = AttributeIndex.normalize
+    return (
+        level, int(bool(isElectric)), slotNumber, vehicle.getType(), vehicle.regNum,
+        vehicle.make, vehicle.model, vehicle.color,
+        vehicle.charge if isinstance(vehicle, ElectricVehicle) else 0,
+        normalize(vehicle.color), normalize(vehicle.make), normalize(vehicle.model)
+    )
+
+def rowVehicle(row):
+    """Rebuild a vehicle from the VEHICLE_COLUMNS of a row"""
+    vehicleType, regNum, make, model, color, charge = row
+    return VehicleFactory.createVehicle(VehicleType(vehicleType), regNum, make, model, color, charge)
+
+class SqliteSlotStore:
+    """
+    One slot pool of a level, kept in the vehicles table
+
+    Drop-in replacement for the plain list ParkingLot uses per slot pool:
+    store[i] reads one row by primary key, store[i] = vehicle inserts
+    it and store[i] = None deletes it.
+    """
+
+    def __init__(self, connection, level, isElectric, capacity):
+        self.connection = connection
+        self.level = level
+        self.isElectric = int(bool(isElectric))
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.capacity
+
+    def __getitem__(self, slotIndex):
+        """Vehicle in a slot, or None if the slot is empty"""
+        row = self.connection.execute(
+            f"SELECT {VEHICLE_COLUMNS} FROM vehicles WHERE level = ? AND ev = ? AND slot = ?",
+            (self.level, self.isElectric, slotIndex + 1)
+        ).fetchone()
+        return rowVehicle(row) if row is not None else None
+
+    def __setitem__(self, slotIndex, vehicle):
+        """Store a vehicle in a slot, or clear it with None"""
+        if vehicle is None:
+            self.connection.execute(
+                "DELETE FROM vehicles WHERE level = ? AND ev = ? AND slot = ?",
+                (self.level, self.isElectric, slotIndex + 1)
+            )
+        else:
+            self.connection.execute(
+                INSERT_VEHICLE, vehicleRow(self.level, self.isElectric, slotIndex + 1, vehicle)
+            )
+
+    def insertMany(self, slotNumbers, vehicles):
+        """Store many vehicles with one prepared statement"""
+        self.connection.executemany(INSERT_VEHICLE, (
+            vehicleRow(self.level, self.isElectric, slotNumber, vehicle)
+            for slotNumber, vehicle in zip(slotNumbers, vehicles)
+        ))
+
+    def occupiedSlots(self):
+        """Slot numbers (1-indexed) that hold a vehicle"""
+        return [slotNumber for (slotNumber,) in self.connection.execute(
+            "SELECT slot FROM vehicles WHERE level = ? AND ev = ?",
+            (self.level, self.isElectric)
+        )]
+
+    def __iter__(self):
+        occupied = {
+            row[0]: rowVehicle(row[1:])
+            for row in self.connection.execute(
+                f"SELECT slot, {VEHICLE_COLUMNS} FROM vehicles WHERE level = ? AND ev = ?",
+                (self.level, self.isElectric)
+            )
+        }
+        for slotIndex in range(self.capacity):
+            yield occupied.get(slotIndex + 1)
+
+class SqliteParkingLot(ParkingLot):
+    """
+    ParkingLot whose slots and vehicles live in SQLite
+
+    IMPROVEMENT: Persistent storage behind the ParkingLot interface
+    - WAL journal mode: readers never block the writer
+    - findByRegNum, findByColor/find and getStatus are indexed queries
+      (regNum is UNIQUE, colorKey and level are indexed)
+    - every park/leave is one transaction; parkMany inserts the whole
+      burst with executemany in a single transaction
+    - statements are parameterized, so sqlite3 reuses the prepared
+      statements from its cache
+    Free slots are still found with an in-memory SlotAllocator, rebuilt
+    from the table by load().
+
+    Like ParkingLot it expects one caller at a time (e.g. the GUI worker).
+    """
+
+    def __init__(self, path=':memory:', connection=None):
+        """
+        Args:
+            path: SQLite database file (ignored if connection is given)
+            connection: Existing connection from connect(), to keep
+                several levels in one database
+        """
+        super().__init__()
+        self.connection = connection if connection is not None else self.connect(path)
+        self.transactionDepth = 0
+
+    @staticmethod
+    def connect(path):
+        """Open a database in WAL mode and create the tables if needed"""
+        # isolation_level=None: transactions are begun explicitly below
+        connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    @contextmanager
+    def transaction(self):
+        """Group statements into one transaction (nested uses join the outer one)"""
+        if self.transactionDepth:
+            self.transactionDepth += 1
+            try:
+                yield
+            finally:
+                self.transactionDepth -= 1
+            return
+
+        self.connection.execute("BEGIN")
+        self.transactionDepth = 1
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self.connection.execute("COMMIT")
+        finally:
+            self.transactionDepth = 0
+
+    def newSlotStore(self, capacity, isElectric):
+        return SqliteSlotStore(self.connection, self.level, isElectric, capacity)
+
+    def createParkingLot(self, capacity, evCapacity, level):
+        """Create (or re-create, emptied) the lot's level in the database"""
+        with self.transaction():
+            self.connection.execute("DELETE FROM vehicles WHERE level = ?", (level,))
+            self.connection.execute(
+                "INSERT OR REPLACE INTO lots (level, capacity, evCapacity) VALUES (?, ?, ?)",
+                (level, capacity, evCapacity)
+            )
+        return super().createParkingLot(capacity, evCapacity, level)
+
+    def load(self, level):
+        """
+        Open a level that is already stored in the database
+
+        Observers are not notified: nothing changed.
+
+        Returns:
+            True if the level exists, False otherwise
+        """
+        row = self.connection.execute(
+            "SELECT capacity, evCapacity FROM lots WHERE level = ?", (level,)
+        ).fetchone()
+        if row is None:
+            return False
+
+        self.capacity, self.evCapacity = row
+        self.level = level
+        self.slots = self.newSlotStore(self.capacity, False)
+        self.evSlots = self.newSlotStore(self.evCapacity, True)
+        self.freeSlots = self.restoreAllocator(self.slots)
+        self.freeEvSlots = self.restoreAllocator(self.evSlots)
+        self.numOfOccupiedSlots = self.capacity - len(self.freeSlots)
+        self.numOfOccupiedEvSlots = self.evCapacity - len(self.freeEvSlots)
+
+        self.statusVersion += 1
+        self.statusBaseVersion = self.statusVersion
+        self.statusChanges.clear()
+        return True
+
+    @staticmethod
+    def restoreAllocator(store):
+        """Allocator with the stored occupied slots already claimed"""
+        allocator = SlotAllocator(store.capacity)
+        for slotNumber in store.occupiedSlots():
+            allocator.claim(slotNumber - 1)
+        return allocator
+
+    @staticmethod
+    def storedLevels(connection):
+        """Level numbers stored in a database, in order"""
+        return [level for (level,) in connection.execute("SELECT level FROM lots ORDER BY level")]
+
+    def isParked(self, regNum):
+        """True if the registration is parked on any level of the database"""
+        return self.connection.execute(
+            "SELECT 1 FROM vehicles WHERE regNum = ?", (regNum,)
+        ).fetchone() is not None
+
+    # ParkingLot hooks: slots and indexes are the vehicles table
+    def _placeVehicle(self, vehicle, isElectric, slotNumber=None):
+        if self.isParked(vehicle.regNum):
+            raise ValueError(f"Vehicle {vehicle.regNum} is already parked")
+        with self.transaction():
+            return super()._placeVehicle(vehicle, isElectric, slotNumber)
+
+    def _removeVehicle(self, slotNumber, isElectric):
+        with self.transaction():
+            return super()._removeVehicle(slotNumber, isElectric)
+
+    def _indexVehicle(self, vehicle, slotNumber, isElectric):
+        self._logStatusChange(slotNumber, isElectric)
+
+    def _unindexVehicle(self, vehicle, slotNumber, isElectric):
+        self._logStatusChange(slotNumber, isElectric)
+
+    def parkMany(self, vehicles, isElectric=False):
+        """
+        Park a burst of vehicles with one batch insert and one notification
+
+        Returns:
+            List of slot numbers in the same order, None where the lot was full
+
+        Raises:
+            ValueError: If any registration is already parked or repeated
+                in the batch (nothing is parked in that case)
+        """
+        vehicles = list(vehicles)
+
+        batchRegNums = set()
+        for vehicle in vehicles:
+            if vehicle.regNum in batchRegNums or self.isParked(vehicle.regNum):
+                raise ValueError(f"Vehicle {vehicle.regNum} is already parked")
+            batchRegNums.add(vehicle.regNum)
+
+        if isElectric:
+            slots, freeSlots = self.evSlots, self.freeEvSlots
+        else:
+            slots, freeSlots = self.slots, self.freeSlots
+
+        slotNumbers = []
+        for _ in vehicles:
+            slotIndex = freeSlots.allocate()
+            slotNumbers.append(slotIndex + 1 if slotIndex is not None else None)
+
+        placed = [(slotNumber, vehicle) for slotNumber, vehicle in zip(slotNumbers, vehicles)
+                  if slotNumber is not None]
+        try:
+            with self.transaction():
+                slots.insertMany([slotNumber for slotNumber, _ in placed],
+                                 [vehicle for _, vehicle in placed])
+        except BaseException:
+            for slotNumber, _ in placed:
+                freeSlots.release(slotNumber - 1)
+            raise
+
+        for slotNumber, _ in placed:
+            self._logStatusChange(slotNumber, isElectric)
+        if placed:
+            if isElectric:
+                self.slotEvId = placed[-1][0]
+                self.numOfOccupiedEvSlots += len(placed)
+            else:
+                self.slotId = placed[-1][0]
+                self.numOfOccupiedSlots += len(placed)
+
+        if vehicles and self.observers:
+            self.notifyObservers(ParkedBatch(self.level, vehicles, slotNumbers, bool(isElectric)))
+
+        return slotNumbers
+
+    def leaveMany(self, slotNumbers, isElectric=False):
+        """Clear a batch of slots in one transaction, with one notification"""
+        slotNumbers = list(slotNumbers)
+        with self.transaction():
+            removed = [self._removeVehicle(slotNumber, isElectric) for slotNumber in slotNumbers]
+
+        removedVehicles = [vehicle for vehicle in removed if vehicle is not None]
+        if slotNumbers and self.observers:
+            self.notifyObservers(LeftBatch(
+                self.level, removedVehicles,
+                [slotNumber for slotNumber, vehicle in zip(slotNumbers, removed) if vehicle is not None],
+                bool(isElectric)
+            ))
+
+        return [vehicle is not None for vehicle in removed]
+
+    def updateCharges(self, slotNumbers, charges):
+        """
+        Update many charges with one prepared UPDATE in one transaction
+
+        Like ParkingLot.updateCharges, only slots holding an electric
+        vehicle are logged and notified: the UPDATE's rowcount tells
+        which rows it changed.
+        """
+        updates = list(zip(slotNumbers, charges))
+        for _, charge in updates:
+            ElectricVehicle._validate_charge(charge)
+
+        electricTypes = (VehicleType.ELECTRIC_CAR.value, VehicleType.ELECTRIC_BIKE.value)
+        updatedSlots = []
+        updatedCharges = []
+        with self.transaction():
+            cursor = self.connection.cursor()
+            for slotNumber, charge in updates:
+                cursor.execute(
+                    "UPDATE vehicles SET charge = ? WHERE level = ? AND ev = 1 AND slot = ? "
+                    "AND type IN (?, ?)",
+                    (charge, self.level, slotNumber) + electricTypes
+                )
+                if cursor.rowcount:
+                    updatedSlots.append(slotNumber)
+                    updatedCharges.append(charge)
+        for slotNumber in updatedSlots:
+            self._logStatusChange(slotNumber, True)
+
+        if updatedSlots and self.observers:
+            self.notifyObservers(ChargesUpdated(self.level, updatedSlots, updatedCharges))
+
+    # Indexed queries
+    def findByRegNum(self, regNum):
+        """
+        Returns:
+            Tuple of (slotNumber, isElectric) or None if not found on this level
+        """
+        row = self.connection.execute(
+            "SELECT slot, ev FROM vehicles WHERE regNum = ? AND level = ?", (regNum, self.level)
+        ).fetchone()
+        return (row[0], bool(row[1])) if row is not None else None
+
+    def findByColor(self, color):
+        return self.find(color=color)
+
+    def find(self, **criteria):
+        """
+        Find vehicles on this level matching all criteria (color, make, model, type)
+
+        Returns:
+            List of tuples: (slotNumber, isElectric), regular slots first
+
+        Raises:
+            ValueError: If no criteria or an unknown criterion is given
+        """
+        if not criteria:
+            raise ValueError("At least one search criterion is required")
+
+        conditions = ["level = ?"]
+        parameters = [self.level]
+        for name, value in criteria.items():
+            if name not in CRITERIA_COLUMNS:
+                raise ValueError(f"Unknown search criterion: {name}")
+            conditions.append(f"{CRITERIA_COLUMNS[name]} = ?")
+            parameters.append(AttributeIndex.normalize(value))
+
+        rows = self.connection.execute(
+            f"SELECT slot, ev FROM vehicles WHERE {' AND '.join(conditions)} ORDER BY ev, slot",
+            parameters
+        )
+        return [(slotNumber, bool(isElectric)) for slotNumber, isElectric in rows]
+
+    def getStatus(self):
+        """Status built by one ordered query instead of a slot scan"""
+        status = {'regular': [], 'electric': []}
+        rows = self.connection.execute(
+            "SELECT ev, slot, regNum, color, make, model, charge FROM vehicles "
+            "WHERE level = ? ORDER BY ev, slot",
+            (self.level,)
+        )
+        for isElectric, slotNumber, regNum, color, make, model, charge in rows:
+            row = {
+                'slot': slotNumber,
+                'level': self.level,
+                'registration': regNum,
+                'color': color,
+                'make': make,
+                'model': model
+            }
+            if isElectric:
+                row['charge'] = charge
+                status['electric'].append(row)
+            else:
+                status['regular'].append(row)
+        return status
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
@@ -3,6 +3,9 @@ from enum import Enum
 
 # Set Vehicle an abstract class
 class Vehicle(ABC):
+    # __slots__ instead of a per-instance __dict__: far less memory per parked vehicle
+    __slots__ = ('_color', '_regNum', '_make', '_model')
+
     def __init__(self, regNum, make, model, color): # Rename regnum -> regNum
         self._validate_parameters(regNum, make, model, color)
         self._color = color
@@ -44,6 +47,8 @@ class Vehicle(ABC):
 
 # Car & Motorcycle classes inherit from Vehicle
 class Car(Vehicle):
+    __slots__ = ()
+
     def __init__(self, regNum, make, model, color):
         super().__init__(regNum, make, model, color)
 
@@ -51,6 +56,8 @@ class Car(Vehicle):
         return "Car"
 
 class Motorcycle(Vehicle):
+    __slots__ = ()
+
     def __init__(self, regNum, make, model, color):
         super().__init__(regNum, make, model, color)
 
@@ -59,6 +66,8 @@ class Motorcycle(Vehicle):
 
 # ElectricVehicle inherits from Vehicle
 class ElectricVehicle(Vehicle):
+    __slots__ = ('_charge',)
+
     def __init__(self, regNum, make, model, color, charge = 0):
         super().__init__(regNum, make, model, color)
         self._validate_charge(charge)
@@ -85,6 +94,8 @@ class ElectricVehicle(Vehicle):
 
 # ElectricCar & ElectricBike properly inherit from ElectricVehicle (anti-pattern in initial code)
 class ElectricCar(ElectricVehicle):
+    __slots__ = ()
+
     def __init__(self, regNum, make, model, color, charge = 0):
         super().__init__(regNum, make, model, color, charge)
 
@@ -92,6 +103,8 @@ class ElectricCar(ElectricVehicle):
         return "Electric Car" # Correct type return
 
 class ElectricBike(ElectricVehicle):
+    __slots__ = ()
+
     def __init__(self, regNum, make, model, color, charge = 0):
         super().__init__(regNum, make, model, color, charge)
 
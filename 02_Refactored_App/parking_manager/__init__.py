@@ -0,0 +1,7 @@
+import os
+
+# PARKING_METRICS=<file or http://host:port> times every ParkingLot call;
+# unset, the Instrumentation module is not even imported
+if os.environ.get('PARKING_METRICS'):
+    from . import Instrumentation
+    Instrumentation.installFromEnvironment()
@@ -0,0 +1,73 @@
+import json
+import os
+import threading
+
+from parking_manager.EventJournal import EventJournal
+from parking_manager.Facility import Facility
+from parking_manager.ParkingLot import ParkingObserver
+from parking_manager.Vehicle import Car
+
+class Recorder(ParkingObserver):
+    def __init__(self):
+        self.events = []
+
+    def update(self, event):
+        self.events.append(event)
+
+def openJournal(directory, **options):
+    facility = Facility()
+    journal = EventJournal(str(directory), fsync='never', groupSeconds=0, **options)
+    journal.recover(facility)
+    facility.createLevel(50, 5, 1)
+    return facility, journal
+
+def testStaleOldJournalIsNotRetriedOnEveryRecord(tmp_path, capsys):
+    facility, journal = openJournal(tmp_path, snapshotEvery=5)
+    # Left behind by a failed compaction: its level is in no snapshot, so folding it fails
+    with open(journal.oldJournalPath, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'seq': 10**6, 'op': 'leave', 'level': 99, 'slot': 1, 'ev': False}) + "\n")
+
+    compactions = []
+    startCompaction = journal._startCompaction
+
+    def countingStart():
+        compactions.append(1)
+        compactor = startCompaction()
+        compactor.join()
+        return compactor
+
+    journal._startCompaction = countingStart
+    for number in range(20):
+        facility.park(Car(f"STALE{number}", "Ford", "Ka", "Red"))
+
+    # 1 create + 20 park records: one retry per 5 records, not one per record
+    assert len(compactions) == 4
+    assert os.path.exists(journal.oldJournalPath)
+    assert "snapshot" in capsys.readouterr().err
+    journal.close()
+
+def testForeignThreadChangeIsJournaledAndDelivered(tmp_path, capsys):
+    facility, journal = openJournal(tmp_path)
+    later = Recorder()
+    facility.attachObserver(later)   # notified after the journal
+
+    errors = []
+
+    def parkElsewhere():
+        try:
+            facility.park(Car("THREAD1", "Ford", "Ka", "Red"))
+        except Exception as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=parkElsewhere)
+    worker.start()
+    worker.join()
+    journal.close()
+
+    assert not errors
+    assert [event.vehicle.regNum for event in later.events] == ["THREAD1"]
+    assert "warning" in capsys.readouterr().err
+
+    restored = Facility()
+    EventJournal(str(tmp_path)).recover(restored)
+    assert restored.findByRegNum("THREAD1") == (1, 1, False)
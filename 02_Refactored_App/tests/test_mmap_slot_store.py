@@ -0,0 +1,32 @@
+import pytest
+
+from parking_manager.MmapSlotStore import MmapSlotStore
+from parking_manager.ParkingLot import ParkingLot
+from parking_manager.Vehicle import Car
+
+def mmapLot(directory):
+    lot = ParkingLot(MmapSlotStore.factory(str(directory)))
+    lot.createParkingLot(4, 1, 1)
+    return lot
+
+def testOrdinaryLongValuesFit(tmp_path):
+    lot = mmapLot(tmp_path)
+    vehicle = Car("AB12CDE", "Mercedes-Benz", "Range Rover Sport", "Metallic Silver")
+    assert lot.park(vehicle) == 1
+    assert lot.getStatus()['regular'][0]['color'] == "Metallic Silver"
+    lot.closeSlotStores()
+
+def testOverLengthValueIsRejectedWithoutChangingTheLot(tmp_path):
+    lot = mmapLot(tmp_path)
+    tooLong = Car("LONG1", "Ford", "Ka", "x" * (MmapSlotStore.FIELD_SIZES['color'] + 1))
+
+    with pytest.raises(ValueError, match="color"):
+        lot.park(tooLong)
+    with pytest.raises(ValueError, match="color"):
+        lot.parkMany([Car("FIT1", "Ford", "Ka", "Red"), tooLong])
+
+    assert lot.numOfOccupiedSlots == 0
+    assert lot.findByRegNum("FIT1") is None
+    assert lot.getStatus()['regular'] == []
+    assert lot.park(Car("FIT1", "Ford", "Ka", "Red")) == 1
+    lot.closeSlotStores()
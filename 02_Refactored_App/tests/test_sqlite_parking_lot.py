@@ -0,0 +1,29 @@
+from parking_manager.ParkingEvents import ChargesUpdated
+from parking_manager.ParkingLot import ParkingLot, ParkingObserver
+from parking_manager.SqliteParkingLot import SqliteParkingLot
+from parking_manager.Vehicle import Car, ElectricCar
+
+class ChargeRecorder(ParkingObserver):
+    def __init__(self):
+        self.updates = []
+
+    def update(self, event):
+        if isinstance(event, ChargesUpdated):
+            self.updates.append((list(event.slotNumbers), list(event.charges)))
+
+def chargeUpdates(lot):
+    """updateCharges over an EV car, an empty EV slot, a car in an EV slot and a missing slot"""
+    lot.createParkingLot(3, 4, 1)
+    lot.park(ElectricCar("EV1", "Tesla", "Model 3", "Red", 10), True)
+    lot.park(Car("CAR1", "Ford", "Ka", "Blue"), True)
+    recorder = ChargeRecorder()
+    lot.attachObserver(recorder)
+
+    version = lot.getStatusSnapshot()[0]
+    lot.updateCharges([1, 2, 3, 4], [55, 60, 65, 70])
+    return recorder.updates, lot.getStatusChanges(version)[1]
+
+def testUpdateChargesMatchesParkingLot():
+    expected = chargeUpdates(ParkingLot())
+    assert expected[0] == [([1], [55])]
+    assert chargeUpdates(SqliteParkingLot()) == expected